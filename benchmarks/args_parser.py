@@ -0,0 +1,100 @@
+"""
+Measures the time needed to parse a command line with the default
+args parser depending on the depth of the command hierarchy
+and on the number of tokens.
+
+Every level of the hierarchy adds a sub command with a few options
+on top of the format of its parent command. Long command lines pass
+paths to a multi-valued argument, as xargs would do.
+
+Usage:
+
+    python benchmarks/args_parser.py
+"""
+import timeit
+
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.format import Argument
+from clikit.api.args.format import CommandName
+from clikit.api.args.format import Option
+from clikit.args import DefaultArgsParser
+from clikit.args import StringArgs
+
+
+DEPTHS = [1, 5, 10, 20]
+TOKENS = [1000, 10000, 100000]
+OPTIONS = 5
+NUMBER = 200
+REPEAT = 5
+
+
+def create_format(depth):
+    fmt = ArgsFormat(
+        [Option("verbose", "v"), Option("quiet", "q"), Option("ansi"), Option("help")]
+    )
+
+    for level in range(depth):
+        elements = [CommandName("level{}".format(level))]
+
+        for i in range(OPTIONS):
+            elements.append(
+                Option("option{}-{}".format(level, i), None, Option.OPTIONAL_VALUE)
+            )
+
+        if level == depth - 1:
+            elements.append(Argument("paths", Argument.MULTI_VALUED))
+
+        fmt = ArgsFormat(elements, fmt)
+
+    return fmt
+
+
+def create_args(depth):
+    tokens = ["level{}".format(level) for level in range(depth)]
+
+    for level in range(depth):
+        tokens.append("--option{}-0=value".format(level))
+
+    tokens += ["-v", "a", "b", "c"]
+
+    return StringArgs(" ".join(tokens))
+
+
+def measure(fmt, args, number):
+    timer = timeit.Timer(lambda: DefaultArgsParser().parse(args, fmt))
+
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def main():
+    print("{:>6} {:>10} {:>14}".format("depth", "tokens", "parse"))
+
+    for depth in DEPTHS:
+        fmt = create_format(depth)
+        args = create_args(depth)
+
+        print(
+            "{:>6} {:>10} {:>11.1f} us".format(
+                depth, len(args.tokens), measure(fmt, args, NUMBER) * 1000000
+            )
+        )
+
+    print("")
+    print("{:>6} {:>10} {:>14}".format("depth", "tokens", "parse"))
+
+    fmt = create_format(2)
+    for count in TOKENS:
+        args = StringArgs("")
+        args.tokens[:] = ["level0", "level1", "-v"] + [
+            "path/to/file{}".format(i) for i in range(count)
+        ]
+
+        print(
+            "{:>6} {:>10} {:>11.2f} ms".format(
+                2, len(args.tokens), measure(fmt, args, 1) * 1000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
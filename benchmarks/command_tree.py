@@ -0,0 +1,98 @@
+"""
+Measures the time needed to boot a ConsoleApplication depending on
+the size of its command tree, with and without lazy command loading.
+
+Usage:
+
+    python benchmarks/command_tree.py
+"""
+import timeit
+
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import ApplicationConfig
+from clikit.api.config import CommandConfig
+from clikit.args import StringArgs
+from clikit.console_application import ConsoleApplication
+from clikit.resolver import DefaultResolver
+
+
+SIZES = [10, 100, 1000]
+SUB_COMMANDS = 5
+REPEAT = 5
+
+
+class BenchmarkApplicationConfig(ApplicationConfig):
+    def __init__(self, size, lazy):
+        self._size = size
+        self._lazy = lazy
+
+        super(BenchmarkApplicationConfig, self).__init__("bench")
+
+    def configure(self):
+        self.set_catch_exceptions(False)
+        self.set_terminate_after_run(False)
+
+        if self._lazy:
+            self.enable_lazy_command_loading()
+
+        for i in range(self._size):
+            command = CommandConfig("command{}".format(i))
+            command.add_alias("alias{}".format(i))
+            command.add_option("option", "o", Option.REQUIRED_VALUE)
+
+            for j in range(SUB_COMMANDS):
+                sub_command = command.create_sub_command("sub{}".format(j))
+                sub_command.add_argument("path", Argument.MULTI_VALUED)
+                sub_command.add_option("force", "f")
+
+            self.add_command_config(command)
+
+    @property
+    def default_command_resolver(self):
+        return DefaultResolver()
+
+
+def boot(config):
+    return ConsoleApplication(config)
+
+
+def boot_and_resolve(config):
+    application = boot(config)
+
+    return application.resolve_command(StringArgs("command0 sub0 foo -f"))
+
+
+def measure(func, size, lazy):
+    # The configuration is built once: only the application boot is timed
+    config = BenchmarkApplicationConfig(size, lazy)
+    timer = timeit.Timer(lambda: func(config))
+
+    return min(timer.repeat(REPEAT, 1)) * 1000
+
+
+def main():
+    print(
+        "{:>8} {:>14} {:>14} {:>18} {:>18}".format(
+            "commands",
+            "eager boot",
+            "lazy boot",
+            "eager boot+resolve",
+            "lazy boot+resolve",
+        )
+    )
+
+    for size in SIZES:
+        print(
+            "{:>8} {:>11.2f} ms {:>11.2f} ms {:>15.2f} ms {:>15.2f} ms".format(
+                size,
+                measure(boot, size, False),
+                measure(boot, size, True),
+                measure(boot_and_resolve, size, False),
+                measure(boot_and_resolve, size, True),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
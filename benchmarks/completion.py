@@ -0,0 +1,125 @@
+"""
+Measures the latency of a completion request (one TAB keystroke)
+depending on the size of the command tree.
+
+It compares answering from the completion index in a fresh interpreter,
+as the shell scripts do, with building the whole application
+in a fresh interpreter. The time spent answering from an already loaded
+index is shown as well.
+
+Usage:
+
+    python benchmarks/completion.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import CommandConfig
+from clikit.completion import CompletionIndex
+from clikit.config import DefaultApplicationConfig
+
+
+SIZES = [100, 1000, 10000]
+SUB_COMMANDS = 3
+REPEAT = 5
+
+WORDS = ["command5", "sub1", "--f"]
+
+APPLICATION = """
+import sys
+sys.path.insert(0, {benchmarks!r})
+
+from completion import create_config
+from clikit.console_application import ConsoleApplication
+
+ConsoleApplication(create_config({size}))
+"""
+
+
+def create_config(size):
+    config = DefaultApplicationConfig("bench")
+
+    for i in range(size):
+        command = CommandConfig("command{}".format(i))
+        command.set_description("Description of command {}".format(i))
+        command.add_alias("alias{}".format(i))
+        command.add_option("option", "o", Option.REQUIRED_VALUE)
+
+        for j in range(SUB_COMMANDS):
+            sub_command = command.create_sub_command("sub{}".format(j))
+            sub_command.add_argument("path", Argument.MULTI_VALUED)
+            sub_command.add_option("force", "f")
+
+        config.add_command_config(command)
+
+    return config
+
+
+def run(command, env):
+    timings = []
+    with open(os.devnull, "w") as devnull:
+        for _ in range(REPEAT):
+            timer = timeit.default_timer()
+            subprocess.check_call(command, stdout=devnull, env=env)
+            timings.append(timeit.default_timer() - timer)
+
+    return min(timings) * 1000
+
+
+def main():
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    env["PYTHONPATH"] = os.path.abspath(src)
+
+    directory = tempfile.mkdtemp()
+
+    print(
+        "{:>8} {:>12} {:>14} {:>14}".format(
+            "commands", "index size", "application", "index"
+        )
+    )
+
+    for size in SIZES:
+        index_path = os.path.join(directory, "{}.json".format(size))
+        CompletionIndex.from_config(create_config(size)).dump(index_path)
+
+        application = run(
+            [
+                sys.executable,
+                "-c",
+                APPLICATION.format(
+                    benchmarks=os.path.dirname(os.path.abspath(__file__)), size=size
+                ),
+            ],
+            env,
+        )
+        index = run(
+            [sys.executable, "-m", "clikit.completion", index_path, "bash"] + WORDS,
+            env,
+        )
+        in_process = min(
+            timeit.repeat(
+                lambda: CompletionIndex.load(index_path).complete(WORDS),
+                number=1,
+                repeat=REPEAT,
+            )
+        )
+
+        print(
+            "{:>8} {:>9} kB {:>11.2f} ms {:>11.2f} ms (in process: {:.2f} ms)".format(
+                size,
+                os.path.getsize(index_path) // 1024,
+                application,
+                index,
+                in_process * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
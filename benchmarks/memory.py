@@ -0,0 +1,105 @@
+"""
+Measures the memory held by a ConsoleApplication with a large command tree
+and by parsed console arguments, with tracemalloc.
+
+Usage:
+
+    python benchmarks/memory.py
+"""
+import gc
+import tracemalloc
+
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import ApplicationConfig
+from clikit.api.config import CommandConfig
+from clikit.args import StringArgs
+from clikit.console_application import ConsoleApplication
+from clikit.resolver import DefaultResolver
+
+
+COMMANDS = 10000
+SUB_COMMANDS = 2
+PARSED_ARGS = 10000
+
+
+class BenchmarkApplicationConfig(ApplicationConfig):
+    def configure(self):
+        self.set_catch_exceptions(False)
+        self.set_terminate_after_run(False)
+
+        for i in range(COMMANDS):
+            command = CommandConfig("command{}".format(i))
+            command.add_alias("alias{}".format(i))
+            command.add_argument("name", Argument.OPTIONAL)
+            command.add_option("option", "o", Option.REQUIRED_VALUE)
+            command.add_option("dry-run")
+
+            for j in range(SUB_COMMANDS):
+                sub_command = command.create_sub_command("sub{}".format(j))
+                sub_command.add_argument("path", Argument.MULTI_VALUED)
+                sub_command.add_option("force", "f")
+
+            self.add_command_config(command)
+
+    @property
+    def default_command_resolver(self):
+        return DefaultResolver()
+
+
+def measure(func):
+    """
+    Returns the result of the function and the memory it still holds
+    when it returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    result = func()
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, after - before
+
+
+def main():
+    config, config_size = measure(lambda: BenchmarkApplicationConfig("bench"))
+    application, application_size = measure(lambda: ConsoleApplication(config))
+
+    commands = COMMANDS * (1 + SUB_COMMANDS)
+    print("{} commands".format(commands))
+    print(
+        "{:>16} {:>10.2f} MB {:>10.0f} B/command".format(
+            "configuration", config_size / 1e6, config_size / commands
+        )
+    )
+    print(
+        "{:>16} {:>10.2f} MB {:>10.0f} B/command".format(
+            "application", application_size / 1e6, application_size / commands
+        )
+    )
+
+    def parse():
+        return [
+            application.resolve_command(
+                StringArgs("command{} sub0 foo bar -f".format(i % COMMANDS))
+            ).args
+            for i in range(PARSED_ARGS)
+        ]
+
+    # Parse once to compile the formats, then measure the arguments only
+    parse()
+    _, args_size = measure(parse)
+
+    print(
+        "{:>16} {:>10.2f} MB {:>10.0f} B/args".format(
+            "parsed args", args_size / 1e6, args_size / PARSED_ARGS
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compares the latency of a cold invocation (a new interpreter importing
+and configuring the application) with a warm one (a minimal client asking
+a pre-forked application server to run the command).
+
+Usage:
+
+    python benchmarks/server.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+REPEAT = 20
+
+APPLICATION = """
+import sys
+
+from clikit import ConsoleApplication
+from clikit import DefaultApplicationConfig
+
+
+class Handler(object):
+    def handle(self, args, io, command):
+        io.write_line("Hello")
+
+        return 0
+
+
+config = DefaultApplicationConfig("bench", "1.0")
+for i in range(100):
+    with config.command("command{}".format(i)) as c:
+        c.add_option("option", "o")
+        c.set_handler(Handler)
+
+application = ConsoleApplication(config)
+"""
+
+COLD = (
+    APPLICATION
+    + """
+application.run()
+"""
+)
+
+SERVER = (
+    APPLICATION
+    + """
+from clikit.server import ApplicationServer
+
+ApplicationServer(application, sys.argv[1]).serve_forever()
+"""
+)
+
+
+def measure(command, env):
+    timings = []
+    with open(os.devnull, "w") as devnull:
+        for _ in range(REPEAT):
+            start = time.time()
+            subprocess.check_call(command, stdout=devnull, env=env)
+            timings.append(time.time() - start)
+
+    return min(timings) * 1000, sorted(timings)[len(timings) // 2] * 1000
+
+
+def main():
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+    env["PYTHONPATH"] = os.path.abspath(src)
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    server = subprocess.Popen([sys.executable, "-c", SERVER, socket_path], env=env)
+
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+
+        cold = measure([sys.executable, "-c", COLD, "command0"], env)
+        warm = measure(
+            [
+                sys.executable,
+                "-m",
+                "clikit.server.application_client",
+                socket_path,
+                "command0",
+            ],
+            env,
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    print("{:>6} {:>10} {:>10}".format("", "min", "median"))
+    print("{:>6} {:>7.2f} ms {:>7.2f} ms".format("cold", *cold))
+    print("{:>6} {:>7.2f} ms {:>7.2f} ms".format("warm", *warm))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Measures the startup time of synthetic applications of increasing size,
+from "import clikit" to Command.handle().
+
+Every sample runs in a fresh interpreter and times each phase separately:
+
+- import: importing clikit and the modules needed to run an application
+- configure: building the application configuration
+- construct: creating the ConsoleApplication
+- resolve: resolving the command line to a command (including the parsing
+  done by the resolver)
+- parse: parsing the command line again with the resolved command
+- handle: running the handler of the command
+
+The medians are written to a JSON report which can be compared
+to a previous report used as a baseline.
+
+Usage:
+
+    python benchmarks/startup.py [--sizes 10,100] [--output report.json]
+    python benchmarks/startup.py --baseline baseline.json [--tolerance 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+
+SIZES = [10, 100, 1000, 10000]
+MODES = ["eager", "lazy"]
+PHASES = ["import", "configure", "construct", "resolve", "parse", "handle"]
+REPEAT = 5
+SUB_COMMANDS = 3
+
+# Differences below this many milliseconds are considered noise
+NOISE_FLOOR = 1.0
+
+ARGS = "command{} sub1 foo bar --force --option value -v"
+
+
+def run_worker(size, lazy):
+    """
+    Runs all the phases for one application and prints their timings.
+    """
+    timings = {}
+
+    start = time.time()
+
+    from clikit.api.args.format import Argument
+    from clikit.api.args.format import Option
+    from clikit.api.config import CommandConfig
+    from clikit.args import StringArgs
+    from clikit.config import DefaultApplicationConfig
+    from clikit.console_application import ConsoleApplication
+    from clikit.io import NullIO
+
+    timings["import"] = time.time() - start
+
+    class Handler(object):
+        def handle(self, args, io, command):
+            return 0
+
+    start = time.time()
+
+    config = DefaultApplicationConfig("bench", "1.0")
+    config.set_catch_exceptions(False)
+    config.set_terminate_after_run(False)
+
+    if lazy:
+        config.enable_lazy_command_loading()
+
+    handler = Handler()
+    for i in range(size):
+        command = CommandConfig("command{}".format(i))
+        command.add_alias("alias{}".format(i))
+        command.add_option("option", "o", Option.REQUIRED_VALUE)
+        command.set_handler(handler)
+
+        for j in range(SUB_COMMANDS):
+            sub_command = command.create_sub_command("sub{}".format(j))
+            sub_command.add_argument("path", Argument.MULTI_VALUED)
+            sub_command.add_option("force", "f")
+            sub_command.set_handler(handler)
+
+        config.add_command_config(command)
+
+    timings["configure"] = time.time() - start
+
+    start = time.time()
+    application = ConsoleApplication(config)
+    timings["construct"] = time.time() - start
+
+    args = StringArgs(ARGS.format(size // 2))
+
+    start = time.time()
+    resolved_command = application.resolve_command(args)
+    timings["resolve"] = time.time() - start
+
+    command = resolved_command.command
+
+    start = time.time()
+    parsed_args = command.parse(args)
+    timings["parse"] = time.time() - start
+
+    start = time.time()
+    command.handle(parsed_args, NullIO())
+    timings["handle"] = time.time() - start
+
+    print(json.dumps({phase: timing * 1000 for phase, timing in timings.items()}))
+
+
+def sample(size, mode):
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.abspath(src)] + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+
+    output = subprocess.check_output(
+        [sys.executable, __file__, "--worker", str(size), mode], env=env
+    )
+
+    return json.loads(output.decode())
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+
+    if len(values) % 2:
+        return values[middle]
+
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def measure(sizes, repeat):
+    results = {}
+
+    for mode in MODES:
+        results[mode] = {}
+
+        for size in sizes:
+            samples = [sample(size, mode) for _ in range(repeat)]
+            results[mode][str(size)] = {
+                phase: round(median([s[phase] for s in samples]), 3) for phase in PHASES
+            }
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_report(report, baseline=None):
+    header = "{:>6} {:>6}".format("mode", "size") + "".join(
+        "{:>16}".format(phase) for phase in PHASES
+    )
+    print(header)
+
+    for mode, sizes in sorted(report["results"].items()):
+        for size, timings in sorted(sizes.items(), key=lambda item: int(item[0])):
+            line = "{:>6} {:>6}".format(mode, size)
+
+            for phase in PHASES:
+                cell = "{:.2f}".format(timings[phase])
+
+                reference = get_reference(baseline, mode, size, phase)
+                if reference:
+                    cell += " ({:+.0f}%)".format(
+                        (timings[phase] - reference) / reference * 100
+                    )
+
+                line += "{:>16}".format(cell)
+
+            print(line)
+
+
+def get_reference(baseline, mode, size, phase):
+    if baseline is None:
+        return
+
+    return baseline["results"].get(mode, {}).get(size, {}).get(phase)
+
+
+def find_regressions(report, baseline, tolerance):
+    regressions = []
+
+    for mode, sizes in report["results"].items():
+        for size, timings in sizes.items():
+            for phase, timing in timings.items():
+                reference = get_reference(baseline, mode, size, phase)
+                if reference is None:
+                    continue
+
+                if (
+                    timing > reference * (1 + tolerance)
+                    and timing - reference > NOISE_FLOOR
+                ):
+                    regressions.append((mode, size, phase, reference, timing))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the startup time.")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma separated numbers of commands",
+    )
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="where to write the JSON report")
+    parser.add_argument("--baseline", help="a JSON report to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="the slowdown ratio above which a phase is a regression",
+    )
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+
+    options = parser.parse_args()
+
+    if options.worker:
+        size, mode = options.worker
+        run_worker(int(size), mode == "lazy")
+
+        return
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    report = measure(sizes, options.repeat)
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if baseline is not None:
+        regressions = find_regressions(report, baseline, options.tolerance)
+        for mode, size, phase, reference, timing in regressions:
+            print(
+                "Regression: {} {} commands {}: {:.2f} ms -> {:.2f} ms".format(
+                    mode, size, phase, reference, timing
+                )
+            )
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
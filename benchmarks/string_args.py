@@ -0,0 +1,66 @@
+"""
+Measures the time needed to split command strings of a few megabytes
+into tokens with StringArgs.
+
+The plain strings only contain options and paths separated by spaces.
+The quoted strings quote or escape every other token, as generated
+command lines often do.
+
+Usage:
+
+    python benchmarks/string_args.py
+"""
+import timeit
+
+from clikit.args import StringArgs
+
+
+SIZES = [1, 4, 16]  # megabytes
+REPEAT = 3
+
+
+def create_string(size, quoted):
+    tokens = []
+    length = 0
+    i = 0
+
+    while length < size * 1024 * 1024:
+        if not quoted or i % 2:
+            token = "--option{}=path/to/file{}".format(i % 10, i)
+        elif i % 4:
+            token = "'path to/file {}'".format(i)
+        else:
+            token = '"path \\"{}\\""'.format(i)
+
+        tokens.append(token)
+        length += len(token) + 1
+        i += 1
+
+    return " ".join(tokens)
+
+
+def measure(string):
+    timer = timeit.Timer(lambda: StringArgs(string))
+
+    return min(timer.repeat(REPEAT, 1))
+
+
+def main():
+    print("{:>8} {:>6} {:>10} {:>12}".format("kind", "MB", "tokens", "tokenize"))
+
+    for quoted in (False, True):
+        for size in SIZES:
+            string = create_string(size, quoted)
+
+            print(
+                "{:>8} {:>6} {:>10} {:>9.1f} ms".format(
+                    "quoted" if quoted else "plain",
+                    size,
+                    len(StringArgs(string).tokens),
+                    measure(string) * 1000,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
-from .api.config.application_config import ApplicationConfig
-from .config.default_application_config import DefaultApplicationConfig
-from .console_application import ConsoleApplication
+from typing import TYPE_CHECKING
+
+from .utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .api.config.application_config import ApplicationConfig  # noqa
+    from .config.default_application_config import DefaultApplicationConfig  # noqa
+    from .console_application import ConsoleApplication  # noqa
 
 
 __version__ = "0.6.2"
+
+
+lazy_attributes(
+    globals(),
+    {
+        "ApplicationConfig": ".api.config.application_config",
+        "DefaultApplicationConfig": ".config.default_application_config",
+        "ConsoleApplication": ".console_application",
+    },
+)
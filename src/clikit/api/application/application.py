@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Optional
 
 from clikit.api.args.format.args_format import ArgsFormat
 from clikit.api.args.raw_args import RawArgs
@@ -10,6 +11,8 @@ from clikit.api.resolver.resolved_command import ResolvedCommand
 
 
 if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop  # noqa
+
     from clikit.api.command.command import Command
 
 
@@ -60,3 +63,7 @@ class Application:
         self, args=None, input_stream=None, output_stream=None, error_stream=None
     ):  # type: (RawArgs, InputStream, OutputStream, OutputStream) -> int
         raise NotImplementedError()
+
+    @property
+    def event_loop(self):  # type: () -> Optional[AbstractEventLoop]
+        raise NotImplementedError()
@@ -1,3 +1,4 @@
 from .args import Args
 from .args_parser import ArgsParser
+from .global_flags import GlobalFlags
 from .raw_args import RawArgs
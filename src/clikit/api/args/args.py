@@ -1,22 +1,42 @@
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
+from clikit.utils._compat import collections_abc
+
 from .format.args_format import ArgsFormat
 from .raw_args import RawArgs
 
 
+if TYPE_CHECKING:
+    from .args_values import ArgsValues  # noqa
+    from .format.argument import Argument  # noqa
+    from .format.option import Option  # noqa
+
+
 class Args(object):
     """
     The parsed console arguments.
     """
 
+    __slots__ = (
+        "_fmt",
+        "_raw_args",
+        "_options",
+        "_arguments",
+        "_values",
+    )
+
     def __init__(self, fmt, raw_args=None):  # type: (ArgsFormat, RawArgs) -> None
         self._fmt = fmt
         self._raw_args = raw_args
+        # The converted values, by long option name and argument name
         self._options = {}
         self._arguments = {}
+        self._values = None  # type: Optional[ArgsValues]
 
     @property
     def format(self):  # type: () -> ArgsFormat
@@ -41,9 +61,10 @@ class Args(object):
 
     def option(self, name):
         option = self._fmt.get_option(name)
+        name = option.long_name
 
-        if option.long_name in self._options:
-            return self._options[option.long_name]
+        if name in self._options:
+            return self._options[name]
 
         if option.accepts_value():
             return option.default
@@ -51,41 +72,37 @@ class Args(object):
         return False
 
     def options(self, include_defaults=True):
-        options = self._options.copy()
-
+        options = {}
         if include_defaults:
-            for option in self._fmt.get_options().values():
-                name = option.long_name
-
-                if name not in options:
-                    default = False
-                    if option.accepts_value():
-                        default = option.default
+            options.update(self._fmt.compiled.option_defaults)
 
-                    options[name] = default
+        options.update(self._options)
 
         return options
 
     def set_option(self, name, value=True):
         option = self._fmt.get_option(name)
+        name = option.long_name
+
+        if self._values is not None:
+            self._values._forget(name)
 
         if option.is_multi_valued():
             if not isinstance(value, list):
                 value = [value]
 
-            for i, v in enumerate(value):
-                value[i] = option.parse(v)
+            value = [option.parse(v) for v in value]
         elif option.accepts_value():
             value = option.parse(value)
         elif value is False:
-            if option.long_name in self._options:
-                del self._options[option.long_name]
+            if name in self._options:
+                del self._options[name]
 
             return self
         else:
             value = True
 
-        self._options[option.long_name] = value
+        self._options[name] = value
 
         return self
 
@@ -97,38 +114,41 @@ class Args(object):
 
     def argument(self, name):  # type: (Union[str, int]) -> Any
         argument = self._fmt.get_argument(name)
+        name = argument.name
 
-        if argument.name in self._arguments:
+        if name in self._arguments:
             return self._arguments[name]
 
         return argument.default
 
     def arguments(self, include_defaults=True):  # type: (bool) -> Dict[str, Any]
         arguments = {}
+        if include_defaults:
+            arguments.update(self._fmt.compiled.argument_defaults)
 
-        for argument in self._fmt.get_arguments().values():
-            name = argument.name
-
-            if name in self._arguments:
-                arguments[name] = self._arguments[name]
-            elif include_defaults:
-                arguments[name] = argument.default
+        arguments.update(self._arguments)
 
         return arguments
 
     def set_argument(self, name, value):  # type: (Union[str, int], Any) -> Args
         argument = self._fmt.get_argument(name)
+        name = argument.name
+
+        if self._values is not None:
+            self._values._forget(name)
 
-        if argument.is_multi_valued():
+        if not argument.is_multi_valued():
+            value = argument.parse(value)
+        elif isinstance(value, collections_abc.Iterator):
+            # Streamed values are converted as they are consumed
+            value = _parse_values(argument, value)
+        else:
             if not isinstance(value, list):
                 value = [value]
 
-            for i, v in enumerate(value):
-                value[i] = argument.parse(v)
-        else:
-            value = argument.parse(value)
+            value = [argument.parse(v) for v in value]
 
-        self._arguments[argument.name] = value
+        self._arguments[name] = value
 
         return self
 
@@ -137,3 +157,40 @@ class Args(object):
 
     def is_argument_defined(self, name):  # type: (Union[str, int]) -> bool
         return self._fmt.has_argument(name)
+
+    @property
+    def values(self):  # type: () -> ArgsValues
+        """
+        The values of the arguments and options as attributes.
+        """
+        if self._values is None:
+            from .args_values import ArgsValues
+
+            self._values = ArgsValues(self)
+
+        return self._values
+
+    def copy(self, raw_args=None):  # type: (Optional[RawArgs]) -> Args
+        """
+        Returns a copy of the parsed arguments without parsing them again.
+
+        Multi-valued arguments and options are copied so that modifying
+        the copy leaves the original untouched.
+        """
+        args = Args(self._fmt, raw_args or self._raw_args)
+        args._options = _copy_values(self._options)
+        args._arguments = _copy_values(self._arguments)
+
+        return args
+
+
+def _parse_values(argument, values):  # type: (Argument, Iterator[str]) -> Iterator[Any]
+    for value in values:
+        yield argument.parse(value)
+
+
+def _copy_values(values):  # type: (Dict[str, Any]) -> Dict[str, Any]
+    return {
+        name: list(value) if isinstance(value, list) else value
+        for name, value in values.items()
+    }
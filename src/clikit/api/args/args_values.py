@@ -0,0 +1,48 @@
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from .args import Args  # noqa
+
+
+class ArgsValues(object):
+    """
+    The values of parsed arguments and options as attributes.
+
+    The attributes are named after the arguments and the long names of
+    the options, with hyphens replaced by underscores. An argument hides
+    an option of the same name.
+
+    The values were converted when they were set on Args. A value is
+    looked up on first access and then stored as a plain attribute, so
+    later reads cost an attribute lookup. Only the values streamed to an
+    argument are converted as they are consumed.
+    """
+
+    def __init__(self, args):  # type: (Args) -> None
+        self.__dict__["_args_"] = args
+
+    def __getattr__(self, name):  # type: (str) -> Any
+        args = self.__dict__["_args_"]
+        accessor = args.format.compiled.accessors.get(name)
+        if accessor is None:
+            raise AttributeError(
+                '"{}" is neither an argument nor an option.'.format(name)
+            )
+
+        is_argument, real_name = accessor
+        if is_argument:
+            value = args.argument(real_name)
+        else:
+            value = args.option(real_name)
+
+        self.__dict__[name] = value
+
+        return value
+
+    def __setattr__(self, name, value):  # type: (str, Any) -> None
+        raise AttributeError("The values are read-only, use Args to change them.")
+
+    def _forget(self, name):  # type: (str) -> None
+        self.__dict__.pop(name.replace("-", "_"), None)
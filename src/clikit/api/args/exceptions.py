@@ -12,13 +12,33 @@ class CannotAddOptionException(RuntimeError):
 
 
 class NoSuchOptionException(RuntimeError, CliKitException):
-    def __init__(self, name):
+    def __init__(self, name, suggested_names=None):
         message = 'The "{}{}" option does not exist.'.format(
             "--" if len(name) > 1 else "-", name
         )
 
+        if suggested_names:
+            if len(suggested_names) == 1:
+                message += "\n\nDid you mean this?\n    "
+            else:
+                message += "\n\nDid you mean one of these?\n    "
+
+            message += "\n    ".join("--" + name for name in suggested_names)
+
         super(NoSuchOptionException, self).__init__(message)
 
+    @classmethod
+    def name_not_found(cls, name, fmt):
+        """
+        Creates the exception for an option missing from a format,
+        suggesting the options of the format with a similar long name.
+        """
+        suggested_names = None
+        if len(name) > 1:
+            suggested_names = fmt.compiled.option_suggestion_index.suggest(name)
+
+        return cls(name, suggested_names)
+
 
 class CannotAddArgumentException(RuntimeError):
     @classmethod
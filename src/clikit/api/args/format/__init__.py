@@ -3,4 +3,5 @@ from .args_format_builder import ArgsFormatBuilder
 from .argument import Argument
 from .command_name import CommandName
 from .command_option import CommandOption
+from .compiled_args_format import CompiledArgsFormat
 from .option import Option
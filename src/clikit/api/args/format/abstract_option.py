@@ -13,6 +13,8 @@ class AbstractOption(object):
     PREFER_LONG_NAME = 1
     PREFER_SHORT_NAME = 2
 
+    __slots__ = ("_long_name", "_short_name", "_description", "_flags")
+
     def __init__(
         self, long_name, short_name=None, flags=0, description=None
     ):  # type: (str, Optional[str], int, Optional[str]) -> None
@@ -9,14 +9,32 @@ from ..exceptions import NoSuchOptionException
 from .argument import Argument
 from .command_name import CommandName
 from .command_option import CommandOption
+from .compiled_args_format import CompiledArgsFormat
 from .option import Option
 
 
 class ArgsFormat(object):
     """
     The format used to parse a RawArgs instance.
+
+    A format cannot be modified once created. Lookups including the base
+    formats are answered from flattened tables compiled on first use.
     """
 
+    __slots__ = (
+        "_base_format",
+        "_command_names",
+        "_command_options",
+        "_command_options_by_short_name",
+        "_arguments",
+        "_options",
+        "_options_by_short_name",
+        "_has_multi_valued_arg",
+        "_hash_optional_arg",
+        "_compiled",
+        "__weakref__",
+    )
+
     def __init__(
         self, elements=None, base_format=None
     ):  # type: (Optional[Union[List[Any], ArgsFormatBuilder]], Optional[ArgsFormat])
@@ -39,13 +57,10 @@ class ArgsFormat(object):
         self._command_options_by_short_name = {}
         self._arguments = builder.get_arguments(False)
         self._options = builder.get_options(False)
-        self._options_by_short_name = {}
+        self._options_by_short_name = builder._options_by_short_name.copy()
         self._has_multi_valued_arg = builder.has_multi_valued_argument(False)
         self._hash_optional_arg = builder.has_optional_argument(False)
-
-        for option in self._options.values():
-            if option.short_name:
-                self._options_by_short_name[option.short_name] = option
+        self._compiled = None  # type: Optional[CompiledArgsFormat]
 
         for command_option in builder.get_command_options():
             self._command_options[command_option.long_name] = command_option
@@ -65,121 +80,117 @@ class ArgsFormat(object):
     def base_format(self):  # type: () -> ArgsFormat
         return self._base_format
 
-    def has_command_names(self, include_base=True):  # type: (bool) -> bool
-        if self._command_names:
-            return True
+    @property
+    def compiled(self):  # type: () -> CompiledArgsFormat
+        """
+        Returns the flattened lookup tables of this format and its base formats.
+        """
+        if self._compiled is None:
+            base = self._base_format.compiled if self._base_format else None
 
-        if include_base and self._base_format:
-            return self._base_format.has_command_names()
+            self._compiled = CompiledArgsFormat(self, base)
 
-        return False
+        return self._compiled
 
-    def get_command_names(self, include_base=True):  # type: (bool) -> List[CommandName]
-        command_names = self._command_names
+    def has_command_names(self, include_base=True):  # type: (bool) -> bool
+        if include_base:
+            return bool(self.compiled.command_names)
+
+        return bool(self._command_names)
 
+    def get_command_names(self, include_base=True):  # type: (bool) -> List[CommandName]
         if include_base and self._base_format:
-            command_names = self._base_format.get_command_names() + command_names
+            return list(self.compiled.command_names)
 
-        return command_names
+        return self._command_names
 
     def has_command_option(self, name, include_base=True):  # type: (str, bool) -> bool
-        if name in self._command_options or name in self._command_options_by_short_name:
-            return True
+        if include_base:
+            return name in self.compiled.command_options
 
-        if include_base and self._base_format:
-            return self._base_format.has_command_option(name)
-
-        return False
+        return (
+            name in self._command_options or name in self._command_options_by_short_name
+        )
 
     def has_command_options(self, include_base=True):  # type: (bool) -> bool
-        if self._command_options:
-            return True
-
-        if include_base and self._base_format:
-            return self._base_format.has_command_options()
+        if include_base:
+            return bool(self.compiled.command_options)
 
-        return False
+        return bool(self._command_options)
 
     def get_command_option(
         self, name, include_base=True
     ):  # type: (str, bool) -> CommandOption
-        if name in self._command_options:
+        if include_base:
+            command_options = self.compiled.command_options
+            if name in command_options:
+                return command_options[name]
+        elif name in self._command_options:
             return self._command_options[name]
-
-        if name in self._command_options_by_short_name:
+        elif name in self._command_options_by_short_name:
             return self._command_options_by_short_name[name]
 
-        if include_base and self._base_format:
-            return self._base_format.get_command_option(name)
-
         raise NoSuchOptionException(name)
 
     def get_command_options(
         self, include_base=True
     ):  # type: (bool) -> List[CommandOption]
-        command_options = list(self._command_options.values())
-
-        if include_base and self._base_format:
-            command_options += self._base_format.get_command_options()
+        if include_base:
+            return list(self.compiled.command_option_list)
 
-        return command_options
+        return list(self._command_options.values())
 
     def has_argument(
         self, name, include_base=True
     ):  # type: (Union[str, int], bool) -> bool
-        arguments = self.get_arguments(include_base)
-
         if isinstance(name, int):
-            return name < len(arguments)
+            if include_base:
+                return name < len(self.compiled.positional_arguments)
 
-        return name in arguments
+            return name < len(self._arguments)
 
-    def has_multi_valued_argument(self, include_base=True):  # type: (bool) -> bool
-        if self._has_multi_valued_arg:
-            return True
+        if include_base:
+            return name in self.compiled.arguments
 
-        if include_base and self._base_format:
-            return self._base_format.has_multi_valued_argument()
+        return name in self._arguments
 
-        return False
+    def has_multi_valued_argument(self, include_base=True):  # type: (bool) -> bool
+        if include_base:
+            return self.compiled.has_multi_valued_argument
 
-    def has_optional_argument(self, include_base=True):  # type: (bool) -> bool
-        if self._hash_optional_arg:
-            return True
+        return self._has_multi_valued_arg
 
-        if include_base and self._base_format:
-            return self._base_format.has_optional_argument()
+    def has_optional_argument(self, include_base=True):  # type: (bool) -> bool
+        if include_base:
+            return self.compiled.has_optional_argument
 
-        return False
+        return self._hash_optional_arg
 
     def has_required_argument(self, include_base=True):  # type: (bool) -> bool
-        if not self._hash_optional_arg and self._arguments:
-            return True
+        if include_base:
+            return self.compiled.has_required_argument
 
-        if include_base and self._base_format:
-            return self._base_format.has_required_argument()
-
-        return False
+        return not self._hash_optional_arg and bool(self._arguments)
 
     def has_arguments(self, include_base=True):  # type: (bool) -> bool
-        if self._arguments:
-            return True
-
-        if include_base and self._base_format:
-            return self._base_format.has_arguments()
+        if include_base:
+            return bool(self.compiled.arguments)
 
-        return False
+        return bool(self._arguments)
 
     def get_argument(
         self, name, include_base=True
     ):  # type: (Union[str, int], bool) -> Argument
         if isinstance(name, int):
-            arguments = list(self.get_arguments(include_base).values())
+            if include_base:
+                arguments = self.compiled.positional_arguments
+            else:
+                arguments = tuple(self._arguments.values())
 
             if name >= len(arguments):
                 raise NoSuchArgumentException(name)
         else:
-            arguments = self.get_arguments(include_base)
+            arguments = self.compiled.arguments if include_base else self._arguments
 
             if name not in arguments:
                 raise NoSuchArgumentException(name)
@@ -187,52 +198,40 @@ class ArgsFormat(object):
         return arguments[name]
 
     def get_arguments(self, include_base=True):  # type: (bool) -> Dict[str, Argument]
-        arguments = self._arguments.copy()
-
-        if include_base and self._base_format:
-            base_arguments = self._base_format.get_arguments()
-            base_arguments.update(arguments)
-            arguments = base_arguments
+        if include_base:
+            return self.compiled.arguments.copy()
 
-        return arguments
+        return self._arguments.copy()
 
     def has_option(self, name, include_base=True):  # type: (str, bool) -> bool
-        if name in self._options or name in self._options_by_short_name:
-            return True
+        if include_base:
+            return name in self.compiled.option_lookup
 
-        if include_base and self._base_format:
-            return self._base_format.has_option(name)
-
-        return False
+        return name in self._options or name in self._options_by_short_name
 
     def has_options(self, include_base=True):  # type: (bool) -> bool
-        if self._options:
-            return True
+        if include_base:
+            return bool(self.compiled.options)
 
-        if include_base and self._base_format:
-            return self._base_format.has_options()
-
-        return False
+        return bool(self._options)
 
     def get_option(self, name, include_base=True):  # type: (str, bool) -> Option
-        if name in self._options:
+        if include_base:
+            option_lookup = self.compiled.option_lookup
+            if name in option_lookup:
+                return option_lookup[name]
+        elif name in self._options:
             return self._options[name]
-
-        if name in self._options_by_short_name:
+        elif name in self._options_by_short_name:
             return self._options_by_short_name[name]
 
-        if include_base and self._base_format:
-            return self._base_format.get_option(name)
-
         raise NoSuchOptionException(name)
 
     def get_options(self, include_base=True):  # type: (bool) -> Dict[str, Option]
-        options = self._options.copy()
+        if include_base:
+            return self.compiled.options.copy()
 
-        if include_base and self._base_format:
-            options.update(self._base_format.get_options())
-
-        return options
+        return self._options.copy()
 
     def _create_builder_for_elements(
         self, elements, base_format=None
@@ -240,15 +239,6 @@ class ArgsFormat(object):
         from .args_format_builder import ArgsFormatBuilder
 
         builder = ArgsFormatBuilder(base_format)
-
-        for element in elements:
-            if isinstance(element, CommandName):
-                builder.add_command_name(element)
-            elif isinstance(element, CommandOption):
-                builder.add_command_option(element)
-            elif isinstance(element, Option):
-                builder.add_option(element)
-            elif isinstance(element, Argument):
-                builder.add_argument(element)
+        builder.add_elements(*elements)
 
         return builder
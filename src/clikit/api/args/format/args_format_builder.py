@@ -15,6 +15,7 @@ from .args_format import ArgsFormat
 from .argument import Argument
 from .command_name import CommandName
 from .command_option import CommandOption
+from .compiled_args_format import _EMPTY
 from .option import Option
 
 
@@ -23,6 +24,18 @@ class ArgsFormatBuilder(object):
     A builder for ArgsFormat instances.
     """
 
+    __slots__ = (
+        "_base_format",
+        "_command_names",
+        "_command_options",
+        "_command_options_by_short_name",
+        "_arguments",
+        "_options",
+        "_options_by_short_name",
+        "_has_multi_valued_arg",
+        "_hash_optional_arg",
+    )
+
     def __init__(self, base_format=None):  # type: (Optional[ArgsFormat]) -> None
         self._base_format = base_format
         self._command_names = []
@@ -85,13 +98,12 @@ class ArgsFormatBuilder(object):
         self._command_options = {}
         self._command_options_by_short_name = {}
 
-        self.add_command_options(*command_options)
+        return self.add_command_options(*command_options)
 
     def add_command_options(
         self, *command_options
     ):  # type: (Tuple[CommandOption]) -> ArgsFormatBuilder
-        for command_option in command_options:
-            self.add_command_option(command_option)
+        return self.add_elements(*command_options)
 
     def add_command_option(
         self, command_option
@@ -184,10 +196,7 @@ class ArgsFormatBuilder(object):
     def add_arguments(
         self, *arguments
     ):  # type: (Iterable[Argument]) -> ArgsFormatBuilder
-        for argument in arguments:
-            self.add_argument(argument)
-
-        return self
+        return self.add_elements(*arguments)
 
     def add_argument(self, argument):  # type: (Argument) -> ArgsFormatBuilder
         name = argument.name
@@ -285,11 +294,10 @@ class ArgsFormatBuilder(object):
         self._options = {}
         self._options_by_short_name = {}
 
-        self.add_options(*options)
+        return self.add_options(*options)
 
     def add_options(self, *options):  # type: (Iterable[Option]) -> ArgsFormatBuilder
-        for option in options:
-            self.add_option(option)
+        return self.add_elements(*options)
 
     def add_option(self, option):  # type: (Option) -> ArgsFormatBuilder
         long_name = option.long_name
@@ -346,6 +354,99 @@ class ArgsFormatBuilder(object):
 
         return options
 
+    def add_elements(
+        self, *elements
+    ):  # type: (Union[CommandName, CommandOption, Argument, Option]) -> ArgsFormatBuilder
+        """
+        Adds command names, command options, arguments and options in bulk.
+
+        The elements are checked in order with the same rules and errors
+        as when adding them one by one, but the names are looked up directly
+        in the tables of the builder and of the compiled base format.
+        """
+        options = self._options
+        options_by_short_name = self._options_by_short_name
+        command_options = self._command_options
+        command_options_by_short_name = self._command_options_by_short_name
+        arguments = self._arguments
+
+        if self._base_format is not None:
+            base = self._base_format.compiled
+        else:
+            base = _EMPTY
+
+        base_options = base.option_lookup
+        base_command_options = base.command_options
+        base_arguments = base.arguments
+
+        def check_option_name(name):  # type: (Optional[str]) -> None
+            if name is None:
+                return
+
+            if (
+                name in options
+                or name in options_by_short_name
+                or name in command_options
+                or name in command_options_by_short_name
+                or name in base_options
+                or name in base_command_options
+            ):
+                raise CannotAddOptionException.already_exists(name)
+
+        for element in elements:
+            if isinstance(element, CommandName):
+                self._command_names.append(element)
+            elif isinstance(element, CommandOption):
+                check_option_name(element.long_name)
+                for long_alias in element.long_aliases:
+                    check_option_name(long_alias)
+
+                check_option_name(element.short_name)
+                for short_alias in element.short_aliases:
+                    check_option_name(short_alias)
+
+                command_options[element.long_name] = element
+
+                if element.short_name:
+                    command_options_by_short_name[element.short_name] = element
+
+                for long_alias in element.long_aliases:
+                    command_options[long_alias] = element
+
+                for short_alias in element.short_aliases:
+                    command_options_by_short_name[short_alias] = element
+            elif isinstance(element, Option):
+                check_option_name(element.long_name)
+                check_option_name(element.short_name)
+
+                options[element.long_name] = element
+
+                if element.short_name:
+                    options_by_short_name[element.short_name] = element
+            elif isinstance(element, Argument):
+                name = element.name
+
+                if name in arguments or name in base_arguments:
+                    raise CannotAddArgumentException.already_exists(name)
+
+                if self._has_multi_valued_arg or base.has_multi_valued_argument:
+                    raise CannotAddArgumentException.cannot_add_after_multi_valued()
+
+                if element.is_required() and (
+                    self._hash_optional_arg or base.has_optional_argument
+                ):
+                    raise CannotAddArgumentException.cannot_add_required_after_optional()
+
+                if element.is_multi_valued():
+                    self._has_multi_valued_arg = True
+
+                if element.is_optional():
+                    self._hash_optional_arg = True
+
+                arguments[name] = element
+
+        return self
+
     @property
     def format(self):  # type: () -> ArgsFormat
         return ArgsFormat(self, self._base_format)
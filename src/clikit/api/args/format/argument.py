@@ -24,6 +24,8 @@ class Argument(object):
     FLOAT = 128
     NULLABLE = 256
 
+    __slots__ = ("_name", "_flags", "_description", "_default")
+
     def __init__(
         self, name, flags=0, description=None, default=None
     ):  # type: (str, int, Optional[str], Any) -> None
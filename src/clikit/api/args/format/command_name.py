@@ -7,6 +7,8 @@ class CommandName(object):
     A command name in the console arguments.
     """
 
+    __slots__ = ("_string", "_aliases")
+
     def __init__(
         self, string, aliases=None
     ):  # type: (str, Optional[List[str]]) -> None
@@ -11,6 +11,8 @@ class CommandOption(AbstractOption):
     A command option in the console arguments.
     """
 
+    __slots__ = ("_long_aliases", "_short_aliases")
+
     def __init__(
         self, long_name, short_name=None, aliases=None, flags=0, description=None
     ):  # type: (str, Optional[str], Optional[List[str]], int, Optional[str]) -> None
@@ -0,0 +1,176 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from clikit.utils._compat import OrderedDict
+from clikit.utils.suggestions import SuggestionIndex
+
+
+if TYPE_CHECKING:
+    from .args_format import ArgsFormat  # noqa
+
+
+class CompiledArgsFormat(object):
+    """
+    The flattened lookup tables of an ArgsFormat and all its base formats.
+
+    The tables are computed once per format from the tables of its base
+    format. A table a format does not add anything to is the very same
+    object as the one of its base format. The tables must not be modified.
+    """
+
+    __slots__ = (
+        "command_names",
+        "arguments",
+        "positional_arguments",
+        "options",
+        "option_lookup",
+        "command_option_list",
+        "command_options",
+        "has_multi_valued_argument",
+        "has_optional_argument",
+        "has_required_argument",
+        "_option_suggestion_index",
+        "_option_defaults",
+        "_argument_defaults",
+        "_accessors",
+    )
+
+    def __init__(
+        self, fmt, base=None
+    ):  # type: (ArgsFormat, Optional[CompiledArgsFormat]) -> None
+        own_command_names = tuple(fmt.get_command_names(False))
+        own_command_options = fmt._command_options
+        own_arguments = fmt._arguments
+        own_options = fmt._options
+
+        if base is None:
+            base = _EMPTY
+
+        # Command names and arguments of the base formats come first
+        self.command_names = base.command_names + own_command_names
+
+        if own_arguments:
+            arguments = OrderedDict(base.arguments)
+            arguments.update(own_arguments)
+            self.arguments = arguments
+            self.positional_arguments = tuple(arguments.values())
+        else:
+            self.arguments = base.arguments
+            self.positional_arguments = base.positional_arguments
+
+        # Lookups try the long names, then the short names, of a format
+        # before the names of its base formats
+        if own_options:
+            options = OrderedDict(own_options)
+            options.update(base.options)
+            self.options = options
+
+            option_lookup = dict(base.option_lookup)
+            option_lookup.update(fmt._options_by_short_name)
+            option_lookup.update(own_options)
+            self.option_lookup = option_lookup
+        else:
+            self.options = base.options
+            self.option_lookup = base.option_lookup
+
+        if own_command_options:
+            self.command_option_list = (
+                tuple(own_command_options.values()) + base.command_option_list
+            )
+
+            command_options = dict(base.command_options)
+            command_options.update(fmt._command_options_by_short_name)
+            command_options.update(own_command_options)
+            self.command_options = command_options
+        else:
+            self.command_option_list = base.command_option_list
+            self.command_options = base.command_options
+
+        self.has_multi_valued_argument = (
+            fmt.has_multi_valued_argument(False) or base.has_multi_valued_argument
+        )
+        self.has_optional_argument = (
+            fmt.has_optional_argument(False) or base.has_optional_argument
+        )
+        self.has_required_argument = (
+            fmt.has_required_argument(False) or base.has_required_argument
+        )
+
+        self._option_suggestion_index = None  # type: Optional[SuggestionIndex]
+        self._option_defaults = None  # type: Optional[Dict[str, Any]]
+        self._argument_defaults = None  # type: Optional[Dict[str, Any]]
+        self._accessors = None  # type: Optional[Dict[str, Tuple[bool, str]]]
+
+    @property
+    def option_defaults(self):  # type: () -> Dict[str, Any]
+        """
+        The value of each option when it is not set, by long name.
+        """
+        if self._option_defaults is None:
+            self._option_defaults = {
+                name: option.default if option.accepts_value() else False
+                for name, option in self.options.items()
+            }
+
+        return self._option_defaults
+
+    @property
+    def argument_defaults(self):  # type: () -> Dict[str, Any]
+        """
+        The value of each argument when it is not set, by name.
+        """
+        if self._argument_defaults is None:
+            self._argument_defaults = {
+                name: argument.default for name, argument in self.arguments.items()
+            }
+
+        return self._argument_defaults
+
+    @property
+    def accessors(self):  # type: () -> Dict[str, Tuple[bool, str]]
+        """
+        The attribute names used by ArgsValues, mapped to whether they
+        belong to an argument and to the argument or option name.
+        """
+        if self._accessors is None:
+            accessors = {}
+            for name in self.options:
+                accessors[name.replace("-", "_")] = (False, name)
+
+            for name in self.arguments:
+                accessors[name.replace("-", "_")] = (True, name)
+
+            self._accessors = accessors
+
+        return self._accessors
+
+    @property
+    def option_suggestion_index(self):  # type: () -> SuggestionIndex
+        """
+        The index of the long option names used to suggest options
+        for a misspelled name.
+        """
+        if self._option_suggestion_index is None:
+            self._option_suggestion_index = SuggestionIndex(self.options)
+
+        return self._option_suggestion_index
+
+
+class _EmptyCompiledArgsFormat(object):
+
+    command_names = ()
+    command_options = {}
+    command_option_list = ()
+    arguments = OrderedDict()
+    positional_arguments = ()
+    options = OrderedDict()
+    option_lookup = {}
+    has_multi_valued_argument = False
+    has_optional_argument = False
+    has_required_argument = False
+
+
+_EMPTY = _EmptyCompiledArgsFormat()
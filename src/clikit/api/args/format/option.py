@@ -25,6 +25,8 @@ class Option(AbstractOption):
     FLOAT = 1024
     NULLABLE = 2048
 
+    __slots__ = ("_value_name", "_default")
+
     def __init__(
         self,
         long_name,
@@ -0,0 +1,72 @@
+from typing import Iterable
+from typing import Optional
+
+
+class GlobalFlags(object):
+    """
+    The global flags found in a list of option tokens.
+
+    The flags are collected in a single pass over the tokens so that the IO
+    factory, the help resolution and the version display do not need to scan
+    the tokens, or parse them, each on their own.
+    """
+
+    # Maps each recognized token to the attribute it sets and the value set
+    TOKENS = {
+        "-h": ("help", True),
+        "--help": ("help", True),
+        "-V": ("version", True),
+        "--version": ("version", True),
+        "-q": ("quiet", True),
+        "--quiet": ("quiet", True),
+        "-n": ("no_interaction", True),
+        "--no-interaction": ("no_interaction", True),
+        "--ansi": ("ansi", True),
+        "--no-ansi": ("no_ansi", True),
+        "-v": ("verbosity", 1),
+        "-vv": ("verbosity", 2),
+        "-vvv": ("verbosity", 3),
+    }
+
+    def __init__(self):  # type: () -> None
+        self.help = False
+        self.version = False
+        self.quiet = False
+        self.no_interaction = False
+        self.ansi = False
+        self.no_ansi = False
+        self.verbosity = 0
+        self.only_flags = True
+
+    @classmethod
+    def scan(cls, option_tokens):  # type: (Iterable[str]) -> GlobalFlags
+        flags = cls()
+        tokens = cls.TOKENS
+
+        for token in option_tokens:
+            if token not in tokens:
+                flags.only_flags = False
+
+                continue
+
+            name, value = tokens[token]
+            if name == "verbosity":
+                value = max(value, flags.verbosity)
+
+            setattr(flags, name, value)
+
+        return flags
+
+    @property
+    def decorated(self):  # type: () -> Optional[bool]
+        """
+        Returns whether ANSI output was forced (True), disabled (False)
+        or left to the output streams (None).
+        """
+        if self.no_ansi:
+            return False
+
+        if self.ansi:
+            return True
+
+        return
@@ -1,12 +1,17 @@
+from typing import Iterator
 from typing import List
 from typing import Optional
 
+from .global_flags import GlobalFlags
+
 
 class RawArgs(object):
     """
     The unparsed console arguments.
     """
 
+    _global_flags = None  # type: Optional[GlobalFlags]
+
     @property
     def script_name(self):  # type: () -> Optional[str]
         raise NotImplementedError()
@@ -15,6 +20,14 @@ class RawArgs(object):
     def tokens(self):  # type: () -> List[str]
         raise NotImplementedError()
 
+    @property
+    def streamed_values(self):  # type: () -> Optional[Iterator[str]]
+        """
+        Returns the values streamed to the last, multi-valued argument
+        from sources other than the tokens, if any.
+        """
+        return
+
     def has_token(self, token):  # type: (str) -> bool
         raise NotImplementedError()
 
@@ -27,3 +40,15 @@ class RawArgs(object):
 
     def has_option_token(self, token):  # type: (str) -> bool
         raise NotImplementedError()
+
+    @property
+    def global_flags(self):  # type: () -> GlobalFlags
+        """
+        Returns the global flags found in the option tokens.
+
+        The tokens are scanned once and the result is cached.
+        """
+        if self._global_flags is None:
+            self._global_flags = GlobalFlags.scan(self.option_tokens)
+
+        return self._global_flags
@@ -1,2 +1,3 @@
 from .command import Command
 from .command_collection import CommandCollection
+from .lazy_command import LazyCommand
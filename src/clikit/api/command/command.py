@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import List
 from typing import Optional
 
@@ -10,8 +11,13 @@ from clikit.api.event import PRE_HANDLE
 from clikit.api.event import PreHandleEvent
 from clikit.api.io import IO
 
+from .exceptions import CannotRunCoroutineException
+from .lazy_command import LazyCommand
+
 
 if TYPE_CHECKING:
+    from typing import Awaitable  # noqa
+
     from clikit.api.application import Application
     from clikit.api.command.command_collection import CommandCollection
 
@@ -21,6 +27,21 @@ class Command(object):
     A console command.
     """
 
+    __slots__ = (
+        "_name",
+        "_short_name",
+        "_aliases",
+        "_config",
+        "_application",
+        "_parent_command",
+        "_sub_commands",
+        "_named_sub_commands",
+        "_default_sub_commands",
+        "_args_format",
+        "_dispatcher",
+        "_lazy",
+    )
+
     def __init__(
         self, config, application=None, parent_command=None
     ):  # type: (CommandConfig, Optional[Application], Optional[Command]) -> None
@@ -38,8 +59,17 @@ class Command(object):
         self._sub_commands = CommandCollection()
         self._named_sub_commands = CommandCollection()
         self._default_sub_commands = CommandCollection()
-        self._args_format = config.build_args_format(self.base_format)
+        self._args_format = None  # type: Optional[ArgsFormat]
         self._dispatcher = application.config.dispatcher if application else None
+        self._lazy = (
+            application.config.is_lazy_command_loading_enabled()
+            if application
+            else False
+        )
+
+        # In lazy mode, the args format is only built on first access
+        if not self._lazy:
+            self._args_format = config.build_args_format(self.base_format)
 
         for sub_config in config.sub_command_configs:
             self.add_sub_command(sub_config)
@@ -72,6 +102,9 @@ class Command(object):
 
     @property
     def args_format(self):  # type: () -> ArgsFormat
+        if self._args_format is None:
+            self._args_format = self._config.build_args_format(self.base_format)
+
         return self._args_format
 
     @property
@@ -116,7 +149,7 @@ class Command(object):
         if lenient is None:
             lenient = self._config.is_lenient_args_parsing_enabled()
 
-        return self._config.args_parser.parse(args, self._args_format, lenient)
+        return self._config.args_parser.parse(args, self.args_format, lenient)
 
     def run(self, args, io):  # type: (RawArgs, IO) -> int
         return self.handle(self.parse(args), io)
@@ -130,6 +163,13 @@ class Command(object):
 
             status_code = 1
 
+        return self.normalize_status_code(status_code)
+
+    @staticmethod
+    def normalize_status_code(status_code):  # type: (Any) -> int
+        """
+        Returns the exit code matching the status code of a handler.
+        """
         # Any empty value is considered a success
         if not status_code:
             return 0
@@ -151,7 +191,10 @@ class Command(object):
         if not config.is_enabled():
             return
 
-        command = self.__class__(config, self._application, self)
+        if self._lazy:
+            command = LazyCommand(config, self._application, self, self.__class__)
+        else:
+            command = self.__class__(config, self._application, self)
 
         # TODO: Validate command
 
@@ -174,7 +217,42 @@ class Command(object):
         handler = self._config.handler
         handler_method = self._config.handler_method
 
-        return getattr(handler, handler_method)(args, io, self)
+        status_code = getattr(handler, handler_method)(args, io, self)
+
+        # Handler methods may be coroutines
+        if hasattr(status_code, "__await__"):
+            status_code = self._run_until_complete(status_code)
+
+        return status_code
+
+    def _run_until_complete(self, awaitable):  # type: (Awaitable) -> Optional[int]
+        """
+        Runs a coroutine returned by the handler on the event loop
+        of the application, or on a loop of its own in the threads
+        which do not own the loop of the application.
+        """
+        import asyncio
+
+        get_running_loop = getattr(asyncio.events, "_get_running_loop", None)
+        if get_running_loop is not None and get_running_loop() is not None:
+            if hasattr(awaitable, "close"):
+                # Avoid the "never awaited" warning
+                awaitable.close()
+
+            raise CannotRunCoroutineException(self.full_name)
+
+        loop = None
+        if self._application:
+            loop = self._application.event_loop
+
+        if loop is not None:
+            return loop.run_until_complete(awaitable)
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
 
     def __repr__(self):  # type: () -> str
         return "<Command {}>".format(self.full_name)
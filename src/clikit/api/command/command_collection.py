@@ -1,75 +1,175 @@
+import bisect
+
 from typing import List
+from typing import Optional
+from typing import Union
 
 from clikit.utils._compat import OrderedDict
+from clikit.utils.suggestions import SuggestionIndex
 
 from .command import Command
 from .exceptions import NoSuchCommandException
+from .lazy_command import LazyCommand
 
 
 class CommandCollection(object):
     """
     A collection of named commands.
+
+    Commands may be added as LazyCommand placeholders, in which case
+    they are only built when they are retrieved from the collection.
+
+    Names, short names and aliases share a single lookup table, in this
+    order of precedence. The sorted names are computed once and used for
+    listings and prefix lookups.
     """
 
+    _NAME = 0
+    _SHORT_NAME = 1
+    _ALIAS = 2
+
+    __slots__ = (
+        "_commands",
+        "_alias_index",
+        "_lookup",
+        "_sorted_names",
+        "_sorted_names_and_aliases",
+        "_suggestion_index",
+        "_revision",
+    )
+
     def __init__(self, commands=None):  # type: (List[Command]) -> None
         if commands is None:
             commands = []
 
         self._commands = OrderedDict()
-        self._short_name_index = OrderedDict()
         self._alias_index = OrderedDict()
+        # Name, short name or alias -> (precedence, name)
+        self._lookup = {}
+        self._sorted_names = None  # type: Optional[List[str]]
+        self._sorted_names_and_aliases = None  # type: Optional[List[str]]
+        self._suggestion_index = None  # type: Optional[SuggestionIndex]
+        self._revision = 0
 
         for command in commands:
             self.add(command)
 
-    def add(self, command):  # type: (Command) -> CommandCollection
+    def add(self, command):  # type: (Union[Command, LazyCommand]) -> CommandCollection
         name = command.name
 
         self._commands[name] = command
+        self._index(name, self._NAME, name)
 
         short_name = command.short_name
         if short_name:
-            self._short_name_index[short_name] = name
+            self._index(short_name, self._SHORT_NAME, name)
 
         for alias in command.aliases:
             self._alias_index[alias] = name
+            self._index(alias, self._ALIAS, name)
 
-        return self
+        self._sorted_names = None
+        self._sorted_names_and_aliases = None
+        self._suggestion_index = None
 
-    def get(self, name):  # type: (str) -> Command
-        if name in self._commands:
-            return self._commands[name]
+        self._revision += 1
 
-        if name in self._short_name_index:
-            return self._commands[self._short_name_index[name]]
+        return self
 
-        if name in self._alias_index:
-            return self._commands[self._alias_index[name]]
+    def get(self, name):  # type: (str) -> Command
+        entry = self._lookup.get(name)
+        if entry is None:
+            raise NoSuchCommandException(name)
 
-        raise NoSuchCommandException(name)
+        return self._load(entry[1])
 
     def is_empty(self):  # type: () -> bool
         return not self._commands
 
     def get_names(self, include_aliases=False):  # type: (bool) -> List[str]
-        names = list(self._commands.keys())
-
         if include_aliases:
-            names += list(self._alias_index.keys())
-
-        names.sort()
-
-        return names
+            if self._sorted_names_and_aliases is None:
+                self._sorted_names_and_aliases = sorted(
+                    list(self._commands.keys()) + list(self._alias_index.keys())
+                )
+
+            return list(self._sorted_names_and_aliases)
+
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._commands.keys())
+
+        return list(self._sorted_names)
+
+    @property
+    def revision(self):  # type: () -> int
+        """
+        Incremented whenever a command is added to the collection,
+        so that caches built from it can be invalidated.
+        """
+        return self._revision
+
+    @property
+    def suggestion_index(self):  # type: () -> SuggestionIndex
+        """
+        The index of the names and aliases used to suggest commands
+        for a misspelled name.
+        """
+        if self._suggestion_index is None:
+            self._suggestion_index = SuggestionIndex(self.get_names(True))
+
+        return self._suggestion_index
+
+    def find_by_prefix(self, prefix):  # type: (str) -> List[str]
+        """
+        Returns the sorted names of the commands whose name or one of
+        whose aliases starts with a prefix.
+        """
+        if self._sorted_names_and_aliases is None:
+            self.get_names(True)
+
+        sorted_names = self._sorted_names_and_aliases
+        names = []
+
+        i = bisect.bisect_left(sorted_names, prefix)
+        while i < len(sorted_names) and sorted_names[i].startswith(prefix):
+            name = self._lookup[sorted_names[i]][1]
+            if name not in names:
+                names.append(name)
+
+            i += 1
+
+        return sorted(names)
+
+    def peek(self):  # type: () -> List[Union[Command, LazyCommand]]
+        """
+        Returns the commands without building the ones not loaded yet.
+
+        Only the name, aliases and configuration of the returned
+        placeholders should be used.
+        """
+        return list(self._commands.values())
 
     def __contains__(self, name):
-        return (
-            name in self._commands
-            or name in self._short_name_index
-            or name in self._alias_index
-        )
+        return name in self._lookup
 
     def __iter__(self):
-        return iter(self._commands.values())
+        for name in list(self._commands.keys()):
+            yield self._load(name)
 
     def __len__(self):
         return len(self._commands)
+
+    def _index(self, key, precedence, name):  # type: (str, int, str) -> None
+        entry = self._lookup.get(key)
+
+        if entry is None or entry[0] >= precedence:
+            self._lookup[key] = (precedence, name)
+
+    def _load(self, name):  # type: (str) -> Command
+        command = self._commands[name]
+
+        if isinstance(command, LazyCommand):
+            command = command.load()
+            self._commands[name] = command
+
+        return command
@@ -8,6 +8,16 @@ class NoSuchCommandException(RuntimeError, CliKitException):
         super(NoSuchCommandException, self).__init__(message)
 
 
+class CannotRunCoroutineException(RuntimeError, CliKitException):
+    def __init__(self, name):  # type: (str) -> None
+        message = (
+            'The handler of the command "{}" is a coroutine and cannot be run '
+            "from a running event loop.".format(name)
+        )
+
+        super(CannotRunCoroutineException, self).__init__(message)
+
+
 class CannotAddCommandException(RuntimeError):
     @classmethod
     def name_exists(cls, name):
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from clikit.api.config.command_config import CommandConfig
+
+
+if TYPE_CHECKING:
+    from clikit.api.application import Application
+
+    from .command import Command
+
+
+class LazyCommand(object):
+    """
+    A lightweight placeholder for a command that has not been built yet.
+
+    It only exposes the names needed to index the command in
+    a CommandCollection. The actual Command, its args format and its
+    sub commands are built the first time the command is loaded.
+
+    If a configuration loader is given, the configuration passed is only
+    a placeholder and the actual one is loaded with the command.
+    """
+
+    def __init__(
+        self,
+        config,
+        application=None,
+        parent_command=None,
+        command_class=None,
+        config_loader=None,
+    ):  # type: (CommandConfig, Optional[Application], Optional[Command], Optional[type], Optional[Callable[[], CommandConfig]]) -> None
+        if not config.name:
+            raise RuntimeError("The name of the command config must be set.")
+
+        if command_class is None:
+            from .command import Command
+
+            command_class = Command
+
+        self._config = config
+        self._application = application
+        self._parent_command = parent_command
+        self._command_class = command_class
+        self._config_loader = config_loader
+        self._command = None  # type: Optional[Command]
+
+    @property
+    def name(self):  # type: () -> str
+        return self._config.name
+
+    @property
+    def short_name(self):  # type: () -> Optional[str]
+        return
+
+    @property
+    def aliases(self):  # type: () -> List[str]
+        return self._config.aliases
+
+    @property
+    def config(self):  # type: () -> CommandConfig
+        return self._config
+
+    def is_loaded(self):  # type: () -> bool
+        return self._command is not None
+
+    def load(self):  # type: () -> Command
+        """
+        Builds the command on first use and returns the same instance afterwards.
+        """
+        if self._command is None:
+            if self._config_loader is not None:
+                self._config = self._config_loader()
+                self._config_loader = None
+
+            self._command = self._command_class(
+                self._config, self._application, self._parent_command
+            )
+
+        return self._command
+
+    def __repr__(self):  # type: () -> str
+        return "<LazyCommand {}>".format(self.name)
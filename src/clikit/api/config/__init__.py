@@ -1,2 +1,3 @@
 from .application_config import ApplicationConfig
 from .command_config import CommandConfig
+from .plugin_command_config import PluginCommandConfig
@@ -1,4 +1,5 @@
 import re
+import sys
 
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
@@ -42,24 +43,24 @@ class ApplicationConfig(Config):
         self._command_configs = []  # type: List[CommandConfig]
         self._catch_exceptions = True
         self._terminate_after_run = True
+        self._lazy_command_loading = False
+        self._response_files = False
+        self._command_abbreviations = False
+        self._batch_mode = False
         self._command_resolver = None
         self._io_factory = None
         self._debug = False
         self._style_set = None
         self._dispatcher = None
         self._pre_resolve_hooks = []  # type: List[Callable]
-
-        if PY36:
-            from crashtest.solution_providers.solution_provider_repository import (
-                SolutionProviderRepository,
-            )
-
-            self._solution_provider_repository = SolutionProviderRepository()
-        else:
-            self._solution_provider_repository = None
+        self._solution_provider_repository = None
+        self._solution_provider_factories = []  # type: List[Callable]
 
         super(ApplicationConfig, self).__init__()
 
+        self._load_command_configs()
+        self._load_plugin_command_configs()
+
     @property
     def name(self):  # type: () -> Optional[str]
         return self._name
@@ -145,6 +146,84 @@ class ApplicationConfig(Config):
 
         return self
 
+    def is_lazy_command_loading_enabled(self):  # type: () -> bool
+        return self._lazy_command_loading
+
+    def enable_lazy_command_loading(self):  # type: () -> ApplicationConfig
+        """
+        Defers building commands until they are resolved.
+
+        The application then only indexes the command names and aliases
+        at boot time.
+        """
+        self._lazy_command_loading = True
+
+        return self
+
+    def disable_lazy_command_loading(self):  # type: () -> ApplicationConfig
+        self._lazy_command_loading = False
+
+        return self
+
+    def is_response_files_enabled(self):  # type: () -> bool
+        return self._response_files
+
+    def enable_response_files(self):  # type: () -> ApplicationConfig
+        """
+        Lets "@FILE" and "--args-from FILE" pass the values of the last,
+        multi-valued argument of a command.
+
+        "@FILE" holds one value per line and "--args-from" reads
+        NUL-delimited values, from the standard input if FILE is "-".
+        The values are streamed to the command as they are read.
+        """
+        self._response_files = True
+
+        return self
+
+    def disable_response_files(self):  # type: () -> ApplicationConfig
+        self._response_files = False
+
+        return self
+
+    def is_command_abbreviations_enabled(self):  # type: () -> bool
+        return self._command_abbreviations
+
+    def enable_command_abbreviations(self):  # type: () -> ApplicationConfig
+        """
+        Lets commands be called by any unambiguous prefix of their name
+        or of one of their aliases, e.g. "dep" for "deploy".
+        """
+        self._command_abbreviations = True
+
+        return self
+
+    def disable_command_abbreviations(self):  # type: () -> ApplicationConfig
+        self._command_abbreviations = False
+
+        return self
+
+    def is_batch_mode_enabled(self):  # type: () -> bool
+        return self._batch_mode
+
+    def enable_batch_mode(self):  # type: () -> ApplicationConfig
+        """
+        Lets "--batch FILE" run the command lines of FILE, one per line,
+        in a single process. The command lines are read from the standard
+        input if FILE is "-".
+
+        The batch stops at the first failing command line
+        if "--stop-on-failure" is passed as well.
+        """
+        self._batch_mode = True
+
+        return self
+
+    def disable_batch_mode(self):  # type: () -> ApplicationConfig
+        self._batch_mode = False
+
+        return self
+
     @property
     def command_resolver(self):  # type: () -> CommandResolver
         if self._command_resolver is None:
@@ -266,6 +345,79 @@ class ApplicationConfig(Config):
 
         return re.sub(r"[\s\-_]+", " ", self._name).title()
 
+    @property
+    def command_tree_cache_dir(self):  # type: () -> Optional[str]
+        """
+        Returns the directory where the command tree is cached.
+
+        The cache is disabled if no directory is returned.
+        """
+        return
+
+    @property
+    def command_tree_cache_key(self):  # type: () -> str
+        """
+        Returns the key invalidating the command tree cache.
+
+        By default, it changes whenever the version of the application
+        or the source of the configuration classes change.
+        """
+        import hashlib
+
+        hasher = hashlib.sha1(str(self._version).encode())
+
+        for cls in type(self).__mro__:
+            path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+            if not path:
+                continue
+
+            try:
+                with open(path, "rb") as f:
+                    hasher.update(f.read())
+            except (IOError, OSError):
+                hasher.update(path.encode())
+
+        return hasher.hexdigest()
+
+    @property
+    def plugin_entry_point_group(self):  # type: () -> Optional[str]
+        """
+        Returns the entry point group of the plugins providing commands.
+
+        Plugin commands are registered from an index cached in the plugin
+        cache directory and their plugin is only imported when they
+        are used. Plugins are disabled if no group is returned.
+        """
+        return
+
+    @property
+    def plugin_cache_dir(self):  # type: () -> Optional[str]
+        """
+        Returns the directory where the plugin index is cached.
+
+        It defaults to the command tree cache directory or, if there is
+        none, to the per-user cache directory of the application. If no
+        directory is returned, every run imports all the plugins to
+        rebuild the index.
+        """
+        cache_dir = self.command_tree_cache_dir
+        if cache_dir is not None:
+            return cache_dir
+
+        from clikit.utils._file import user_cache_dir
+
+        return user_cache_dir(self._name or "clikit")
+
+    def configure_commands(self):  # type: () -> None
+        """
+        Adds the command configurations.
+
+        Unlike configure(), this method is skipped when the commands
+        can be loaded from the command tree cache.
+
+        Should be overridden in subclasses
+        """
+
     @property
     def default_style_set(self):  # type: () -> StyleSet
         raise NotImplementedError()
@@ -276,4 +428,76 @@ class ApplicationConfig(Config):
 
     @property
     def solution_provider_repository(self):
+        """
+        Returns the repository of solution providers used to render exceptions.
+
+        The repository is only created when an exception is rendered.
+        """
+        if self._solution_provider_repository is None and PY36:
+            from crashtest.solution_providers.solution_provider_repository import (
+                SolutionProviderRepository,
+            )
+
+            self._solution_provider_repository = SolutionProviderRepository()
+
+        if self._solution_provider_repository is not None:
+            while self._solution_provider_factories:
+                factory = self._solution_provider_factories.pop(0)
+
+                self._solution_provider_repository.register_solution_provider(factory())
+
         return self._solution_provider_repository
+
+    def set_solution_provider_repository(
+        self, solution_provider_repository
+    ):  # type: (...) -> ApplicationConfig
+        self._solution_provider_repository = solution_provider_repository
+
+        return self
+
+    def add_solution_provider(self, factory):  # type: (Callable) -> ApplicationConfig
+        """
+        Registers a solution provider.
+
+        The factory must return the solution provider class. It is only
+        called when an exception is rendered, so the provider module
+        does not need to be imported beforehand.
+        """
+        self._solution_provider_factories.append(factory)
+
+        return self
+
+    def _load_plugin_command_configs(self):  # type: () -> None
+        group = self.plugin_entry_point_group
+        if group is None:
+            return
+
+        from clikit.config.plugin_index import PluginIndex
+
+        index = PluginIndex(group, self.plugin_cache_dir)
+
+        self.add_command_configs(index.get_command_configs())
+
+    def _load_command_configs(self):  # type: () -> None
+        cache_dir = self.command_tree_cache_dir
+        if cache_dir is None:
+            self.configure_commands()
+
+            return
+
+        from clikit.config.command_tree_cache import CommandTreeCache
+
+        cache = CommandTreeCache(cache_dir)
+        key = self.command_tree_cache_key
+
+        command_configs = cache.load(key)
+        if command_configs is not None:
+            self.add_command_configs(command_configs)
+
+            return
+
+        # The cache is missing or stale:
+        # fall back to the normal configuration and refresh it
+        count = len(self._command_configs)
+        self.configure_commands()
+        cache.dump(key, self._command_configs[count:])
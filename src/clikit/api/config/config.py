@@ -1,6 +1,9 @@
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from clikit.api.args.args_parser import ArgsParser
 from clikit.api.args.format.args_format_builder import ArgsFormatBuilder
@@ -21,6 +24,7 @@ class Config(object):
         self._lenient_args_parsing = None
         self._handler = None
         self._handler_method = None
+        self._completion_providers = {}
 
         self.configure()
 
@@ -111,6 +115,27 @@ class Config(object):
 
         return self
 
+    @property
+    def completion_providers(
+        self,
+    ):  # type: () -> Dict[str, Tuple[Any, Optional[float], Optional[int]]]
+        return self._completion_providers
+
+    def set_completion_provider(
+        self, name, provider, timeout=None, ttl=None
+    ):  # type: (str, Union[str, Callable], Optional[float], Optional[int]) -> Config
+        """
+        Sets the provider of the values completed for an option or an argument.
+
+        The provider is a function, or its "module:name" import path,
+        receiving the words preceding the completed one and returning
+        the possible values. The time it is allowed to run (in seconds)
+        and how long its results are cached (in seconds) can be customized.
+        """
+        self._completion_providers[name] = (provider, timeout, ttl)
+
+        return self
+
     @property
     def default_args_parser(self):  # type: () -> ArgsParser
         return DefaultArgsParser()
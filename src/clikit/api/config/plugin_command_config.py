@@ -0,0 +1,46 @@
+from typing import Optional
+
+from .command_config import CommandConfig
+
+
+class PluginCommandConfig(CommandConfig):
+    """
+    A placeholder for a command provided by a plugin.
+
+    Only the name, aliases, description and visibility of the command
+    are known until the configuration is loaded, which imports the plugin.
+    """
+
+    def __init__(self, name, entry_point):  # type: (str, str) -> None
+        super(PluginCommandConfig, self).__init__(name)
+
+        self._entry_point = entry_point
+        self._loaded_config = None  # type: Optional[CommandConfig]
+
+    @property
+    def entry_point(self):  # type: () -> str
+        return self._entry_point
+
+    def is_loaded(self):  # type: () -> bool
+        return self._loaded_config is not None
+
+    def load(self):  # type: () -> CommandConfig
+        """
+        Imports the plugin and returns the actual configuration of the command.
+        """
+        if self._loaded_config is None:
+            from clikit.config.plugin_index import load_entry_point
+
+            for config in load_entry_point(self._entry_point):
+                if config.name == self.name:
+                    self._loaded_config = config
+
+                    break
+            else:
+                raise RuntimeError(
+                    'The plugin "{}" does not provide the command "{}".'.format(
+                        self._entry_point, self.name
+                    )
+                )
+
+        return self._loaded_config
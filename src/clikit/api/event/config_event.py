@@ -14,7 +14,11 @@ class ConfigEvent(Event):
     Use this event to add custom configuration to the application.
     """
 
+    __slots__ = ("_config",)
+
     def __init__(self, config):  # type: (ApplicationConfig) -> None
+        super(ConfigEvent, self).__init__()
+
         self._config = config
 
     @property
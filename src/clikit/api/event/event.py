@@ -3,6 +3,8 @@ class Event(object):
     Event
     """
 
+    __slots__ = ("_propagation_stopped",)
+
     def __init__(self):  # type: () -> None
         self._propagation_stopped = False
 
@@ -18,6 +18,8 @@ class PreHandleEvent(Event):
     the default handler.
     """
 
+    __slots__ = ("_args", "_io", "_command", "_handled", "_status_code")
+
     def __init__(self, args, io, command):  # type: (Args, IO, Command) -> None
         super(PreHandleEvent, self).__init__()
 
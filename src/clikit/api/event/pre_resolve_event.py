@@ -18,6 +18,8 @@ class PreResolveEvent(Event):
     console arguments.
     """
 
+    __slots__ = ("_raw_args", "_application", "_resolved_command")
+
     def __init__(self, raw_args, application):  # type: (RawArgs, Application) -> None
         super(PreResolveEvent, self).__init__()
 
@@ -6,6 +6,19 @@ class Style(object):
     A formatter style.
     """
 
+    __slots__ = (
+        "_tag",
+        "_fg_color",
+        "_bg_color",
+        "_bold",
+        "_underlined",
+        "_italic",
+        "_dark",
+        "_blinking",
+        "_inverse",
+        "_hidden",
+    )
+
     def __init__(self, tag=None):  # type: (Optional[str]) -> None
         self._tag = tag
         self._fg_color = None
@@ -16,6 +16,9 @@ class StyleSet(object):
 
         self._styles = {}
 
+        # The compiled style table shared by the formatters using this set
+        self._table = None
+
         for style in styles:
             self.add(style)
 
@@ -28,9 +31,11 @@ class StyleSet(object):
             raise ValueError("The tag of a style added to the style set must be set.")
 
         self._styles[style.tag] = style
+        self._table = None
 
     def replace(self, styles):  # type: (Optional[List[Style]]) -> None
         self._styles = {}
+        self._table = None
 
         for style in styles:
             self.add(style)
@@ -38,3 +43,4 @@ class StyleSet(object):
     def remove(self, tag):  # type: (str) -> None
         if tag in self._styles:
             del self._styles[tag]
+            self._table = None
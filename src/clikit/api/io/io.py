@@ -1,4 +1,6 @@
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import Optional
 
 from clikit.api.formatter import Formatter
@@ -6,6 +8,9 @@ from clikit.api.formatter.style import Style
 
 
 if TYPE_CHECKING:
+    from asyncio import Future  # noqa
+    from concurrent.futures import Executor  # noqa
+
     from clikit.ui.rectangle import Rectangle
 
 from .indent import Indent
@@ -25,6 +30,7 @@ class IO(Formatter):
         self._output = output
         self._error_output = error_output
         self._terminal_dimensions = None
+        self._executor = None  # type: Optional[Executor]
 
     @property
     def input(self):  # type: () -> Input
@@ -119,10 +125,57 @@ class IO(Formatter):
         self._output.flush()
         self._error_output.flush()
 
+    def read_line_async(
+        self, length=None, default=None
+    ):  # type: (Optional[int], Optional[str]) -> Future
+        """
+        Reads a line from the standard input without blocking the event loop.
+        """
+        return self._run_async(self.read_line, length, default)
+
+    def write_async(self, string, flags=None):  # type: (str, Optional[int]) -> Future
+        """
+        Writes a string to the standard output without blocking
+        the event loop.
+        """
+        return self._run_async(self.write, string, flags)
+
+    def write_line_async(
+        self, string, flags=None
+    ):  # type: (str, Optional[int]) -> Future
+        """
+        Writes a line to the standard output without blocking the event loop.
+        """
+        return self._run_async(self.write_line, string, flags)
+
+    def error_async(self, string, flags=None):  # type: (str, Optional[int]) -> Future
+        """
+        Writes a string to the error output without blocking the event loop.
+        """
+        return self._run_async(self.error, string, flags)
+
+    def error_line_async(
+        self, string, flags=None
+    ):  # type: (str, Optional[int]) -> Future
+        """
+        Writes a line to the error output without blocking the event loop.
+        """
+        return self._run_async(self.error_line, string, flags)
+
+    def flush_async(self):  # type: () -> Future
+        """
+        Flushes the outputs without blocking the event loop.
+        """
+        return self._run_async(self.flush)
+
     def close(self):  # type: () -> None
         """
         Closes the input and the outputs.
         """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
         self._input.close()
         self._output.close()
         self._error_output.close()
@@ -244,3 +297,20 @@ class IO(Formatter):
 
     def increment_indent(self, indent):  # type: (int) -> Indent
         return Indent([self._output, self._error_output], indent, increment=True)
+
+    def _run_async(self, method, *args):  # type: (Callable, *Any) -> Future
+        """
+        Calls a blocking method of the IO in a thread and returns a future
+        for its result, to be awaited in the running event loop.
+
+        The calls share a single thread so that they run in order:
+        the output is written in the order the coroutines asked for it.
+        """
+        import asyncio
+
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        return asyncio.get_event_loop().run_in_executor(self._executor, method, *args)
@@ -19,6 +19,14 @@ class CannotResolveCommandException(RuntimeError, CliKitException):
 
         return cls(message)
 
+    @classmethod
+    def ambiguous_name(cls, name, names):
+        message = 'The command "{}" is ambiguous.'.format(name)
+        message += "\n\nDid you mean one of these?\n    "
+        message += "\n    ".join(names)
+
+        return cls(message)
+
     @classmethod
     def no_default_command(cls):
         return cls("No default command is defined.")
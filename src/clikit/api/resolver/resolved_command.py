@@ -12,6 +12,8 @@ class ResolvedCommand(object):
     A resolved command.
     """
 
+    __slots__ = ("_command", "_args")
+
     def __init__(self, command, args):  # type: (Command, Args) -> None
         self._command = command
         self._args = args
@@ -0,0 +1,148 @@
+import weakref
+
+from typing import List
+from typing import Optional
+
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.raw_args import RawArgs
+
+
+# The signatures, cached per ArgsFormat
+_signatures = weakref.WeakKeyDictionary()
+
+
+class ArgsSignature(object):
+    """
+    The shape of the command lines DefaultArgsParser can parse with a format:
+    the command names, the number of positional values needed and allowed,
+    and which options take a value.
+
+    It tells without parsing whether a command line cannot be parsed
+    because of the number of its positional values.
+    """
+
+    def __init__(self, fmt):  # type: (ArgsFormat) -> None
+        compiled = fmt.compiled
+
+        self.command_names = compiled.command_names
+
+        arguments = compiled.positional_arguments
+
+        # The number of argument values needed for the last required
+        # argument to be set
+        self.required = 0
+        for i, argument in enumerate(arguments):
+            if argument.is_required():
+                self.required = i + 1
+
+        # The maximum number of command names and argument values
+        self.capacity = None
+        if not compiled.has_multi_valued_argument:
+            self.capacity = len(self.command_names) + len(arguments)
+
+        # Long and short option names -> whether the option takes a value
+        self.options = {
+            name: option.accepts_value()
+            for name, option in compiled.option_lookup.items()
+        }
+
+    @classmethod
+    def get(cls, fmt):  # type: (ArgsFormat) -> ArgsSignature
+        signature = _signatures.get(fmt)
+        if signature is None:
+            signature = _signatures[fmt] = cls(fmt)
+
+        return signature
+
+    def rejects(self, raw_args):  # type: (RawArgs) -> bool
+        """
+        Returns whether parsing the raw arguments strictly is bound to fail
+        because of missing or superfluous positional values.
+
+        If the raw arguments contain unknown options, they are not rejected:
+        the parser reports them.
+        """
+        if raw_args.streamed_values is not None:
+            return False
+
+        values = self._get_positional_values(raw_args.tokens)
+        if values is None:
+            return False
+
+        # Command names are matched at the start and inserted if missing
+        matched = 0
+        for command_name in self.command_names:
+            if matched >= len(values) or not values[matched]:
+                break
+
+            if not command_name.match(values[matched]):
+                break
+
+            matched += 1
+
+        count = len(values) - matched
+        if count < self.required:
+            return True
+
+        if self.capacity is not None:
+            return len(self.command_names) + count > self.capacity
+
+        return False
+
+    def _get_positional_values(
+        self, tokens
+    ):  # type: (List[str]) -> Optional[List[str]]
+        """
+        Returns the tokens the parser reads as positional values, or None
+        if an option is unknown.
+        """
+        values = []
+        position = 0
+        length = len(tokens)
+
+        while position < length:
+            token = tokens[position]
+            position += 1
+
+            if token == "--":
+                values += tokens[position:]
+
+                break
+
+            if token == "" or token[0] != "-" or token == "-":
+                values.append(token)
+
+                continue
+
+            if token.startswith("--"):
+                name, has_value, _ = token[2:].partition("=")
+                accepts_value = self.options.get(name)
+                if accepts_value is None:
+                    return
+
+                if has_value:
+                    continue
+            else:
+                accepts_value = None
+
+                for i, name in enumerate(token[1:]):
+                    accepts_value = self.options.get(name)
+                    if accepts_value is None:
+                        return
+
+                    # The rest of the token is the value
+                    if accepts_value and i < len(token) - 2:
+                        accepts_value = False
+
+                        break
+
+            # An option waiting for a value takes the next token,
+            # unless it is another option
+            if (
+                accepts_value
+                and position < length
+                and not tokens[position].startswith("-")
+            ):
+                position += 1
+
+        return values
@@ -1,24 +1,48 @@
 import itertools
 import sys
 
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from clikit.api.args.raw_args import RawArgs
 
+from .streamed_values import read_source
+
 
 class ArgvArgs(RawArgs):
     """
     Console arguments passed via sys.argv.
+
+    If response files are enabled, values can be passed to the last,
+    multi-valued argument of a command without being part of argv:
+
+    - "@FILE" reads one value per line from FILE
+    - "--args-from FILE" reads NUL-delimited values from FILE,
+      or from the standard input if FILE is "-"
+
+    The sources are only read while the values are consumed.
     """
 
-    def __init__(self, argv=None):  # type: (Optional[List[str]]) -> None
+    ARGS_FROM = "--args-from"
+
+    def __init__(
+        self, argv=None, response_files=False
+    ):  # type: (Optional[List[str]], bool) -> None
         if argv is None:
             argv = list(sys.argv)
 
         argv = argv[:]
         self._script_name = argv.pop(0)
+        self._sources = []  # type: List[Iterator[str]]
+
+        if response_files:
+            argv = self._extract_sources(argv)
+
         self._tokens = argv
+        self._streamed_values = None  # type: Optional[Iterator[str]]
+        if self._sources:
+            self._streamed_values = itertools.chain.from_iterable(self._sources)
         self._option_tokens = list(
             itertools.takewhile(lambda arg: arg != "--", self.tokens)
         )
@@ -35,6 +59,10 @@ class ArgvArgs(RawArgs):
     def option_tokens(self):  # type: () -> List[str]
         return self._option_tokens
 
+    @property
+    def streamed_values(self):  # type: () -> Optional[Iterator[str]]
+        return self._streamed_values
+
     def has_token(self, token):  # type: (str) -> bool
         return token in self._tokens
 
@@ -48,3 +76,30 @@ class ArgvArgs(RawArgs):
             string = self._script_name.lstrip() + " " + string
 
         return string
+
+    def _extract_sources(self, argv):  # type: (List[str]) -> List[str]
+        tokens = []
+        position = 0
+
+        while position < len(argv):
+            token = argv[position]
+            position += 1
+
+            if token == "--":
+                tokens += argv[position - 1 :]
+
+                break
+
+            if token.startswith("@") and len(token) > 1:
+                self._sources.append(read_source(token[1:], b"\n"))
+            elif token == self.ARGS_FROM and position < len(argv):
+                self._sources.append(read_source(argv[position], b"\0"))
+                position += 1
+            elif token.startswith(self.ARGS_FROM + "="):
+                self._sources.append(
+                    read_source(token[len(self.ARGS_FROM) + 1 :], b"\0")
+                )
+            else:
+                tokens.append(token)
+
+        return tokens
@@ -1,6 +1,10 @@
+import itertools
+import weakref
+
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from clikit.api.args.args import Args
 from clikit.api.args.args_parser import ArgsParser
@@ -13,39 +17,31 @@ from clikit.api.args.raw_args import RawArgs
 from clikit.utils._compat import OrderedDict
 
 
+# The formats used for parsing, in which the command names are turned
+# into arguments, cached per ArgsFormat
+_parse_formats = weakref.WeakKeyDictionary()
+
+
 class DefaultArgsParser(ArgsParser):
     """
     Default parser for RawArgs instances.
+
+    The tokens are read with a cursor, so the parsing time
+    is linear in the number of tokens.
     """
 
     def __init__(self):  # type: () -> None
         self._arguments = OrderedDict()
         self._options = OrderedDict()
+        self._tokens = []  # type: List[str]
+        self._position = 0
 
     def parse(
         self, args, fmt, lenient=False
     ):  # type: (RawArgs, ArgsFormat, bool) -> Args
         self._arguments = OrderedDict()
 
-        arguments = OrderedDict()
-        command_names = OrderedDict()
-        i = 1
-        for j, command_name in enumerate(fmt.get_command_names()):
-            arg_name = "cmd{}{}".format(j + 1, i)
-            while fmt.has_argument(arg_name):
-                i += 1
-                arg_name = "cmd{}{}".format(j + 1, i)
-
-            arguments[arg_name] = Argument(arg_name, Argument.REQUIRED)
-            command_names[arg_name] = command_name
-
-        arguments.update(fmt.get_arguments())
-
-        _fmt = ArgsFormat(
-            fmt.get_command_names()
-            + list(arguments.values())
-            + list(fmt.get_options().values())
-        )
+        arguments, command_names, _fmt = self._get_parse_format(fmt)
 
         try:
             self._parse(args, _fmt, lenient)
@@ -55,10 +51,12 @@ class DefaultArgsParser(ArgsParser):
 
         self._insert_missing_command_names(arguments, command_names, lenient)
 
+        self._insert_streamed_values(args, fmt, arguments, lenient)
+
         # Validate
         missing_arguments = [
             arg.name
-            for arg in _fmt.get_arguments().values()
+            for arg in arguments.values()
             if arg.name not in self._arguments and arg.is_required()
         ]
         if missing_arguments and not lenient:
@@ -79,29 +77,99 @@ class DefaultArgsParser(ArgsParser):
 
         return parsed_args
 
+    def _insert_streamed_values(
+        self, raw_args, fmt, arguments, lenient
+    ):  # type: (RawArgs, ArgsFormat, Dict[str, Argument], bool) -> None
+        streamed_values = raw_args.streamed_values
+        if streamed_values is None:
+            return
+
+        last_argument = None
+        if arguments:
+            last_argument = list(arguments.values())[-1]
+
+        if (
+            last_argument is None
+            or not last_argument.is_multi_valued()
+            or not fmt.has_argument(last_argument.name)
+        ):
+            if lenient:
+                return
+
+            raise CannotParseArgsException(
+                "Values can only be streamed to a multi-valued argument."
+            )
+
+        # The values given on the command line come first
+        name = last_argument.name
+        self._arguments[name] = itertools.chain(
+            self._arguments.get(name, []), streamed_values
+        )
+
+    def _get_parse_format(
+        self, fmt
+    ):  # type: (ArgsFormat) -> Tuple[Dict[str, Argument], Dict[str, CommandName], ArgsFormat]
+        if fmt in _parse_formats:
+            return _parse_formats[fmt]
+
+        arguments = OrderedDict()
+        command_names = OrderedDict()
+        i = 1
+        for j, command_name in enumerate(fmt.get_command_names()):
+            arg_name = "cmd{}{}".format(j + 1, i)
+            while fmt.has_argument(arg_name):
+                i += 1
+                arg_name = "cmd{}{}".format(j + 1, i)
+
+            arguments[arg_name] = Argument(arg_name, Argument.REQUIRED)
+            command_names[arg_name] = command_name
+
+        arguments.update(fmt.get_arguments())
+
+        _fmt = ArgsFormat(
+            fmt.get_command_names()
+            + list(arguments.values())
+            + list(fmt.get_options().values())
+        )
+
+        _parse_formats[fmt] = arguments, command_names, _fmt
+
+        return arguments, command_names, _fmt
+
     def _parse(
         self, raw_args, fmt, lenient
     ):  # type: (RawArgs, ArgsFormat, bool) -> None
-        tokens = raw_args.tokens[:]
+        self._tokens = tokens = raw_args.tokens
+        self._position = 0
 
         parse_options = True
-        while True:
-            try:
-                token = tokens.pop(0)
-            except IndexError:
-                break
+        while self._position < len(tokens):
+            token = tokens[self._position]
+            self._position += 1
 
             if parse_options and token == "":
                 self._parse_argument(token, fmt, lenient)
             elif parse_options and token == "--":
                 parse_options = False
-            elif parse_options and token.find("--") == 0:
-                self._parse_long_option(token, tokens, fmt, lenient)
+            elif parse_options and token.startswith("--"):
+                self._parse_long_option(token, fmt, lenient)
             elif parse_options and token[0] == "-" and token != "-":
-                self._parse_short_option(token, tokens, fmt, lenient)
+                self._parse_short_option(token, fmt, lenient)
             else:
                 self._parse_argument(token, fmt, lenient)
 
+    def _next_token(self):  # type: () -> Optional[str]
+        if self._position >= len(self._tokens):
+            return
+
+        token = self._tokens[self._position]
+        self._position += 1
+
+        return token
+
+    def _has_next_token(self):  # type: () -> bool
+        return self._position < len(self._tokens)
+
     def _insert_missing_command_names(
         self, arguments, command_names, lenient=False
     ):  # type: (Dict[str, Argument], Dict[str, CommandName], bool) -> None
@@ -223,79 +291,72 @@ class DefaultArgsParser(ArgsParser):
                 raise CannotParseArgsException.too_many_arguments()
 
     def _parse_long_option(
-        self, token, tokens, fmt, lenient
-    ):  # type: (str, List[str], ArgsFormat, bool) -> None
+        self, token, fmt, lenient
+    ):  # type: (str, ArgsFormat, bool) -> None
         name = token[2:]
         pos = name.find("=")
         if pos != -1:
-            self._add_long_option(name[:pos], name[pos + 1 :], tokens, fmt, lenient)
+            self._add_long_option(name[:pos], name[pos + 1 :], fmt, lenient)
         else:
             if fmt.has_option(name) and fmt.get_option(name).accepts_value():
-                try:
-                    value = tokens.pop(0)
-                except IndexError:
-                    value = None
+                value = self._next_token()
 
                 if value and value.startswith("-"):
-                    tokens.insert(0, value)
+                    self._position -= 1
                     value = None
 
-                self._add_long_option(name, value, tokens, fmt, lenient)
+                self._add_long_option(name, value, fmt, lenient)
             else:
-                self._add_long_option(name, None, tokens, fmt, lenient)
+                self._add_long_option(name, None, fmt, lenient)
 
     def _parse_short_option(
-        self, token, tokens, fmt, lenient
-    ):  # type: (str, List[str], ArgsFormat, bool) -> None
+        self, token, fmt, lenient
+    ):  # type: (str, ArgsFormat, bool) -> None
         name = token[1:]
         if len(name) > 1:
             if fmt.has_option(name[0]) and fmt.get_option(name[0]).accepts_value():
                 # an option with a value (with no space)
-                self._add_short_option(name[0], name[1:], tokens, fmt, lenient)
+                self._add_short_option(name[0], name[1:], fmt, lenient)
             else:
-                self._parse_short_option_set(name, tokens, fmt, lenient)
+                self._parse_short_option_set(name, fmt, lenient)
         else:
             if fmt.has_option(name[0]) and fmt.get_option(name[0]).accepts_value():
-                try:
-                    value = tokens.pop(0)
-                except IndexError:
-                    value = None
+                value = self._next_token()
 
                 if value and value.startswith("-"):
-                    tokens.insert(0, value)
+                    self._position -= 1
                     value = None
 
-                self._add_short_option(name, value, tokens, fmt, lenient)
+                self._add_short_option(name, value, fmt, lenient)
             else:
-                self._add_short_option(name, None, tokens, fmt, lenient)
+                self._add_short_option(name, None, fmt, lenient)
 
     def _parse_short_option_set(
-        self, name, tokens, fmt, lenient
-    ):  # type: (str, List[str], ArgsFormat, bool) -> None
+        self, name, fmt, lenient
+    ):  # type: (str, ArgsFormat, bool) -> None
         length = len(name)
         for i in range(0, length):
             if not fmt.has_option(name[i]):
-                raise NoSuchOptionException(name[i])
+                raise NoSuchOptionException.name_not_found(name[i], fmt)
 
             option = fmt.get_option(name[i])
             if option.accepts_value():
                 self._add_long_option(
                     option.long_name,
                     None if length - 1 == i else name[i + 1 :],
-                    tokens,
                     fmt,
                     lenient,
                 )
 
                 break
             else:
-                self._add_long_option(option.long_name, None, tokens, fmt, lenient)
+                self._add_long_option(option.long_name, None, fmt, lenient)
 
     def _add_long_option(
-        self, name, value, tokens, fmt, lenient
-    ):  # type: (str, Optional[str], List[str], ArgsFormat, bool) -> None
+        self, name, value, fmt, lenient
+    ):  # type: (str, Optional[str], ArgsFormat, bool) -> None
         if not fmt.has_option(name):
-            raise NoSuchOptionException(name)
+            raise NoSuchOptionException.name_not_found(name, fmt)
 
         option = fmt.get_option(name)
 
@@ -305,20 +366,17 @@ class DefaultArgsParser(ArgsParser):
         if value is not None and not option.accepts_value():
             raise CannotParseArgsException.option_does_not_accept_value(name)
 
-        if value is None and option.accepts_value() and len(tokens):
+        if value is None and option.accepts_value() and self._has_next_token():
             # if option accepts an optional or mandatory argument
             # let's see if there is one provided
-            try:
-                nxt = tokens.pop(0)
-            except IndexError:
-                nxt = None
+            nxt = self._next_token()
 
             if nxt and len(nxt) >= 1 and nxt[0] != "-":
                 value = nxt
             elif not nxt:
                 value = ""
             else:
-                tokens.insert(0, nxt)
+                self._position -= 1
 
         # This test is here to handle cases like --foo=
         # and foo option value is optional
@@ -341,11 +399,9 @@ class DefaultArgsParser(ArgsParser):
             self._options[name] = value
 
     def _add_short_option(
-        self, name, value, tokens, fmt, lenient
-    ):  # type: (str, Optional[str], List[str], ArgsFormat, bool) -> None
+        self, name, value, fmt, lenient
+    ):  # type: (str, Optional[str], ArgsFormat, bool) -> None
         if not fmt.has_option(name):
-            raise NoSuchOptionException(name)
+            raise NoSuchOptionException.name_not_found(name, fmt)
 
-        self._add_long_option(
-            fmt.get_option(name).long_name, value, tokens, fmt, lenient
-        )
+        self._add_long_option(fmt.get_option(name).long_name, value, fmt, lenient)
@@ -0,0 +1,51 @@
+import itertools
+
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from clikit.api.args import RawArgs
+
+
+class ExpandedArgs(RawArgs):
+    """
+    Console arguments whose abbreviated command names were expanded.
+
+    The tokens are a copy of the tokens of the original arguments with
+    the full command names. The original arguments are left untouched.
+    """
+
+    def __init__(self, args, tokens):  # type: (RawArgs, List[str]) -> None
+        self._args = args
+        self._tokens = tokens
+        self._option_tokens = list(itertools.takewhile(lambda arg: arg != "--", tokens))
+
+    @property
+    def script_name(self):  # type: () -> Optional[str]
+        return self._args.script_name
+
+    @property
+    def tokens(self):  # type: () -> List[str]
+        return self._tokens
+
+    @property
+    def option_tokens(self):  # type: () -> List[str]
+        return self._option_tokens
+
+    @property
+    def streamed_values(self):  # type: () -> Optional[Iterator[str]]
+        return self._args.streamed_values
+
+    def has_token(self, token):  # type: (str) -> bool
+        return token in self._tokens
+
+    def has_option_token(self, token):  # type: (str) -> bool
+        return token in self._option_tokens
+
+    def to_string(self, script_name=True):  # type: (bool) -> str
+        string = " ".join(self._tokens)
+
+        if script_name and self.script_name:
+            string = self.script_name.lstrip() + " " + string
+
+        return string
@@ -0,0 +1,62 @@
+import io
+import sys
+
+from typing import IO
+from typing import Iterator
+
+from clikit.utils._compat import PY2
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def read_values(
+    stream, delimiter, chunk_size=CHUNK_SIZE
+):  # type: (IO[bytes], bytes, int) -> Iterator[str]
+    """
+    Yields the delimited values of a binary stream.
+
+    The stream is read by chunks so that only one chunk and one value
+    are held in memory at a time. Empty values are skipped and
+    newline delimited values may end with a carriage return.
+    """
+    strip = b"\r" if delimiter == b"\n" else b""
+    encoding = sys.getfilesystemencoding() or "utf-8"
+    errors = "strict" if PY2 else "surrogateescape"
+    pending = b""
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        values = (pending + chunk).split(delimiter)
+        pending = values.pop()
+
+        for value in values:
+            value = value.rstrip(strip)
+            if value:
+                yield value.decode(encoding, errors)
+
+    pending = pending.rstrip(strip)
+    if pending:
+        yield pending.decode(encoding, errors)
+
+
+def read_source(path, delimiter):  # type: (str, bytes) -> Iterator[str]
+    """
+    Yields the values of a file, or of the standard input if the path is "-".
+
+    Nothing is read until the first value is requested.
+    """
+    if path == "-":
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+
+        for value in read_values(stdin, delimiter):
+            yield value
+
+        return
+
+    with io.open(path, "rb") as f:
+        for value in read_values(f, delimiter):
+            yield value
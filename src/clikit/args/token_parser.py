@@ -1,117 +1,91 @@
+import re
+
 from typing import List
-from typing import Optional
+
+
+# Outside of quotes, the string is split into runs of whitespace, runs of
+# characters and quoted strings containing neither quotes nor backslashes,
+# escape sequences and quotes
+_PIECE = re.compile(
+    r"""(\s+)|((?:[^\s\\'"]+|'[^'"\\]*'|"[^'"\\]*")+)|\\(.)?|(['"])""",
+    re.DOTALL | re.UNICODE,
+)
+
+# Inside quotes, whitespace is kept
+_QUOTED_PIECE = re.compile(r"""([^\\'"]+)|\\(.)?|(['"])""", re.DOTALL | re.UNICODE)
 
 
 class TokenParser(object):
     """
     Parses tokens from a string passed to StringArgs.
-    """
-
-    def __init__(self):  # type: () -> None
-        self._string = ""  # type: str
-        self._cursor = 0  # type: int
-        self._current = None  # type: Optional[str]
-        self._next_ = None  # type: Optional[str]
 
-    def parse(self, string):  # type: (str) -> List[str]
-        self._string = string
-        self._cursor = 0
-        self._current = None
-        if len(string) > 0:
-            self._current = string[0]
+    Tokens are separated by whitespace. Single and double quotes group
+    characters, including whitespace, and are removed. Quotes of the other
+    kind inside a quoted string are kept, and must be closed before the
+    enclosing quote can be. A backslash escapes a quote; any other escape
+    sequence is kept as is.
 
-        self._next_ = None
-        if len(string) > 1:
-            self._next_ = string[1]
-
-        tokens = self._parse()
+    The string is scanned once, by runs of characters rather than
+    character by character.
+    """
 
-        return tokens
+    def parse(self, string):  # type: (str) -> List[str]
+        if "\\" not in string and "'" not in string and '"' not in string:
+            return string.split()
 
-    def _parse(self):  # type: () -> List[str]
         tokens = []
+        parts = []  # type: List[str]
+        quotes = []  # type: List[str]
+        in_token = False
+        position = 0
+        length = len(string)
+
+        while position < length:
+            if quotes:
+                match = _QUOTED_PIECE.match(string, position)
+                text, escaped, quote = match.group(1, 2, 3)
+                space = None
+            else:
+                match = _PIECE.match(string, position)
+                space, text, escaped, quote = match.group(1, 2, 3, 4)
 
-        while self._is_valid():
-            if self._current.isspace():
-                # Skip spaces
-                self._next()
-
-                continue
-
-            if self._is_valid():
-                tokens.append(self._parse_token())
-
-        return tokens
-
-    def _is_valid(self):  # type: () -> bool
-        return self._current is not None
-
-    def _next(self):  # type: () -> None
-        """
-        Advances the cursor to the next position.
-        """
-        if not self._is_valid():
-            return
-
-        self._cursor += 1
-        self._current = self._next_
-
-        if self._cursor + 1 < len(self._string):
-            self._next_ = self._string[self._cursor + 1]
-        else:
-            self._next_ = None
+                if text is not None:
+                    # The quotes of a run are all delimiters
+                    text = text.replace("'", "").replace('"', "")
 
-    def _parse_token(self):  # type: () -> str
-        token = ""
+            position = match.end()
 
-        while self._is_valid():
-            if self._current.isspace():
-                self._next()
+            if space is not None:
+                if in_token:
+                    tokens.append("".join(parts))
+                    parts = []
+                    in_token = False
 
-                break
+                continue
 
-            if self._current == "\\":
-                token += self._parse_escape_sequence()
-            elif self._current in ["'", '"']:
-                token += self._parse_quoted_string()
-            else:
-                token += self._current
-                self._next()
-
-        return token
-
-    def _parse_quoted_string(self):  # type: () -> str
-        string = ""
-        delimiter = self._current
-
-        # Skip first delimiter
-        self._next()
-        while self._is_valid():
-            if self._current == delimiter:
-                # Skip last delimiter
-                self._next()
-
-                break
-
-            if self._current == "\\":
-                string += self._parse_escape_sequence()
-            elif self._current == '"':
-                string += '"{}"'.format(self._parse_quoted_string())
-            elif self._current == "'":
-                string += "'{}'".format(self._parse_quoted_string())
+            in_token = True
+
+            if text is not None:
+                parts.append(text)
+            elif quote is not None:
+                if quotes and quotes[-1] == quote:
+                    quotes.pop()
+                    nested = bool(quotes)
+                else:
+                    nested = bool(quotes)
+                    quotes.append(quote)
+
+                # Only the outermost quotes are removed
+                if nested:
+                    parts.append(quote)
+            elif escaped in ("'", '"'):
+                parts.append(escaped)
             else:
-                string += self._current
-                self._next()
+                parts.append(match.group(0))
 
-        return string
+        if in_token:
+            # Unterminated nested quotes are closed
+            parts.extend(reversed(quotes[1:]))
+            tokens.append("".join(parts))
 
-    def _parse_escape_sequence(self):  # type: () -> str
-        if self._next_ in ['"', "'"]:
-            sequence = self._next_
-        else:
-            sequence = "\\" + self._next_
-
-        self._next()
-        self._next()
-
-        return sequence
+        return tokens
@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .completion_index import CompletionIndex  # noqa
+    from .provider_runner import ProviderRunner  # noqa
+    from .scripts import get_script  # noqa
+
+
+lazy_attributes(
+    globals(),
+    {
+        "CompletionIndex": ".completion_index",
+        "ProviderRunner": ".provider_runner",
+        "get_script": ".scripts",
+    },
+)
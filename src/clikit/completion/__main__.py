@@ -0,0 +1,57 @@
+"""
+Answers a completion request from a shell.
+
+    python -m clikit.completion INDEX SHELL [WORDS...]
+
+The words are the words of the command line after the program name,
+the last one being the word to complete. Only the completion index is
+loaded: the application is not built.
+"""
+import os
+import sys
+
+from .completion_index import CompletionIndex
+from .provider_runner import ProviderRunner
+
+
+def format_candidate(shell, value, description):  # type: (str, str, str) -> str
+    if not description:
+        return value
+
+    description = description.splitlines()[0]
+
+    if shell == "zsh":
+        return "{}:{}".format(value.replace(":", "\\:"), description)
+
+    if shell == "fish":
+        return "{}\t{}".format(value, description)
+
+    return value
+
+
+def main(argv=None):  # type: (...) -> int
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) < 2:
+        sys.stderr.write("Usage: python -m clikit.completion INDEX SHELL [WORDS...]\n")
+
+        return 2
+
+    index_path, shell, words = argv[0], argv[1], argv[2:]
+
+    try:
+        index = CompletionIndex.load(index_path)
+    except (IOError, OSError, ValueError):
+        return 1
+
+    runner = ProviderRunner(os.path.splitext(index_path)[0] + "-values")
+
+    for value, description in index.complete(words, runner):
+        sys.stdout.write(format_candidate(shell, value, description) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
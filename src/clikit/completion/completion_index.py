@@ -0,0 +1,317 @@
+import json
+
+from collections import OrderedDict
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+if TYPE_CHECKING:
+    from clikit.api.config import Config  # noqa
+    from clikit.api.config.application_config import ApplicationConfig  # noqa
+
+    from .provider_runner import ProviderRunner  # noqa
+
+
+class CompletionIndex(object):
+    """
+    A compact, serializable view of a command tree used to answer
+    completion queries.
+
+    The index only holds what the completion needs: the names, aliases and
+    descriptions of the commands, their options (with their short names and
+    whether they take a value), their argument slots, their default
+    commands and the import paths of the value providers. The arguments
+    of a command follow the arguments of its parents, as in its args
+    format, and those of the default commands, anonymous or not, are
+    completed when no command name was given. Answering a query neither builds the
+    application nor imports the rest of the library.
+    """
+
+    VERSION = 2
+
+    def __init__(self, root):  # type: (Dict[str, Any]) -> None
+        self._root = root
+
+    @classmethod
+    def from_config(
+        cls, config, strict=True
+    ):  # type: (ApplicationConfig, bool) -> CompletionIndex
+        """
+        Builds the index of an application configuration.
+
+        A value provider which cannot be imported by its path raises a
+        ValueError, unless strict is False, in which case the values it
+        provides are not completed.
+        """
+        root = cls._build_node(config, strict)
+        root["commands"], root["aliases"], root["defaults"] = cls._build_commands(
+            config.command_configs, strict
+        )
+
+        return cls(root)
+
+    @classmethod
+    def _build_commands(
+        cls, command_configs, strict
+    ):  # type: (List[Any], bool) -> Tuple[Dict[str, Any], Dict[str, str], List[Any]]
+        from clikit.api.config.plugin_command_config import PluginCommandConfig
+
+        commands = {}
+        aliases = {}
+        # The names of the named default commands
+        # and the nodes of the anonymous ones
+        defaults = []
+
+        for command_config in command_configs:
+            if not command_config.is_enabled():
+                continue
+
+            if isinstance(command_config, PluginCommandConfig):
+                command_config = command_config.load()
+
+            node = cls._build_node(command_config, strict)
+            node["description"] = command_config.description
+            node["hidden"] = command_config.is_hidden()
+            node["commands"], node["aliases"], node["defaults"] = cls._build_commands(
+                command_config.sub_command_configs, strict
+            )
+
+            # Empty fields are left out to keep large indexes small
+            node = {key: value for key, value in node.items() if value}
+
+            if command_config.is_anonymous():
+                defaults.append(node)
+
+                continue
+
+            commands[command_config.name] = node
+
+            if command_config.is_default():
+                defaults.append(command_config.name)
+
+            for alias in command_config.aliases:
+                aliases[alias] = command_config.name
+
+        return commands, aliases, defaults
+
+    @classmethod
+    def _build_node(cls, config, strict):  # type: (Config, bool) -> Dict[str, Any]
+        from clikit.config.command_tree_cache import get_import_path
+        from clikit.utils._compat import basestring
+
+        providers = {}
+        for name, (provider, timeout, ttl) in config.completion_providers.items():
+            path = provider
+            if not isinstance(provider, basestring):
+                path = get_import_path(provider)
+
+            if path is None:
+                if not strict:
+                    continue
+
+                raise ValueError(
+                    'The completion provider of "{}" cannot be imported.'.format(name)
+                )
+
+            providers[name] = [path, timeout, ttl]
+
+        return {
+            "options": [
+                [
+                    option.long_name,
+                    option.short_name,
+                    option.accepts_value(),
+                    option.description,
+                ]
+                for option in config.options.values()
+            ],
+            "arguments": [
+                [argument.name, argument.is_multi_valued()]
+                for argument in config.arguments.values()
+            ],
+            "providers": providers,
+        }
+
+    @classmethod
+    def load(cls, path):  # type: (str) -> CompletionIndex
+        with open(path) as f:
+            data = json.load(f)
+
+        if data.get("version") != cls.VERSION:
+            raise ValueError("Unsupported completion index version.")
+
+        return cls(data["root"])
+
+    def dump(self, path):  # type: (str) -> None
+        from clikit.utils._file import write_atomically
+
+        write_atomically(
+            path,
+            json.dumps(
+                {"version": self.VERSION, "root": self._root}, separators=(",", ":")
+            ),
+        )
+
+    def complete(
+        self, words, runner=None
+    ):  # type: (List[str], Optional[ProviderRunner]) -> List[Tuple[str, str]]
+        """
+        Returns the candidates, with their descriptions, for the last word.
+
+        The words are the words of the command line without
+        the program name, the last one being the word to complete.
+        """
+        if not words:
+            words = [""]
+
+        preceding = words[:-1]
+        current = words[-1]
+
+        nodes = [self._root]
+        options = self._collect_options(nodes)
+        position = 0
+        expected_value = None
+        after_options = False
+
+        for word in preceding:
+            if expected_value is not None:
+                expected_value = None
+            elif after_options:
+                position += 1
+            elif word == "--":
+                after_options = True
+            elif word.startswith("--"):
+                name, has_value, _ = word[2:].partition("=")
+                option = options.get(name)
+                if option is not None and option[2] and not has_value:
+                    expected_value = name
+            elif word.startswith("-") and word != "-":
+                for i, short_name in enumerate(word[1:]):
+                    option = options.get("-" + short_name)
+                    if option is None:
+                        break
+
+                    if option[2]:
+                        if i == len(word) - 2:
+                            expected_value = option[0]
+
+                        break
+            else:
+                node = nodes[-1]
+                commands = node.get("commands", {})
+                name = node.get("aliases", {}).get(word, word)
+                if position == 0 and name in commands:
+                    nodes.append(commands[name])
+                    options = self._collect_options(nodes)
+                else:
+                    position += 1
+
+        if expected_value is not None:
+            return self._provide(nodes, expected_value, preceding, current, runner)
+
+        if current.startswith("-") and not after_options:
+            return self._complete_options(options, current)
+
+        candidates = []
+        if position == 0:
+            candidates = [
+                (name, command.get("description", ""))
+                for name, command in sorted(nodes[-1].get("commands", {}).items())
+                if name.startswith(current) and not command.get("hidden")
+            ]
+
+        for branch in self._get_branches(nodes):
+            argument = self._get_argument(branch, position)
+            if argument is None:
+                continue
+
+            for candidate in self._provide(
+                branch, argument, preceding, current, runner
+            ):
+                if candidate not in candidates:
+                    candidates.append(candidate)
+
+        return candidates
+
+    def _get_branches(
+        self, nodes
+    ):  # type: (List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]
+        """
+        Returns the command paths the positional words may belong to:
+        the command itself and its default commands.
+        """
+        branches = [nodes]
+        node = nodes[-1]
+
+        for default in node.get("defaults", []):
+            if not isinstance(default, dict):
+                default = node.get("commands", {}).get(default)
+
+            if default is not None:
+                branches.append(nodes + [default])
+
+        return branches
+
+    def _collect_options(
+        self, nodes
+    ):  # type: (List[Dict[str, Any]]) -> Dict[str, List[Any]]
+        options = OrderedDict()
+        for node in nodes:
+            for option in node.get("options", []):
+                options[option[0]] = option
+                if option[1]:
+                    options["-" + option[1]] = option
+
+        return options
+
+    def _complete_options(
+        self, options, current
+    ):  # type: (Dict[str, List[Any]], str) -> List[Tuple[str, str]]
+        # Short names are only suggested for a lone dash
+        return [
+            (name if name.startswith("-") else "--" + name, option[3] or "")
+            for name, option in options.items()
+            if (current == "-" or not name.startswith("-"))
+            and ("--" + name).startswith(current)
+        ]
+
+    def _get_argument(
+        self, nodes, position
+    ):  # type: (List[Dict[str, Any]], int) -> Optional[str]
+        # The arguments of a command follow the ones of its base formats
+        arguments = [
+            argument for node in nodes for argument in node.get("arguments", [])
+        ]
+        if not arguments:
+            return
+
+        if position < len(arguments):
+            return arguments[position][0]
+
+        if arguments[-1][1]:
+            return arguments[-1][0]
+
+        return
+
+    def _provide(
+        self, nodes, name, preceding, current, runner
+    ):  # type: (List[Dict[str, Any]], str, List[str], str, Optional[ProviderRunner]) -> List[Tuple[str, str]]
+        if runner is None:
+            return []
+
+        for node in reversed(nodes):
+            provider = node.get("providers", {}).get(name)
+            if provider is not None:
+                break
+        else:
+            return []
+
+        path, timeout, ttl = provider
+        values = runner.run(path, preceding, timeout=timeout, ttl=ttl)
+
+        return [(value, "") for value in values if value.startswith(current)]
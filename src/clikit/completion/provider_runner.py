@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from typing import List
+from typing import Optional
+
+
+class ProviderRunner(object):
+    """
+    Runs the value providers used by the completion.
+
+    Each completion request runs in a new process so the results are cached
+    on disk, per provider and per preceding words. A provider that does not
+    answer in time is abandoned: the stale cached results, if any,
+    are used instead.
+    """
+
+    DEFAULT_TIMEOUT = 0.5
+    DEFAULT_TTL = 60
+
+    def __init__(self, cache_dir=None):  # type: (Optional[str]) -> None
+        self._cache_dir = cache_dir
+
+    def run(
+        self, path, words, timeout=None, ttl=None
+    ):  # type: (str, List[str], Optional[float], Optional[int]) -> List[str]
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+
+        if ttl is None:
+            ttl = self.DEFAULT_TTL
+
+        cache_path = self._get_cache_path(path, words)
+        cached = self._read(cache_path)
+        if cached is not None and time.time() - cached[0] < ttl:
+            return cached[1]
+
+        values = self._call(path, words, timeout)
+        if values is None:
+            return cached[1] if cached is not None else []
+
+        self._write(cache_path, values)
+
+        return values
+
+    def _call(
+        self, path, words, timeout
+    ):  # type: (str, List[str], float) -> Optional[List[str]]
+        results = []
+
+        def target():
+            from clikit.utils._import import import_object
+
+            try:
+                results.append([str(value) for value in import_object(path)(words)])
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=target)
+        # The process exits right after answering:
+        # a provider still running must not keep it alive.
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout)
+
+        if not results:
+            return
+
+        return results[0]
+
+    def _get_cache_path(self, path, words):  # type: (str, List[str]) -> Optional[str]
+        if self._cache_dir is None:
+            return
+
+        key = hashlib.sha1(json.dumps([path, words]).encode("utf-8")).hexdigest()
+
+        return os.path.join(self._cache_dir, key + ".json")
+
+    def _read(self, cache_path):  # type: (Optional[str]) -> Optional[List]
+        if cache_path is None:
+            return
+
+        try:
+            with open(cache_path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+
+    def _write(self, cache_path, values):  # type: (Optional[str], List[str]) -> None
+        if cache_path is None:
+            return
+
+        from clikit.utils._file import write_atomically
+
+        try:
+            write_atomically(cache_path, json.dumps([time.time(), values]))
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,74 @@
+import re
+import sys
+
+from typing import Optional
+
+
+try:
+    from shlex import quote
+except ImportError:
+    from pipes import quote
+
+
+BASH = """\
+_{function}()
+{{
+    local IFS=$'\\n'
+    COMPREPLY=($({command} bash "${{COMP_WORDS[@]:1:$COMP_CWORD}}" 2>/dev/null))
+}}
+
+complete -o default -F _{function} {program}
+"""
+
+ZSH = """\
+#compdef {program}
+
+_{function}()
+{{
+    local -a candidates
+    candidates=("${{(@f)$({command} zsh "${{(@)words[2,$CURRENT]}}" 2>/dev/null)}}")
+    _describe '{program}' candidates
+}}
+
+compdef _{function} {program}
+"""
+
+FISH = """\
+function __{function}_complete
+    set -l words (commandline -opc)
+    set -l current (commandline -ct)
+    {command} fish $words[2..-1] "$current" 2>/dev/null
+end
+
+complete -c {program} -f -a '(__{function}_complete)'
+"""
+
+SCRIPTS = {"bash": BASH, "zsh": ZSH, "fish": FISH}
+
+
+def get_script(
+    shell, program, index_path, python=None
+):  # type: (str, str, str, Optional[str]) -> str
+    """
+    Returns the script enabling the completion of a program for a shell.
+
+    The script calls the completion entry point with the index of
+    the program instead of running the program itself.
+    """
+    if shell not in SCRIPTS:
+        raise ValueError(
+            'Unsupported shell "{}". Supported shells: {}'.format(
+                shell, ", ".join(sorted(SCRIPTS))
+            )
+        )
+
+    if python is None:
+        python = sys.executable
+
+    command = "{} -m clikit.completion {}".format(quote(python), quote(index_path))
+
+    return SCRIPTS[shell].format(
+        function=re.sub(r"[^A-Za-z0-9_]", "_", program),
+        program=program,
+        command=command,
+    )
@@ -1 +1,19 @@
-from .default_application_config import DefaultApplicationConfig
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .command_tree_cache import CommandTreeCache  # noqa
+    from .default_application_config import DefaultApplicationConfig  # noqa
+    from .plugin_index import PluginIndex  # noqa
+
+
+lazy_attributes(
+    globals(),
+    {
+        "CommandTreeCache": ".command_tree_cache",
+        "DefaultApplicationConfig": ".default_application_config",
+        "PluginIndex": ".plugin_index",
+    },
+)
@@ -0,0 +1,305 @@
+import json
+import os
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from clikit.api.config.command_config import CommandConfig
+from clikit.utils._compat import basestring
+from clikit.utils._file import write_atomically
+from clikit.utils._import import import_object
+
+
+class HandlerImporter(object):
+    """
+    A handler factory that imports its target on first use.
+    """
+
+    def __init__(self, path):  # type: (str) -> None
+        self._path = path
+        self._target = None
+
+    @property
+    def path(self):  # type: () -> str
+        return self._path
+
+    def __call__(self):  # type: () -> Any
+        if self._target is None:
+            self._target = import_object(self._path)
+
+        return self._target()
+
+
+def get_import_path(obj):  # type: (Any) -> Optional[str]
+    """
+    Returns the "module:qualified.name" path of an object
+    or None if it cannot be imported back.
+    """
+    if isinstance(obj, HandlerImporter):
+        return obj.path
+
+    module_name = getattr(obj, "__module__", None)
+    name = getattr(obj, "__qualname__", getattr(obj, "__name__", None))
+    if not module_name or not name or "<" in name:
+        return
+
+    path = "{}:{}".format(module_name, name)
+
+    try:
+        if import_object(path) is not obj:
+            return
+    except (ImportError, AttributeError):
+        return
+
+    return path
+
+
+class UncacheableCommandException(Exception):
+    pass
+
+
+class CommandTreeCache(object):
+    """
+    Stores a compiled command tree on disk.
+
+    The cache holds everything needed to rebuild the command configurations
+    (names, aliases, flags, options, arguments, defaults, descriptions and
+    handler import paths) without executing the configuration code.
+    Only handlers given as importable callables (for instance a handler
+    class) can be cached.
+
+    Loading the cache saves the configuration code only: the options and
+    arguments are still added to the rebuilt configurations one by one.
+    """
+
+    VERSION = 3
+
+    # Marks tuples, which JSON would turn into lists
+    TUPLE_KEY = "__tuple__"
+
+    def __init__(self, cache_dir, name="commands"):  # type: (str, str) -> None
+        self._cache_dir = cache_dir
+        self._name = name
+
+    @property
+    def path(self):  # type: () -> str
+        return os.path.join(self._cache_dir, "{}.json".format(self._name))
+
+    def load(self, key):  # type: (str) -> Optional[List[CommandConfig]]
+        """
+        Returns the cached command configurations
+        or None if the cache is missing, stale or invalid.
+        """
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+
+            if data["version"] != self.VERSION or data["key"] != key:
+                return
+
+            return [self._unserialize(command) for command in data["commands"]]
+        except Exception:
+            return
+
+    def dump(self, key, command_configs):  # type: (str, List[CommandConfig]) -> bool
+        """
+        Writes the given command configurations to the cache.
+
+        Returns False and removes any stale cache
+        if a configuration cannot be cached.
+        """
+        try:
+            data = {
+                "version": self.VERSION,
+                "key": key,
+                "commands": [self._serialize(config) for config in command_configs],
+            }
+            content = json.dumps(data, separators=(",", ":"))
+        except (UncacheableCommandException, TypeError, ValueError):
+            self.clear()
+
+            return False
+
+        try:
+            write_atomically(self.path, content)
+        except (IOError, OSError):
+            # The cache is an optimization: an unwritable
+            # cache directory must not prevent the application from running.
+            return False
+
+        return True
+
+    def clear(self):  # type: () -> None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _serialize(self, config):  # type: (CommandConfig) -> Dict[str, Any]
+        if type(config) is not CommandConfig:
+            raise UncacheableCommandException(
+                'The command "{}" uses a custom configuration class.'.format(
+                    config.name
+                )
+            )
+
+        if config._args_parser is not None:
+            raise UncacheableCommandException(
+                'The command "{}" uses a custom args parser.'.format(config.name)
+            )
+
+        return {
+            "name": config.name,
+            "aliases": config.aliases,
+            "description": config.description,
+            "help": config.help,
+            "enabled": config.is_enabled(),
+            "hidden": config.is_hidden(),
+            "process_title": config.process_title,
+            "default": config._default,
+            "anonymous": config._anonymous,
+            "lenient": config._lenient_args_parsing,
+            "handler": self._serialize_handler(config),
+            "handler_method": config._handler_method,
+            "completion_providers": self._serialize_completion_providers(config),
+            "options": [
+                [
+                    option.long_name,
+                    option.short_name,
+                    option.flags,
+                    option.description,
+                    self._serialize_value(option.default),
+                    option.value_name,
+                ]
+                for option in config.options.values()
+            ],
+            "arguments": [
+                [
+                    argument.name,
+                    argument.flags,
+                    argument.description,
+                    self._serialize_value(argument.default),
+                ]
+                for argument in config.arguments.values()
+            ],
+            "sub_commands": [
+                self._serialize(sub_config) for sub_config in config.sub_command_configs
+            ],
+        }
+
+    def _serialize_value(self, value):  # type: (Any) -> Any
+        if isinstance(value, tuple):
+            return {self.TUPLE_KEY: [self._serialize_value(item) for item in value]}
+
+        if isinstance(value, list):
+            return [self._serialize_value(item) for item in value]
+
+        if isinstance(value, dict):
+            if self.TUPLE_KEY in value:
+                raise UncacheableCommandException(
+                    'A default value uses the reserved key "{}".'.format(self.TUPLE_KEY)
+                )
+
+            return {key: self._serialize_value(item) for key, item in value.items()}
+
+        return value
+
+    def _serialize_handler(self, config):  # type: (CommandConfig) -> Optional[str]
+        handler = config._handler
+        if handler is None:
+            return
+
+        path = get_import_path(handler) if callable(handler) else None
+        if path is None:
+            raise UncacheableCommandException(
+                'The handler of the command "{}" cannot be imported.'.format(
+                    config.name
+                )
+            )
+
+        return path
+
+    def _serialize_completion_providers(
+        self, config
+    ):  # type: (CommandConfig) -> Dict[str, List[Any]]
+        providers = {}
+        for name, (provider, timeout, ttl) in config.completion_providers.items():
+            path = provider
+            if not isinstance(provider, basestring):
+                path = get_import_path(provider)
+
+            if path is None:
+                raise UncacheableCommandException(
+                    'The completion provider of "{}" in the command "{}" '
+                    "cannot be imported.".format(name, config.name)
+                )
+
+            providers[name] = [path, timeout, ttl]
+
+        return providers
+
+    def _unserialize(self, data):  # type: (Dict[str, Any]) -> CommandConfig
+        config = CommandConfig(data["name"])
+        config.set_aliases(data["aliases"])
+        config.set_description(data["description"])
+        config.set_help(data["help"])
+        config.hide(data["hidden"])
+        config.set_process_title(data["process_title"])
+
+        if data["anonymous"]:
+            config.anonymous()
+        elif data["default"] is not None:
+            config.default(data["default"])
+
+        if data["lenient"] is True:
+            config.enable_lenient_args_parsing()
+        elif data["lenient"] is False:
+            config.disable_lenient_args_parsing()
+
+        if not data["enabled"]:
+            config.disable()
+
+        if data["handler"] is not None:
+            config.set_handler(HandlerImporter(data["handler"]))
+
+        if data["handler_method"] is not None:
+            config.set_handler_method(data["handler_method"])
+
+        for name, (provider, timeout, ttl) in data["completion_providers"].items():
+            config.set_completion_provider(name, provider, timeout, ttl)
+
+        for long_name, short_name, flags, description, default, value_name in data[
+            "options"
+        ]:
+            config.add_option(
+                long_name,
+                short_name,
+                flags,
+                description,
+                self._unserialize_value(default),
+                value_name,
+            )
+
+        for name, flags, description, default in data["arguments"]:
+            config.add_argument(
+                name, flags, description, self._unserialize_value(default)
+            )
+
+        for sub_command in data["sub_commands"]:
+            config.add_sub_command_config(self._unserialize(sub_command))
+
+        return config
+
+    def _unserialize_value(self, value):  # type: (Any) -> Any
+        if isinstance(value, list):
+            return [self._unserialize_value(item) for item in value]
+
+        if isinstance(value, dict):
+            if self.TUPLE_KEY in value:
+                return tuple(
+                    self._unserialize_value(item) for item in value[self.TUPLE_KEY]
+                )
+
+            return {key: self._unserialize_value(item) for key, item in value.items()}
+
+        return value
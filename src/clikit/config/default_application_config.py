@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from clikit.api.args.args import Args
 from clikit.api.args.format.argument import Argument
 from clikit.api.args.format.option import Option
 from clikit.api.args.raw_args import RawArgs
@@ -28,7 +29,6 @@ from clikit.io.output_stream import ErrorOutputStream
 from clikit.io.output_stream import StandardOutputStream
 from clikit.resolver.default_resolver import DefaultResolver
 from clikit.resolver.help_resolver import HelpResolver
-from clikit.ui.components import NameVersion
 
 
 if TYPE_CHECKING:
@@ -95,9 +95,12 @@ class DefaultApplicationConfig(ApplicationConfig):
 
         style_set = application.config.style_set
 
-        if args.has_option_token("--no-ansi"):
+        flags = args.global_flags
+        decorated = flags.decorated
+
+        if decorated is False:
             output_formatter = error_formatter = PlainFormatter(style_set)
-        elif args.has_option_token("--ansi"):
+        elif decorated:
             output_formatter = error_formatter = AnsiFormatter(style_set, True)
         else:
             if output_stream.supports_ansi():
@@ -116,17 +119,17 @@ class DefaultApplicationConfig(ApplicationConfig):
             Output(error_stream, error_formatter),
         )
 
-        if args.has_option_token("-vvv") or self.is_debug():
+        if flags.verbosity == 3 or self.is_debug():
             io.set_verbosity(DEBUG)
-        elif args.has_option_token("-vv"):
+        elif flags.verbosity == 2:
             io.set_verbosity(VERY_VERBOSE)
-        elif args.has_option_token("-v"):
+        elif flags.verbosity == 1:
             io.set_verbosity(VERBOSE)
 
-        if args.has_option_token("--quiet") or args.has_option_token("-q"):
+        if flags.quiet:
             io.set_quiet(True)
 
-        if args.has_option_token("--no-interaction") or args.has_option_token("-n"):
+        if flags.no_interaction:
             io.set_interactive(False)
 
         return io
@@ -147,21 +150,39 @@ class DefaultApplicationConfig(ApplicationConfig):
         self, event, event_name, dispatcher
     ):  # type: (PreResolveEvent, str, EventDispatcher) -> None
         args = event.raw_args
+        flags = args.global_flags
         application = event.application
 
-        if args.has_option_token("-h") or args.has_option_token("--help"):
-            command = application.get_command("help")
+        if not flags.help:
+            # Other tokens are resolved as usual, so that an unknown
+            # command is still reported
+            if not flags.version or not flags.only_flags:
+                return
+
+            if not application.has_command("help"):
+                return
+
+        command = application.get_command("help")
 
+        if flags.only_flags:
+            # The version and the help of the application need no argument:
+            # there is nothing to resolve or parse.
+            parsed_args = Args(command.args_format, args)
+            if flags.version:
+                parsed_args.set_option("version")
+        else:
             # Enable lenient parsing
             parsed_args = command.parse(args, True)
 
-            event.set_resolved_command(ResolvedCommand(command, parsed_args))
-            event.stop_propagation()
+        event.set_resolved_command(ResolvedCommand(command, parsed_args))
+        event.stop_propagation()
 
     def print_version(
         self, event, event_name, dispatcher
     ):  # type: (PreHandleEvent, str, EventDispatcher) -> None
         if event.args.is_option_set("version"):
+            from clikit.ui.components.name_version import NameVersion
+
             version = NameVersion(event.command.application.config)
             version.render(event.io)
 
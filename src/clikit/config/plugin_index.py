@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import sys
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from clikit.api.config.command_config import CommandConfig
+from clikit.api.config.plugin_command_config import PluginCommandConfig
+from clikit.utils._file import write_atomically
+from clikit.utils._import import import_object
+
+
+def iter_entry_points(group):  # type: (str) -> List[Tuple[str, str]]
+    """
+    Returns the name and "module:name" path of the entry points of a group.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            import pkg_resources
+        except ImportError:
+            return []
+
+        return [
+            (
+                entry_point.name,
+                "{}:{}".format(entry_point.module_name, ".".join(entry_point.attrs)),
+            )
+            for entry_point in pkg_resources.iter_entry_points(group)
+        ]
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        group_entry_points = all_entry_points.select(group=group)
+    else:
+        group_entry_points = all_entry_points.get(group, [])
+
+    return [
+        # Extras, if any, are not part of the import path
+        (entry_point.name, entry_point.value.split("[")[0].strip())
+        for entry_point in group_entry_points
+    ]
+
+
+def load_entry_point(path):  # type: (str) -> List[CommandConfig]
+    """
+    Imports a plugin entry point and returns the command configurations
+    it provides.
+
+    The entry point is either a command configuration, a list of them
+    or a callable returning one or a list of them.
+    """
+    target = import_object(path)
+
+    if not isinstance(target, (CommandConfig, list, tuple)) and callable(target):
+        target = target()
+
+    if isinstance(target, CommandConfig):
+        return [target]
+
+    return list(target)
+
+
+class PluginIndex(object):
+    """
+    Stores the commands provided by the plugins of an entry point group.
+
+    Building the index imports every plugin. The index records the name,
+    aliases, description and visibility of each command along with its
+    entry point, so that later runs can register placeholders
+    without importing any plugin.
+    """
+
+    VERSION = 1
+
+    def __init__(self, group, cache_dir=None):  # type: (str, Optional[str]) -> None
+        self._group = group
+        self._cache_dir = cache_dir
+
+    @property
+    def path(self):  # type: () -> Optional[str]
+        if self._cache_dir is None:
+            return
+
+        return os.path.join(
+            self._cache_dir, "plugins-{}.json".format(self._group.replace(os.sep, "_"))
+        )
+
+    @property
+    def key(self):  # type: () -> str
+        """
+        Returns a key changing whenever distributions are installed
+        or removed.
+
+        Installing or removing a distribution changes the modification time
+        of the directory it is installed in, so it is enough to look at
+        the directories of the import path instead of scanning
+        the distributions metadata.
+        """
+        hasher = hashlib.sha1(self._group.encode())
+
+        for path in sys.path:
+            try:
+                mtime = os.stat(path or os.curdir).st_mtime
+            except OSError:
+                continue
+
+            hasher.update("{}:{}\n".format(path, mtime).encode())
+
+        return hasher.hexdigest()
+
+    def get_command_configs(self):  # type: () -> List[PluginCommandConfig]
+        """
+        Returns the placeholders of the commands provided by the plugins,
+        from the cache if it is up to date.
+        """
+        key = self.key
+
+        commands = self.load(key)
+        if commands is None:
+            commands = self.build()
+            self.dump(key, commands)
+
+        return [self._create_config(command) for command in commands]
+
+    def build(self):  # type: () -> List[Dict[str, Any]]
+        commands = []
+
+        for _, path in iter_entry_points(self._group):
+            for config in load_entry_point(path):
+                commands.append(
+                    {
+                        "name": config.name,
+                        "aliases": config.aliases,
+                        "description": config.description,
+                        "hidden": config.is_hidden(),
+                        "entry_point": path,
+                    }
+                )
+
+        return commands
+
+    def load(self, key):  # type: (str) -> Optional[List[Dict[str, Any]]]
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+
+            if data["version"] != self.VERSION or data["key"] != key:
+                return
+
+            return data["commands"]
+        except Exception:
+            return
+
+    def dump(self, key, commands):  # type: (str, List[Dict[str, Any]]) -> bool
+        if self.path is None:
+            return False
+
+        content = json.dumps(
+            {"version": self.VERSION, "key": key, "commands": commands},
+            separators=(",", ":"),
+        )
+
+        try:
+            write_atomically(self.path, content)
+        except (IOError, OSError):
+            return False
+
+        return True
+
+    def _create_config(self, command):  # type: (Dict[str, Any]) -> PluginCommandConfig
+        config = PluginCommandConfig(command["name"], command["entry_point"])
+        config.set_aliases(command["aliases"])
+        config.set_description(command["description"])
+        config.hide(command["hidden"])
+
+        return config
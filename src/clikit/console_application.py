@@ -1,15 +1,21 @@
 import sys
 
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import List
 from typing import Optional
 
 from .api.application import Application as BaseApplication
+from .api.args.exceptions import CannotParseArgsException
 from .api.args.format.args_format import ArgsFormat
 from .api.args.raw_args import RawArgs
 from .api.command import Command
 from .api.command import CommandCollection
+from .api.command import LazyCommand
 from .api.command.exceptions import CannotAddCommandException
 from .api.config.application_config import ApplicationConfig
 from .api.config.command_config import CommandConfig
+from .api.config.plugin_command_config import PluginCommandConfig
 from .api.event import CONFIG
 from .api.event import PRE_RESOLVE
 from .api.event import ConfigEvent
@@ -21,8 +27,13 @@ from .api.io import OutputStream
 from .api.io.flags import VERY_VERBOSE
 from .api.resolver.resolved_command import ResolvedCommand
 from .args.argv_args import ArgvArgs
+from .args.string_args import StringArgs
 from .io import ConsoleIO
-from .ui.components.exception_trace import ExceptionTrace
+
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop  # noqa
+    from threading import Thread  # noqa
 
 
 class ConsoleApplication(BaseApplication):
@@ -30,6 +41,9 @@ class ConsoleApplication(BaseApplication):
     A console application
     """
 
+    BATCH = "--batch"
+    STOP_ON_FAILURE = "--stop-on-failure"
+
     def __init__(self, config):  # type: (ApplicationConfig) -> None
         self._preliminary_io = ConsoleIO()
 
@@ -37,6 +51,8 @@ class ConsoleApplication(BaseApplication):
         self._preliminary_io.set_verbosity(VERY_VERBOSE)
 
         self._dispatcher = None
+        self._event_loop = None  # type: Optional[AbstractEventLoop]
+        self._event_loop_thread = None  # type: Optional[Thread]
 
         try:
             dispatcher = config.dispatcher
@@ -58,6 +74,8 @@ class ConsoleApplication(BaseApplication):
             if not config.is_exception_caught():
                 raise
 
+            from .ui.components.exception_trace import ExceptionTrace
+
             # Render the trace to the preliminary IO
             trace = ExceptionTrace(e)
             trace.render(self._preliminary_io)
@@ -100,6 +118,40 @@ class ConsoleApplication(BaseApplication):
     def has_default_commands(self):  # type: () -> bool
         return not self._default_commands.is_empty()
 
+    @property
+    def event_loop(self):  # type: () -> Optional[AbstractEventLoop]
+        """
+        The event loop running the handlers which are coroutines.
+
+        It is created on first use and kept for the lifetime of the
+        application, so that the resources bound to it can be shared
+        by the commands run one after the other.
+
+        The loop belongs to the thread which created or set it. In other
+        threads, this is None and coroutine handlers run on a loop of
+        their own.
+        """
+        import threading
+
+        if self._event_loop is None:
+            import asyncio
+
+            self._event_loop = asyncio.new_event_loop()
+            self._event_loop_thread = threading.current_thread()
+        elif self._event_loop_thread is not threading.current_thread():
+            return
+
+        return self._event_loop
+
+    def set_event_loop(self, loop):  # type: (AbstractEventLoop) -> None
+        """
+        Sets the event loop of the application, owned by the current thread.
+        """
+        import threading
+
+        self._event_loop = loop
+        self._event_loop_thread = threading.current_thread()
+
     def resolve_command(self, args):  # type: (RawArgs) -> ResolvedCommand
         if self._dispatcher and self._dispatcher.has_listeners(PRE_RESOLVE):
             event = PreResolveEvent(args, self)
@@ -114,11 +166,86 @@ class ConsoleApplication(BaseApplication):
     def run(
         self, args=None, input_stream=None, output_stream=None, error_stream=None
     ):  # type: (RawArgs, InputStream, OutputStream, OutputStream) -> int
+        try:
+            status_code = self._run(args, input_stream, output_stream, error_stream)
+        except KeyboardInterrupt:
+            status_code = 1
+
+        if self._config.is_terminated_after_run():
+            sys.exit(status_code)
+
+        return status_code
+
+    def run_batch(
+        self,
+        lines,
+        input_stream=None,
+        output_stream=None,
+        error_stream=None,
+        stop_on_failure=False,
+    ):  # type: (Iterable[str], InputStream, OutputStream, OutputStream, bool) -> List[int]
+        """
+        Runs command lines one after the other against this application
+        and returns the status code of each of them.
+
+        The command lines are tokenized like StringArgs. Blank lines and
+        lines starting with "#" are skipped. The streams are shared by all
+        the command lines and the application is never terminated
+        by the batch.
+
+        If stop_on_failure is set, the batch stops after the first command
+        line failing. An interruption which is not handled by a command
+        always stops the batch.
+        """
+        from .io.input_stream import StandardInputStream
+        from .io.output_stream import ErrorOutputStream
+        from .io.output_stream import StandardOutputStream
+
+        if input_stream is None:
+            input_stream = StandardInputStream()
+
+        if output_stream is None:
+            output_stream = StandardOutputStream()
+
+        if error_stream is None:
+            error_stream = ErrorOutputStream()
+
+        status_codes = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                status_code = self._run(
+                    StringArgs(line), input_stream, output_stream, error_stream
+                )
+            except KeyboardInterrupt:
+                status_codes.append(1)
+
+                break
+
+            status_codes.append(status_code)
+
+            if status_code and stop_on_failure:
+                break
+
+        return status_codes
+
+    def _run(
+        self, args, input_stream, output_stream, error_stream
+    ):  # type: (Optional[RawArgs], InputStream, OutputStream, OutputStream) -> int
         # Render errors to the preliminary IO until the final IO is created
         io = self._preliminary_io
         try:
             if args is None:
-                args = ArgvArgs()
+                args = ArgvArgs(response_files=self._config.is_response_files_enabled())
+
+                batch = self._config.is_batch_mode_enabled()
+                if batch and args.tokens[:1] == [self.BATCH]:
+                    return self._run_batch_source(
+                        args.tokens[1:], input_stream, output_stream, error_stream
+                    )
 
             io_factory = self._config.io_factory
 
@@ -131,12 +258,12 @@ class ConsoleApplication(BaseApplication):
             parsed_args = resolved_command.args
 
             status_code = command.handle(parsed_args, io)
-        except KeyboardInterrupt:
-            status_code = 1
         except Exception as e:
             if not self._config.is_exception_caught():
                 raise
 
+            from .ui.components.exception_trace import ExceptionTrace
+
             trace = ExceptionTrace(
                 e,
                 solution_provider_repository=self._config.solution_provider_repository,
@@ -146,11 +273,40 @@ class ConsoleApplication(BaseApplication):
 
             status_code = self.exception_to_exit_code(e)
 
-        if self._config.is_terminated_after_run():
-            sys.exit(status_code)
-
         return status_code
 
+    def _run_batch_source(
+        self, tokens, input_stream, output_stream, error_stream
+    ):  # type: (List[str], InputStream, OutputStream, OutputStream) -> int
+        """
+        Runs the command lines of the file following "--batch" and returns
+        the status code of the first failing one, if any.
+        """
+        stop_on_failure = self.STOP_ON_FAILURE in tokens
+        paths = [token for token in tokens if token != self.STOP_ON_FAILURE]
+
+        if not paths:
+            raise CannotParseArgsException.option_requires_value("batch")
+
+        if len(paths) > 1:
+            raise CannotParseArgsException.too_many_arguments()
+
+        if paths[0] == "-":
+            status_codes = self.run_batch(
+                sys.stdin, input_stream, output_stream, error_stream, stop_on_failure
+            )
+        else:
+            with open(paths[0]) as f:
+                status_codes = self.run_batch(
+                    f, input_stream, output_stream, error_stream, stop_on_failure
+                )
+
+        for status_code in status_codes:
+            if status_code:
+                return status_code
+
+        return 0
+
     def exception_to_exit_code(self, e):  # type: (Exception) -> int
         if not hasattr(e, "code") or not isinstance(e, int):
             return 1
@@ -163,7 +319,14 @@ class ConsoleApplication(BaseApplication):
 
         self._validate_command_name(config.name)
 
-        command = Command(config, self)
+        if isinstance(config, PluginCommandConfig):
+            # Plugin commands are always lazy to avoid importing the plugin
+            command = LazyCommand(config, self, config_loader=config.load)
+        elif self._config.is_lazy_command_loading_enabled():
+            command = LazyCommand(config, self)
+        else:
+            command = Command(config, self)
+
         self._commands.add(command)
 
         if config.is_default():
@@ -7,7 +7,7 @@ from clikit.api.formatter import Formatter
 from clikit.api.formatter import Style
 from clikit.api.formatter import StyleSet
 
-from .default_style_set import DefaultStyleSet
+from .style_table import StyleTable
 
 
 class AnsiFormatter(Formatter):
@@ -19,18 +19,8 @@ class AnsiFormatter(Formatter):
         self._formatter = Pastel(True)
         self._forced = forced
 
-        if style_set is None:
-            style_set = DefaultStyleSet()
-
-        for tag, style in style_set.styles.items():
-            pastel_style = StyleConverter.convert(style)
-
-            self._formatter.add_style(
-                tag,
-                pastel_style.foreground,
-                pastel_style.background,
-                pastel_style.options,
-            )
+        # The compiled styles are shared by all formatters of the style set
+        StyleTable.for_style_set(style_set).install(self._formatter)
 
     def format(self, string, style=None):  # type: (str, Optional[Style]) -> str
         if style is not None:
@@ -7,7 +7,7 @@ from clikit.api.formatter import Formatter
 from clikit.api.formatter import Style
 from clikit.api.formatter import StyleSet
 
-from .default_style_set import DefaultStyleSet
+from .style_table import StyleTable
 
 
 class PlainFormatter(Formatter):
@@ -18,18 +18,8 @@ class PlainFormatter(Formatter):
     def __init__(self, style_set=None):  # type: (StyleSet) -> None
         self._formatter = Pastel(False)
 
-        if style_set is None:
-            style_set = DefaultStyleSet()
-
-        for tag, style in style_set.styles.items():
-            pastel_style = StyleConverter.convert(style)
-
-            self._formatter.add_style(
-                tag,
-                pastel_style.foreground,
-                pastel_style.background,
-                pastel_style.options,
-            )
+        # The compiled styles are shared by all formatters of the style set
+        StyleTable.for_style_set(style_set).install(self._formatter)
 
     def format(self, string, style=None):  # type: (str, Optional[Style]) -> str
         return self._formatter.colorize(string)
@@ -0,0 +1,207 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pastel import Pastel
+from pastel.style import Style as PastelStyle
+
+from clikit.adapter.style_converter import StyleConverter
+from clikit.api.formatter import Style
+from clikit.api.formatter import StyleSet
+
+
+class CompiledStyle(PastelStyle):
+    """
+    A Pastel style with precomputed ANSI open and close sequences.
+    """
+
+    def __init__(
+        self, foreground=None, background=None, options=None
+    ):  # type: (Optional[str], Optional[str], Optional[List[str]]) -> None
+        super(CompiledStyle, self).__init__(foreground, background, options)
+
+        codes = []
+
+        if self._foreground:
+            codes.append(self._foreground)
+
+        if self._background:
+            codes.append(self._background)
+
+        codes += list(self._options.keys())
+
+        if codes:
+            self._open = "\033[{}m".format(";".join(map(str, codes)))
+            self._close = "\033[0m"
+        else:
+            self._open = self._close = ""
+
+    @property
+    def open_sequence(self):  # type: () -> str
+        return self._open
+
+    @property
+    def close_sequence(self):  # type: () -> str
+        return self._close
+
+    def apply(self, text):  # type: (str) -> str
+        if not self._open:
+            return text
+
+        return self._open + text + self._close
+
+    @classmethod
+    def from_style(cls, style):  # type: (Style) -> CompiledStyle
+        pastel_style = StyleConverter.convert(style)
+
+        return cls(
+            pastel_style.foreground, pastel_style.background, pastel_style.options
+        )
+
+
+class StyleTable(object):
+    """
+    A table mapping style tags to compiled styles.
+
+    A table is compiled once per StyleSet and shared by all the formatters
+    using that style set. Extending a table creates a new layer on top of it
+    instead of recompiling the existing styles. The styles set or deleted
+    in a table are only set or masked in its own layer.
+    """
+
+    # The styles Pastel defines by default
+    PASTEL_TAGS = ("error", "info", "comment", "question")
+
+    _default = None  # type: Optional[StyleTable]
+    _base = None  # type: Optional[StyleTable]
+
+    def __init__(
+        self, styles=None, parent=None
+    ):  # type: (Optional[Dict[str, CompiledStyle]], Optional[StyleTable]) -> None
+        self._styles = dict(styles or {})
+        self._parent = parent
+
+    @classmethod
+    def for_style_set(cls, style_set=None):  # type: (Optional[StyleSet]) -> StyleTable
+        """
+        Returns the compiled table of a style set, compiling it on first use.
+        """
+        if style_set is None:
+            if cls._default is None:
+                from .default_style_set import DefaultStyleSet
+
+                StyleTable._default = cls.compile(DefaultStyleSet().styles.values())
+
+            return cls._default
+
+        table = style_set._table
+        if table is None:
+            table = cls.compile(style_set.styles.values())
+            style_set._table = table
+
+        return table
+
+    @classmethod
+    def compile(cls, styles):  # type: (Iterable[Style]) -> StyleTable
+        return cls(
+            {style.tag: CompiledStyle.from_style(style) for style in styles},
+            cls._pastel_base(),
+        )
+
+    @classmethod
+    def _pastel_base(cls):  # type: () -> StyleTable
+        """
+        Returns the table of the styles Pastel defines by default.
+        """
+        if cls._base is None:
+            pastel = Pastel()
+
+            if hasattr(pastel, "_styles"):
+                styles = pastel._styles
+            else:
+                styles = {tag: pastel.style(tag) for tag in cls.PASTEL_TAGS}
+
+            StyleTable._base = cls(
+                {
+                    tag: CompiledStyle(
+                        style.foreground, style.background, style.options
+                    )
+                    for tag, style in styles.items()
+                    if style is not None
+                }
+            )
+
+        return cls._base
+
+    def extend(self, style):  # type: (Style) -> StyleTable
+        """
+        Returns a new table with the given style added on top of this one.
+        """
+        return self.__class__({style.tag: CompiledStyle.from_style(style)}, self)
+
+    def install(self, pastel):  # type: (Pastel) -> None
+        """
+        Makes a Pastel instance format with the styles of this table.
+
+        Pastel gets its own layer on top of this table, so that the styles
+        it adds or removes do not change the shared table. Pastel versions
+        without a style dictionary get the styles added one by one instead.
+        """
+        if hasattr(pastel, "_styles"):
+            pastel._styles = self.__class__({}, self)
+
+            return
+
+        for tag, style in self.items():
+            pastel.add_style(tag, style.foreground, style.background, style.options)
+
+    def items(self):  # type: () -> List[Tuple[str, CompiledStyle]]
+        """
+        Returns the styles of this table and of the tables it extends.
+        """
+        tables = []
+        table = self
+        while table is not None:
+            tables.append(table)
+            table = table._parent
+
+        styles = {}
+        for table in reversed(tables):
+            styles.update(table._styles)
+
+        return [(tag, style) for tag, style in styles.items() if style is not None]
+
+    def get(self, tag, default=None):  # type: (str, ...) -> Optional[CompiledStyle]
+        table = self
+        while table is not None:
+            if tag in table._styles:
+                return table._styles[tag]
+
+            table = table._parent
+
+        return default
+
+    def __contains__(self, tag):  # type: (str) -> bool
+        return self.get(tag) is not None
+
+    def __getitem__(self, tag):  # type: (str) -> CompiledStyle
+        style = self.get(tag)
+        if style is None:
+            raise KeyError(tag)
+
+        return style
+
+    def __setitem__(self, tag, style):  # type: (str, PastelStyle) -> None
+        if not isinstance(style, CompiledStyle):
+            style = CompiledStyle(style.foreground, style.background, style.options)
+
+        self._styles[tag] = style
+
+    def __delitem__(self, tag):  # type: (str) -> None
+        if tag not in self:
+            raise KeyError(tag)
+
+        # Masks the style of the tables this one extends
+        self._styles[tag] = None
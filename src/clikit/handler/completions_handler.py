@@ -0,0 +1,42 @@
+import os
+
+from typing import Optional
+
+from clikit.api.args import Args
+from clikit.api.command import Command
+from clikit.api.io import IO
+
+
+class CompletionsHandler:
+    """
+    Writes the completion index of the application and prints the script
+    enabling the completion for the shell passed in the "shell" argument.
+
+    The index is only rebuilt when this handler runs: the script should be
+    generated again whenever the commands change.
+    """
+
+    def __init__(self, index_path=None):  # type: (Optional[str]) -> None
+        self._index_path = index_path
+
+    def handle(self, args, io, command):  # type: (Args, IO, Command) -> int
+        from clikit.completion import CompletionIndex
+        from clikit.completion import get_script
+
+        config = command.application.config
+        program = config.name or os.path.basename(args.script_name or "")
+
+        index_path = self._index_path
+        if index_path is None:
+            index_path = self.default_index_path(program)
+
+        CompletionIndex.from_config(config).dump(index_path)
+
+        io.write_raw(get_script(args.argument("shell"), program, index_path))
+
+        return 0
+
+    def default_index_path(self, program):  # type: (str) -> str
+        from clikit.utils._file import user_cache_dir
+
+        return os.path.join(user_cache_dir("clikit"), "completion", program + ".json")
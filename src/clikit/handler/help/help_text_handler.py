@@ -2,8 +2,6 @@ from clikit.api.args import Args
 from clikit.api.command import Command
 from clikit.api.io import IO
 from clikit.api.resolver import CommandResolver
-from clikit.ui.help import ApplicationHelp
-from clikit.ui.help import CommandHelp
 
 
 class HelpTextHandler:
@@ -15,6 +13,9 @@ class HelpTextHandler:
         self._resolver = resolver
 
     def handle(self, args, io, command):  # type: (Args, IO, Command) -> int
+        from clikit.ui.help import ApplicationHelp
+        from clikit.ui.help import CommandHelp
+
         application = command.application
 
         if args.is_argument_set("command"):
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from clikit.api.args import Args
+from clikit.api.command import Command
+from clikit.api.io import IO
+
+
+class ShellHandler:
+    """
+    Starts an interactive shell running the commands of the application.
+
+    The history is kept in the file at history_path, if given.
+    """
+
+    def __init__(
+        self, prompt=None, history_path=None
+    ):  # type: (Optional[str], Optional[str]) -> None
+        self._prompt = prompt
+        self._history_path = history_path
+
+    def handle(self, args, io, command):  # type: (Args, IO, Command) -> int
+        from clikit.shell import Shell
+
+        shell = Shell(command.application, self._prompt, self._history_path)
+
+        return shell.run(io)
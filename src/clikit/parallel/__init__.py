@@ -0,0 +1,10 @@
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .parallel_runner import ParallelRunner  # noqa
+
+
+lazy_attributes(globals(), {"ParallelRunner": ".parallel_runner"})
@@ -0,0 +1,237 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+from clikit.api.command import Command
+from clikit.api.exceptions import CliKitException
+from clikit.api.io import IO
+from clikit.api.resolver import ResolvedCommand
+from clikit.api.formatter import Style
+from clikit.formatter import PlainFormatter
+from clikit.io import BufferedIO
+
+
+try:
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import Future
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import wait
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "The parallel runner requires concurrent.futures: "
+        "use Python 3 or install the futures backport."
+    )
+
+
+class ParallelRunner(object):
+    """
+    Runs tasks concurrently and writes their output to an IO.
+
+    Each task writes to its own BufferedIO. The output of a task is written
+    once the task is done: either as soon as it is done, each line prefixed
+    with the name of the task, or in the order the tasks were submitted.
+
+    The tasks run in a pool of at most max_workers threads, or processes
+    if processes is set. Tasks run in processes must be picklable.
+
+    If fail_fast is set, no task is started once a task failed. The tasks
+    already running are completed.
+
+    The IOs of the tasks keep the format tags if the IO supports ANSI:
+    the output is formatted by the IO it is written to, in the calling thread.
+
+    Coroutine handlers of commands run in threads on a loop of the worker
+    thread, never on the event loop of the application.
+    """
+
+    SUBMISSION_ORDER = 1
+    COMPLETION_ORDER = 2
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self, max_workers=None, order=SUBMISSION_ORDER, fail_fast=False, processes=False
+    ):  # type: (Optional[int], int, bool, bool) -> None
+        if max_workers is None:
+            max_workers = self.DEFAULT_MAX_WORKERS
+
+        if max_workers < 1:
+            raise ValueError("The maximum number of workers must be at least 1.")
+
+        if order not in (self.SUBMISSION_ORDER, self.COMPLETION_ORDER):
+            raise ValueError("Unknown output order: {}".format(order))
+
+        self._max_workers = max_workers
+        self._order = order
+        self._fail_fast = fail_fast
+        self._processes = processes
+
+    def map(
+        self, func, values, io, prefix=str
+    ):  # type: (Callable[[Any, IO], Optional[int]], Iterable[Any], IO, Callable[[Any], str]) -> int
+        """
+        Calls func(value, io) for each value, with an IO per call, and returns
+        the highest status code, normalized like Command.handle() does.
+
+        The name of a task, used as a prefix in completion order,
+        is prefix(value).
+        """
+        verbosity = io.verbosity
+        quiet = io.is_quiet()
+        ansi = io.supports_ansi()
+
+        if self._processes:
+            executor = ProcessPoolExecutor(self._max_workers)
+        else:
+            executor = ThreadPoolExecutor(self._max_workers)
+
+        # Tasks are only submitted when a worker is available, so that
+        # no task starts once a task failed in fail fast mode
+        values = enumerate(values)
+        running = {}  # type: Dict[Future, Tuple[int, Any]]
+        # Results waiting for the previous tasks in submission order
+        pending = {}  # type: Dict[int, Tuple[str, str]]
+        next_position = 0
+        status_code = 0
+        failed = False
+
+        try:
+            while True:
+                while not failed and len(running) < self._max_workers:
+                    item = next(values, None)
+                    if item is None:
+                        break
+
+                    future = executor.submit(
+                        _run_task, func, item[1], verbosity, quiet, ansi
+                    )
+                    running[future] = item
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda future: running[future][0]):
+                    position, value = running.pop(future)
+                    task_status_code, output, error = future.result()
+
+                    status_code = max(status_code, task_status_code)
+                    if task_status_code and self._fail_fast:
+                        failed = True
+
+                    if self._order == self.COMPLETION_ORDER:
+                        self._write(io, (output, error), prefix(value))
+
+                        continue
+
+                    pending[position] = (output, error)
+                    while next_position in pending:
+                        self._write(io, pending.pop(next_position))
+                        next_position += 1
+        finally:
+            executor.shutdown()
+
+        return status_code
+
+    def run_commands(
+        self, resolved_commands, io
+    ):  # type: (Iterable[ResolvedCommand], IO) -> int
+        """
+        Handles resolved commands concurrently and returns the highest
+        status code.
+
+        The name of a task is its command line. Resolved commands can only
+        be handled in threads.
+        """
+        if self._processes:
+            raise ValueError("Resolved commands can only be handled in threads.")
+
+        return self.map(_handle, resolved_commands, io, _get_command_line)
+
+    def _write(
+        self, io, result, prefix=None
+    ):  # type: (IO, Tuple[str, str], Optional[str]) -> None
+        output, error = result
+
+        if prefix is not None:
+            output = self._prefix(output, prefix)
+            error = self._prefix(error, prefix)
+
+        if output:
+            io.write(output)
+
+        if error:
+            io.error(error)
+
+        io.flush()
+
+    def _prefix(self, string, prefix):  # type: (str, str) -> str
+        return "".join(
+            "[{}] {}".format(prefix, line) for line in string.splitlines(True)
+        )
+
+
+class _TaskFormatter(PlainFormatter):
+    """
+    Keeps the format tags in the output of a task if the IO it is written to
+    supports ANSI, but measures the text without them, so that tables and
+    progress bars are aligned once the output is formatted by that IO.
+    """
+
+    def __init__(self, ansi):  # type: (bool) -> None
+        super(_TaskFormatter, self).__init__()
+
+        self._ansi = ansi
+
+    def format(self, string, style=None):  # type: (str, Optional[Style]) -> str
+        return string
+
+    def disable_ansi(self):  # type: () -> bool
+        return not self._ansi
+
+    def force_ansi(self):  # type: () -> bool
+        return self._ansi
+
+
+def _run_task(
+    func, value, verbosity, quiet, ansi
+):  # type: (Callable[[Any, IO], Optional[int]], Any, int, bool, bool) -> Tuple[int, str, str]
+    """
+    Calls a task with its own IO and returns its status code and output.
+    """
+    io = BufferedIO(formatter=_TaskFormatter(ansi))
+    io.set_verbosity(verbosity)
+    io.set_quiet(quiet)
+    # The input cannot be shared by concurrent tasks
+    io.set_interactive(False)
+
+    try:
+        status_code = func(value, io)
+    except Exception as e:
+        from clikit.ui.components.exception_trace import ExceptionTrace
+
+        ExceptionTrace(e).render(io, simple=isinstance(e, CliKitException))
+
+        status_code = 1
+
+    return (
+        Command.normalize_status_code(status_code),
+        io.fetch_output(),
+        io.fetch_error(),
+    )
+
+
+def _handle(resolved_command, io):  # type: (ResolvedCommand, IO) -> int
+    return resolved_command.command.handle(resolved_command.args, io)
+
+
+def _get_command_line(resolved_command):  # type: (ResolvedCommand) -> str
+    raw_args = resolved_command.args.raw_args
+    if raw_args is None:
+        return resolved_command.command.name
+
+    return raw_args.to_string(False)
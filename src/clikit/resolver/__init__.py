@@ -1 +1,2 @@
+from .cached_resolver import CachedResolver
 from .default_resolver import DefaultResolver
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from clikit.api.args import RawArgs
+from clikit.api.resolver import CommandResolver
+from clikit.api.resolver import ResolvedCommand
+
+from .default_resolver import DefaultResolver
+
+
+if TYPE_CHECKING:
+    from clikit.api.application import Application
+
+
+class CachedResolver(CommandResolver):
+    """
+    Memoizes the commands resolved by another resolver.
+
+    The results are kept in a bounded least recently used cache keyed by
+    the commands of the application and the tokens. A hit returns a copy
+    of the cached arguments, so handlers can modify them freely.
+
+    Adding a command to the application invalidates its cached results.
+    Failures and command lines streaming values are never cached.
+    """
+
+    def __init__(
+        self, resolver=None, max_size=256
+    ):  # type: (Optional[CommandResolver], int) -> None
+        if resolver is None:
+            resolver = DefaultResolver()
+
+        self._resolver = resolver
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def resolver(self):  # type: () -> CommandResolver
+        return self._resolver
+
+    @property
+    def hits(self):  # type: () -> int
+        return self._hits
+
+    @property
+    def misses(self):  # type: () -> int
+        return self._misses
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):  # type: () -> None
+        self._cache.clear()
+
+    def resolve(
+        self, args, application
+    ):  # type: (RawArgs, Application) -> ResolvedCommand
+        if args.streamed_values is not None:
+            return self._resolver.resolve(args, application)
+
+        named_commands = application.named_commands
+        default_commands = application.default_commands
+        # The results of other applications and the results from before
+        # a command was added are left to expire
+        key = (
+            id(named_commands),
+            named_commands.revision,
+            default_commands.revision,
+            tuple(args.tokens),
+        )
+
+        resolved_command = self._cache.pop(key, None)
+        if (
+            resolved_command is not None
+            and resolved_command.command.application is application
+        ):
+            self._hits += 1
+            self._cache[key] = resolved_command
+
+            return self._create_resolved_command(resolved_command, args)
+
+        self._misses += 1
+
+        resolved_command = self._resolver.resolve(args, application)
+
+        self._cache[key] = resolved_command
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+        return self._create_resolved_command(resolved_command, args)
+
+    def _create_resolved_command(
+        self, resolved_command, args
+    ):  # type: (ResolvedCommand, RawArgs) -> ResolvedCommand
+        return ResolvedCommand(
+            resolved_command.command, resolved_command.args.copy(args)
+        )
@@ -33,7 +33,11 @@ class DefaultResolver(CommandResolver):
         options_to_test = self.get_options_to_test(tokens)
 
         result = self.process_arguments(
-            args, named_commands, arguments_to_test, options_to_test
+            args,
+            named_commands,
+            arguments_to_test,
+            options_to_test,
+            abbreviations=application.config.is_command_abbreviations_enabled(),
         )
         if result:
             return self.create_resolved_command(result)
@@ -52,15 +56,33 @@ class DefaultResolver(CommandResolver):
         raise CannotResolveCommandException.no_default_command()
 
     def process_arguments(
-        self, args, named_commands, arguments_to_test, options_to_test
-    ):  # type: (RawArgs, CommandCollection, List[str], List[str]) -> Optional[ResolveResult]
+        self,
+        args,
+        named_commands,
+        arguments_to_test,
+        options_to_test,
+        abbreviations=False,
+    ):  # type: (RawArgs, CommandCollection, List[str], List[str], bool) -> Optional[ResolveResult]
         current_command = None
+        tokens = None  # type: Optional[List[str]]
 
         # Parse the arguments for command names until we fail to find a
         # matching command
-        for name in arguments_to_test:
+        for i, name in enumerate(arguments_to_test):
             if name not in named_commands:
-                break
+                if not abbreviations:
+                    break
+
+                name = self.expand_abbreviation(name, named_commands)
+                if name is None:
+                    break
+
+                # The parser expects the full command name. The command
+                # names are the first tokens.
+                if tokens is None:
+                    tokens = list(args.tokens)
+
+                tokens[i] = name
 
             next_command = named_commands.get(name)
 
@@ -70,8 +92,29 @@ class DefaultResolver(CommandResolver):
         if not current_command:
             return
 
+        if tokens is not None:
+            from clikit.args.expanded_args import ExpandedArgs
+
+            args = ExpandedArgs(args, tokens)
+
         return self.process_options(args, current_command, options_to_test)
 
+    def expand_abbreviation(
+        self, abbreviation, named_commands
+    ):  # type: (str, CommandCollection) -> Optional[str]
+        """
+        Returns the name of the only command starting with an abbreviation.
+        """
+        names = named_commands.find_by_prefix(abbreviation)
+
+        if len(names) > 1:
+            raise CannotResolveCommandException.ambiguous_name(abbreviation, names)
+
+        if not names:
+            return
+
+        return names[0]
+
     def process_options(
         self, args, current_command, options_to_test
     ):  # type: (RawArgs, Command, List[str]) -> Optional[ResolveResult]
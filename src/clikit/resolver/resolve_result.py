@@ -2,6 +2,8 @@ from clikit.api.args import Args
 from clikit.api.args import RawArgs
 from clikit.api.args.exceptions import CannotParseArgsException
 from clikit.api.command import Command
+from clikit.args.args_signature import ArgsSignature
+from clikit.args.default_args_parser import DefaultArgsParser
 
 
 class ResolveResult(object):
@@ -9,6 +11,8 @@ class ResolveResult(object):
     An intermediate result created during resolving.
     """
 
+    __slots__ = ("_command", "_raw_args", "_parsed_args", "_parse_error", "_parsed")
+
     def __init__(self, command, raw_args):  # type: (Command, RawArgs) -> None
         self._command = command
         self._raw_args = raw_args
@@ -40,10 +44,27 @@ class ResolveResult(object):
 
     def is_parsable(self):  # type: () -> bool
         if not self._parsed:
+            if self._is_rejected():
+                return False
+
             self._parse()
 
         return self.parse_error is None
 
+    def _is_rejected(self):  # type: () -> bool
+        """
+        Returns whether the arguments are known not to be parsable
+        without parsing them.
+        """
+        config = self._command.config
+        if config.is_lenient_args_parsing_enabled():
+            return False
+
+        if not isinstance(config.args_parser, DefaultArgsParser):
+            return False
+
+        return ArgsSignature.get(self._command.args_format).rejects(self._raw_args)
+
     def _parse(self):  # type: () -> None
         try:
             self._parsed_args = self._command.parse(self._raw_args)
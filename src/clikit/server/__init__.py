@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .application_client import ApplicationClient  # noqa
+    from .application_server import ApplicationServer  # noqa
+
+
+lazy_attributes(
+    globals(),
+    {
+        "ApplicationClient": ".application_client",
+        "ApplicationServer": ".application_server",
+    },
+)
@@ -0,0 +1,81 @@
+"""
+A minimal client for the application server.
+
+It only imports the standard library so that invoking a warm application
+costs little more than starting the interpreter. It can be used from
+the command line:
+
+    python -m clikit.server.application_client /path/to/socket [args...]
+"""
+import os
+import socket
+import sys
+
+from typing import List
+from typing import Optional
+
+from . import protocol
+
+
+class ApplicationClient(object):
+    """
+    Runs commands on an application server.
+    """
+
+    def __init__(self, socket_path):  # type: (str) -> None
+        self._socket_path = socket_path
+
+    def run(
+        self, argv=None, stdin=None, stdout=None, stderr=None
+    ):  # type: (Optional[List[str]], ...) -> int
+        """
+        Runs a command on the server and returns its exit status code.
+
+        The standard streams default to the ones of the current process.
+        """
+        if argv is None:
+            argv = list(sys.argv)
+
+        fds = [
+            self._fileno(stdin, 0),
+            self._fileno(stdout, 1),
+            self._fileno(stderr, 2),
+        ]
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self._socket_path)
+            protocol.send_request(
+                sock, {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}, fds
+            )
+
+            return protocol.receive_status(sock)
+        finally:
+            sock.close()
+
+    def _fileno(self, stream, default):  # type: (...) -> int
+        if stream is None:
+            return default
+
+        if isinstance(stream, int):
+            return stream
+
+        stream.flush()
+
+        return stream.fileno()
+
+
+def main():  # type: () -> None
+    if len(sys.argv) < 2:
+        sys.stderr.write(
+            "Usage: python -m clikit.server.application_client SOCKET [ARGS...]\n"
+        )
+        sys.exit(2)
+
+    socket_path = sys.argv[1]
+
+    sys.exit(ApplicationClient(socket_path).run([sys.argv[0]] + sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import errno
+import gc
+import os
+import socket
+import sys
+
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from . import protocol
+
+
+if TYPE_CHECKING:
+    from clikit.console_application import ConsoleApplication
+
+
+class ApplicationServer(object):
+    """
+    Serves a loaded console application on a local Unix socket.
+
+    The application is configured once when the server starts. Each request
+    is handled in a child process forked from the warm server, which runs
+    the command against the arguments, environment, working directory and
+    standard streams of the client.
+    """
+
+    def __init__(
+        self, application, socket_path, backlog=128
+    ):  # type: (ConsoleApplication, str, int) -> None
+        if (
+            not hasattr(socket, "AF_UNIX")
+            or not hasattr(os, "fork")
+            or not hasattr(socket.socket, "sendmsg")
+        ):
+            raise RuntimeError(
+                "The application server requires Python 3 on a Unix platform."
+            )
+
+        self._application = application
+        self._socket_path = socket_path
+        self._backlog = backlog
+        self._socket = None  # type: Optional[socket.socket]
+        self._children = set()
+
+    @property
+    def application(self):  # type: () -> ConsoleApplication
+        return self._application
+
+    @property
+    def socket_path(self):  # type: () -> str
+        return self._socket_path
+
+    def bind(self):  # type: () -> None
+        """
+        Creates the listening socket.
+
+        The socket is bound to a temporary path and only moved to the
+        socket path once it listens, so that clients waiting for the socket
+        path to exist never find a socket refusing connections.
+        """
+        temp_path = "{}.{}".format(self._socket_path, os.getpid())
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.bind(temp_path)
+            self._socket.listen(self._backlog)
+            os.rename(temp_path, self._socket_path)
+        except Exception:
+            self._socket.close()
+            self._socket = None
+
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+            raise
+
+        # Objects allocated so far are shared by all the children:
+        # moving them out of the collector's reach avoids touching their
+        # memory pages, and therefore copying them, after each fork.
+        if hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+
+    def serve_forever(self, max_requests=None):  # type: (Optional[int]) -> None
+        """
+        Handles requests until interrupted or until max_requests were served.
+        """
+        if self._socket is None:
+            self.bind()
+
+        served = 0
+        try:
+            while max_requests is None or served < max_requests:
+                try:
+                    connection, _ = self._socket.accept()
+                except (IOError, OSError) as e:
+                    if e.errno == errno.EINTR:
+                        continue
+
+                    raise
+
+                self._reap_children()
+                self._handle_connection(connection)
+                served += 1
+        finally:
+            self.close()
+
+    def close(self):  # type: () -> None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+
+        while self._children:
+            self._wait_child(self._children.pop(), 0)
+
+    def _handle_connection(self, connection):  # type: (socket.socket) -> None
+        try:
+            request, fds = protocol.receive_request(connection)
+        except (ValueError, EOFError, IOError, OSError):
+            connection.close()
+
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            status = 255
+            try:
+                self._socket.close()
+                status = self._run_child(request, fds)
+            finally:
+                try:
+                    protocol.send_status(connection, status)
+                finally:
+                    os._exit(status)
+
+        self._children.add(pid)
+
+        for fd in fds:
+            os.close(fd)
+
+        connection.close()
+
+    def _run_child(self, request, fds):  # type: (Dict, List[int]) -> int
+        for target, fd in enumerate(fds):
+            if fd != target:
+                os.dup2(fd, target)
+                os.close(fd)
+
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = list(request["argv"])
+
+        try:
+            # Reads sys.argv like a command run from the shell, so that
+            # response files and batch mode are supported
+            status = self._application.run()
+        except SystemExit as e:
+            status = e.code
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (IOError, OSError, ValueError):
+                    pass
+
+        if status is None:
+            return 0
+
+        if not isinstance(status, int):
+            return 1
+
+        return status
+
+    def _reap_children(self):  # type: () -> None
+        for pid in list(self._children):
+            if self._wait_child(pid, os.WNOHANG):
+                self._children.discard(pid)
+
+    def _wait_child(self, pid, options):  # type: (int, int) -> bool
+        try:
+            finished, _ = os.waitpid(pid, options)
+        except OSError:
+            return True
+
+        return finished != 0
@@ -0,0 +1,95 @@
+"""
+The wire protocol shared by the application server and its clients.
+
+A request is a single message on a Unix socket. It carries the standard
+input, output and error file descriptors of the client as SCM_RIGHTS
+ancillary data and a length-prefixed JSON payload holding the arguments,
+the environment and the working directory of the client.
+The server answers with the exit status code of the command.
+
+This module only depends on the standard library so that clients
+start as fast as possible.
+"""
+import array
+import json
+import os
+import socket
+import struct
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+HEADER = struct.Struct("!I")
+STATUS = struct.Struct("!i")
+FD_COUNT = 3
+
+
+def send_request(
+    sock, payload, fds
+):  # type: (socket.socket, Dict[str, Any], List[int]) -> None
+    data = json.dumps(payload).encode("utf-8")
+    message = HEADER.pack(len(data)) + data
+
+    sent = sock.sendmsg(
+        [message], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+    )
+    if sent < len(message):
+        sock.sendall(message[sent:])
+
+
+def receive_request(sock):  # type: (socket.socket) -> Tuple[Dict[str, Any], List[int]]
+    fds = array.array("i")
+    data, ancdata, _, _ = sock.recvmsg(65536, socket.CMSG_LEN(FD_COUNT * fds.itemsize))
+
+    for level, type_, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+
+    if len(fds) != FD_COUNT:
+        for fd in fds:
+            _close(fd)
+
+        raise ValueError(
+            "Invalid request: expected {} file descriptors.".format(FD_COUNT)
+        )
+
+    while len(data) < HEADER.size:
+        data += _receive(sock, HEADER.size - len(data))
+
+    length = HEADER.unpack(data[: HEADER.size])[0]
+    data = data[HEADER.size :]
+
+    while len(data) < length:
+        data += _receive(sock, length - len(data))
+
+    return json.loads(data.decode("utf-8")), list(fds)
+
+
+def send_status(sock, status):  # type: (socket.socket, int) -> None
+    sock.sendall(STATUS.pack(status))
+
+
+def receive_status(sock):  # type: (socket.socket) -> int
+    data = b""
+    while len(data) < STATUS.size:
+        data += _receive(sock, STATUS.size - len(data))
+
+    return STATUS.unpack(data)[0]
+
+
+def _receive(sock, size):  # type: (socket.socket, int) -> bytes
+    chunk = sock.recv(size)
+    if not chunk:
+        raise EOFError("The connection was closed unexpectedly.")
+
+    return chunk
+
+
+def _close(fd):  # type: (int) -> None
+    try:
+        os.close(fd)
+    except OSError:
+        pass
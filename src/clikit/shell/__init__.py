@@ -0,0 +1,10 @@
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .shell import Shell  # noqa
+
+
+lazy_attributes(globals(), {"Shell": ".shell"})
@@ -0,0 +1,196 @@
+import os
+import sys
+
+from typing import TYPE_CHECKING
+from typing import List
+from typing import Optional
+
+from clikit.args.token_parser import TokenParser
+from clikit.completion.completion_index import CompletionIndex
+from clikit.completion.provider_runner import ProviderRunner
+from clikit.io.input_stream import StandardInputStream
+from clikit.utils._compat import decode
+from clikit.utils._compat import input
+
+
+if TYPE_CHECKING:
+    from clikit.api.application import Application
+    from clikit.api.io import IO
+
+
+class Shell(object):
+    """
+    An interactive shell running the commands of an application.
+
+    Each line read is resolved and handled like a command line by the
+    application, which stays loaded between the lines along with its
+    commands and their caches. "exit", "quit" or the end of the input
+    leave the shell.
+
+    When reading from a terminal, lines are read with readline, if it is
+    available, with a history and TAB completion. The completion is
+    answered from a completion index built once when the shell starts.
+    Value providers that do not answer in time are abandoned, so that a
+    slow provider does not block the prompt.
+
+    Commands run in the foreground: what is typed while a command runs is
+    echoed by the terminal and read once the command is done.
+    """
+
+    EXIT_COMMANDS = ("exit", "quit")
+
+    def __init__(
+        self, application, prompt=None, history_path=None
+    ):  # type: (Application, Optional[str], Optional[str]) -> None
+        if prompt is None:
+            prompt = "{}> ".format(application.config.name or "console")
+
+        self._application = application
+        self._prompt = prompt
+        self._history_path = history_path
+        self._index = None  # type: Optional[CompletionIndex]
+        self._runner = ProviderRunner()
+        self._candidates = []  # type: List[str]
+
+    @property
+    def index(self):  # type: () -> CompletionIndex
+        if self._index is None:
+            # A provider which cannot be imported must not break the shell
+            self._index = CompletionIndex.from_config(
+                self._application.config, strict=False
+            )
+
+        return self._index
+
+    def run(self, io):  # type: (IO) -> int
+        """
+        Reads and runs command lines until the shell is left.
+
+        The commands write to the streams of the IO.
+        """
+        readline = None
+        if isinstance(io.input.stream, StandardInputStream) and sys.stdin.isatty():
+            readline = self._setup_readline()
+
+        try:
+            while True:
+                line = self._read_line(io, readline)
+                if line is None:
+                    break
+
+                line = line.strip()
+                if line in self.EXIT_COMMANDS:
+                    break
+
+                if not line:
+                    continue
+
+                self._application.run_batch(
+                    [line], io.input.stream, io.output.stream, io.error_output.stream
+                )
+        finally:
+            if readline is not None:
+                self._save_history(readline)
+
+        return 0
+
+    def complete(self, line):  # type: (str) -> List[str]
+        """
+        Returns the candidates for the last word of a line.
+        """
+        words = TokenParser().parse(line)
+        if not line or line[-1].isspace():
+            words.append("")
+
+        return [candidate for candidate, _ in self.index.complete(words, self._runner)]
+
+    def _read_line(self, io, readline):  # type: (IO, Optional[object]) -> Optional[str]
+        """
+        Returns the next line, or None at the end of the input.
+        """
+        if readline is not None:
+            try:
+                return input(self._prompt)
+            except EOFError:
+                io.write_line("")
+
+                return
+            except KeyboardInterrupt:
+                # Discard the line being typed
+                io.write_line("")
+
+                return ""
+
+        io.write_raw(self._prompt)
+        io.flush()
+
+        line = io.read_line()
+        if not line:
+            return
+
+        return decode(line)
+
+    def _setup_readline(self):  # type: () -> Optional[object]
+        try:
+            import readline
+        except ImportError:
+            return
+
+        # Build the index before the first keystroke
+        try:
+            self.index
+        except Exception:
+            # Lines are still read with readline, without completion
+            pass
+        else:
+            readline.set_completer(self._complete)
+            # Options and values are completed as a whole
+            readline.set_completer_delims(" \t\n")
+            if "libedit" in (readline.__doc__ or ""):
+                readline.parse_and_bind("bind ^I rl_complete")
+            else:
+                readline.parse_and_bind("tab: complete")
+
+        if self._history_path and os.path.exists(self._history_path):
+            try:
+                readline.read_history_file(self._history_path)
+            except (IOError, OSError):
+                pass
+
+        return readline
+
+    def _save_history(self, readline):  # type: (object) -> None
+        if not self._history_path:
+            return
+
+        try:
+            directory = os.path.dirname(self._history_path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            readline.write_history_file(self._history_path)
+        except (IOError, OSError):
+            pass
+
+    def _complete(self, text, state):  # type: (str, int) -> Optional[str]
+        """
+        The readline completer.
+        """
+        if state == 0:
+            import readline
+
+            line = readline.get_line_buffer()[: readline.get_endidx()]
+            try:
+                self._candidates = self.complete(line)
+            except Exception:
+                # Errors must not reach the prompt
+                self._candidates = []
+
+            # readline does not append a space after a unique candidate
+            if len(self._candidates) == 1:
+                self._candidates[0] += " "
+
+        if state < len(self._candidates):
+            return self._candidates[state]
+
+        return
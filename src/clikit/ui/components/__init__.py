@@ -1,13 +1,39 @@
-from .border_util import BorderUtil
-from .cell_wrapper import CellWrapper
-from .choice_question import ChoiceQuestion
-from .confirmation_question import ConfirmationQuestion
-from .empty_line import EmptyLine
-from .exception_trace import ExceptionTrace
-from .labeled_paragraph import LabeledParagraph
-from .name_version import NameVersion
-from .paragraph import Paragraph
-from .progress_bar import ProgressBar
-from .progress_indicator import ProgressIndicator
-from .question import Question
-from .table import Table
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .border_util import BorderUtil  # noqa
+    from .cell_wrapper import CellWrapper  # noqa
+    from .choice_question import ChoiceQuestion  # noqa
+    from .confirmation_question import ConfirmationQuestion  # noqa
+    from .empty_line import EmptyLine  # noqa
+    from .exception_trace import ExceptionTrace  # noqa
+    from .labeled_paragraph import LabeledParagraph  # noqa
+    from .name_version import NameVersion  # noqa
+    from .paragraph import Paragraph  # noqa
+    from .progress_bar import ProgressBar  # noqa
+    from .progress_indicator import ProgressIndicator  # noqa
+    from .question import Question  # noqa
+    from .table import Table  # noqa
+
+
+lazy_attributes(
+    globals(),
+    {
+        "BorderUtil": ".border_util",
+        "CellWrapper": ".cell_wrapper",
+        "ChoiceQuestion": ".choice_question",
+        "ConfirmationQuestion": ".confirmation_question",
+        "EmptyLine": ".empty_line",
+        "ExceptionTrace": ".exception_trace",
+        "LabeledParagraph": ".labeled_paragraph",
+        "NameVersion": ".name_version",
+        "Paragraph": ".paragraph",
+        "ProgressBar": ".progress_bar",
+        "ProgressIndicator": ".progress_indicator",
+        "Question": ".question",
+        "Table": ".table",
+    },
+)
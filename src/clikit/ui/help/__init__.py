@@ -1,2 +1,13 @@
-from .application_help import ApplicationHelp
-from .command_help import CommandHelp
+from typing import TYPE_CHECKING
+
+from clikit.utils._lazy import lazy_attributes
+
+
+if TYPE_CHECKING:
+    from .application_help import ApplicationHelp  # noqa
+    from .command_help import CommandHelp  # noqa
+
+
+lazy_attributes(
+    globals(), {"ApplicationHelp": ".application_help", "CommandHelp": ".command_help"}
+)
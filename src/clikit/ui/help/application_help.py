@@ -74,7 +74,9 @@ class ApplicationHelp(AbstractHelp):
         layout.add(Paragraph("<b>AVAILABLE COMMANDS</b>"))
 
         with layout.block():
-            for command in sorted(commands, key=lambda c: c.name):
+            # Listing the commands only needs their names and descriptions:
+            # the commands not loaded yet are not built
+            for command in sorted(commands.peek(), key=lambda c: c.name):
                 self._render_command(layout, command)
 
         layout.add(EmptyLine())
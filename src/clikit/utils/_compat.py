@@ -5,15 +5,18 @@ try:  # Python 2
     long = long
     unicode = unicode
     basestring = basestring
+    input = raw_input
 except NameError:  # Python 3
     long = int
     unicode = str
     basestring = str
+    input = input
 
 
 PY2 = sys.version_info[0] == 2
 PY35 = sys.version_info >= (3, 5)
 PY36 = sys.version_info >= (3, 6)
+PY37 = sys.version_info >= (3, 7)
 PY38 = sys.version_info >= (3, 8)
 
 if not PY36:
@@ -21,6 +24,11 @@ if not PY36:
 else:
     OrderedDict = dict
 
+try:
+    from collections import abc as collections_abc
+except ImportError:  # Python 2
+    import collections as collections_abc  # noqa
+
 WINDOWS = sys.platform == "win32"
 
 
@@ -0,0 +1,66 @@
+import errno
+import os
+import sys
+
+from ._compat import WINDOWS
+
+
+if hasattr(os, "replace"):
+    _replace = os.replace
+elif WINDOWS:  # Python 2
+
+    def _replace(src, dst):  # type: (str, str) -> None
+        # Windows does not allow renaming over an existing file
+        if os.path.exists(dst):
+            os.remove(dst)
+
+        os.rename(src, dst)
+
+
+else:  # Python 2
+    _replace = os.rename
+
+
+def write_atomically(path, content):  # type: (str, str) -> None
+    """
+    Writes a file so that concurrent readers either read the previous file
+    or the complete new one, never a partially written or missing file.
+
+    The missing parent directories are created.
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            # Created concurrently
+            if e.errno != errno.EEXIST:
+                raise
+
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(content)
+
+        _replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        raise
+
+
+def user_cache_dir(name):  # type: (str) -> str
+    """
+    Returns the per-user cache directory of an application.
+    """
+    if WINDOWS:
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, name)
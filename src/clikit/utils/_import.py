@@ -0,0 +1,15 @@
+from importlib import import_module
+from typing import Any
+
+
+def import_object(path):  # type: (str) -> Any
+    """
+    Imports an object from a "module:qualified.name" path.
+    """
+    module_name, _, name = path.partition(":")
+
+    obj = import_module(module_name)
+    for attribute in name.split("."):
+        obj = getattr(obj, attribute)
+
+    return obj
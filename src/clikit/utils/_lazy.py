@@ -0,0 +1,45 @@
+from importlib import import_module
+from typing import Any
+from typing import Dict
+
+from ._compat import PY37
+
+
+def lazy_attributes(
+    module_globals, attributes
+):  # type: (Dict[str, Any], Dict[str, str]) -> None
+    """
+    Defers the import of a package's public attributes until they are accessed.
+
+    The attributes map each name to the relative module defining it.
+    Python versions without module level __getattr__ support (PEP 562)
+    import all attributes eagerly.
+    """
+    package = module_globals["__name__"]
+    module_globals["__all__"] = list(attributes)
+
+    def load(name):  # type: (str) -> Any
+        value = getattr(import_module(attributes[name], package), name)
+        module_globals[name] = value
+
+        return value
+
+    if not PY37:
+        for name in attributes:
+            load(name)
+
+        return
+
+    def __getattr__(name):  # type: (str) -> Any
+        if name not in attributes:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(package, name)
+            )
+
+        return load(name)
+
+    def __dir__():
+        return sorted(set(module_globals) | set(attributes))
+
+    module_globals["__getattr__"] = __getattr__
+    module_globals["__dir__"] = __dir__
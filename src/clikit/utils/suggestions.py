@@ -0,0 +1,93 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+
+class SuggestionIndex(object):
+    """
+    Finds the names similar to a misspelled one.
+
+    A name is similar if it contains the misspelled name or if their
+    Levenshtein distance is at most a third of the length of the
+    misspelled name.
+
+    The names are kept sorted so that they can be walked like a trie:
+    the rows of the distance matrix computed for a prefix are shared by
+    all the names starting with it, and the names starting with a prefix
+    which is already too far from the misspelled name are skipped.
+    """
+
+    def __init__(self, names):  # type: (Iterable[str]) -> None
+        self._names = sorted(set(names))
+
+    def suggest(self, name):  # type: (str) -> List[str]
+        """
+        Returns the similar names, the closest first.
+        """
+        # Name -> (distance, position of the misspelled name in it)
+        candidates = {}  # type: Dict[str, Tuple[int, float]]
+
+        for actual_name in self._names:
+            position = actual_name.find(name)
+            if position != -1:
+                candidates[actual_name] = (len(actual_name) - len(name), position)
+
+        for actual_name, distance in self._find_close_names(name, len(name) // 3):
+            if actual_name not in candidates:
+                candidates[actual_name] = (distance, float("inf"))
+
+        return sorted(
+            candidates, key=lambda actual_name: (candidates[actual_name], actual_name)
+        )
+
+    def _find_close_names(
+        self, name, limit
+    ):  # type: (str, int) -> List[Tuple[str, int]]
+        names = self._names
+        count = len(names)
+        size = len(name)
+        found = []
+
+        # rows[i] is the last row of the distance matrix between the name
+        # and the first i characters of the previous name
+        rows = [list(range(size + 1))]
+        previous = ""
+
+        i = 0
+        while i < count:
+            actual_name = names[i]
+
+            common = 0
+            max_common = min(len(previous), len(actual_name), len(rows) - 1)
+            while common < max_common and previous[common] == actual_name[common]:
+                common += 1
+
+            del rows[common + 1 :]
+            previous = actual_name
+
+            for depth in range(common, len(actual_name)):
+                row = rows[depth]
+                c = actual_name[depth]
+                current = [row[0] + 1]
+                for j in range(size):
+                    current.append(
+                        min(row[j + 1] + 1, current[j] + 1, row[j] + (name[j] != c))
+                    )
+
+                rows.append(current)
+
+                if min(current) > limit:
+                    # No name starting with this prefix is close enough
+                    prefix = actual_name[: depth + 1]
+                    while i < count and names[i].startswith(prefix):
+                        i += 1
+
+                    break
+            else:
+                if rows[-1][size] <= limit:
+                    found.append((actual_name, rows[-1][size]))
+
+                i += 1
+
+        return found
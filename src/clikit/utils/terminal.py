@@ -4,7 +4,6 @@ import os
 import platform
 import shlex
 import struct
-import subprocess
 
 
 class Terminal(object):
@@ -94,6 +93,8 @@ class Terminal(object):
     def _get_terminal_size_tput(self):
         # get terminal width
         # src: http://stackoverflow.com/questions/263890/how-do-i-find-the-width-height-of-a-terminal-window
+        import subprocess
+
         try:
             cols = int(
                 subprocess.check_output(
@@ -0,0 +1,104 @@
+import pytest
+
+from clikit.api.args.exceptions import NoSuchArgumentException
+from clikit.api.args.exceptions import NoSuchOptionException
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.format import Argument
+from clikit.api.args.format import CommandName
+from clikit.api.args.format import CommandOption
+from clikit.api.args.format import Option
+
+
+@pytest.fixture()
+def base_format():
+    return ArgsFormat(
+        [
+            CommandName("server"),
+            CommandOption("list", "l", ["ls"]),
+            Argument("host", Argument.REQUIRED),
+            Option("verbose", "v"),
+            Option("quiet", "q"),
+        ]
+    )
+
+
+@pytest.fixture()
+def fmt(base_format):
+    return ArgsFormat(
+        [
+            CommandName("add"),
+            Argument("port", Argument.OPTIONAL),
+            Argument("paths", Argument.MULTI_VALUED),
+            Option("force", "f"),
+            Option("quiet", "Q"),
+        ],
+        base_format,
+    )
+
+
+def test_arguments_include_base_arguments(fmt):
+    assert ["host", "port", "paths"] == list(fmt.get_arguments())
+    assert ["port", "paths"] == list(fmt.get_arguments(False))
+
+    assert fmt.has_argument("host")
+    assert not fmt.has_argument("host", False)
+    assert fmt.has_argument(2)
+    assert not fmt.has_argument(3)
+    assert "host" == fmt.get_argument(0).name
+    assert "port" == fmt.get_argument(0, False).name
+    assert "paths" == fmt.get_argument("paths").name
+
+    with pytest.raises(NoSuchArgumentException):
+        fmt.get_argument(3)
+
+    with pytest.raises(NoSuchArgumentException):
+        fmt.get_argument("host", False)
+
+
+def test_argument_flags_include_base_arguments(fmt, base_format):
+    assert fmt.has_multi_valued_argument()
+    assert fmt.has_optional_argument()
+    assert fmt.has_required_argument()
+    assert not fmt.has_required_argument(False)
+    assert not base_format.has_multi_valued_argument()
+
+
+def test_options_include_base_options(fmt):
+    assert ["force", "quiet", "verbose"] == list(fmt.get_options())
+    assert ["force", "quiet"] == list(fmt.get_options(False))
+
+    assert fmt.has_option("v")
+    assert not fmt.has_option("v", False)
+    assert "verbose" == fmt.get_option("v").long_name
+
+    # Options of a format take precedence over the ones of its base format
+    assert "Q" == fmt.get_option("quiet").short_name
+    assert "quiet" == fmt.get_option("q").long_name
+
+    with pytest.raises(NoSuchOptionException):
+        fmt.get_option("verbose", False)
+
+
+def test_command_names_and_options_include_base_ones(fmt):
+    assert ["server", "add"] == [name.string for name in fmt.get_command_names()]
+    assert ["add"] == [name.string for name in fmt.get_command_names(False)]
+
+    assert fmt.has_command_option("ls")
+    assert fmt.has_command_option("l")
+    assert not fmt.has_command_option("ls", False)
+    assert "list" == fmt.get_command_option("ls").long_name
+
+    with pytest.raises(NoSuchOptionException):
+        fmt.get_command_option("list", False)
+
+
+def test_unchanged_tables_are_shared_with_the_base_format(base_format):
+    fmt = ArgsFormat([Option("force", "f")], base_format)
+
+    assert fmt.compiled.arguments is base_format.compiled.arguments
+    assert fmt.compiled.command_options is base_format.compiled.command_options
+    assert fmt.compiled.options is not base_format.compiled.options
+
+    # Returned collections are copies
+    fmt.get_arguments()["foo"] = None
+    assert not fmt.has_argument("foo")
@@ -779,3 +779,76 @@ def test_has_options_with_base_format(base_format_builder):
 
     assert builder.has_options()
     assert builder.has_options(False)
+
+
+def test_add_elements(base_format_builder):
+    base_format_builder.add_option(Option("verbose", "v"))
+    builder = ArgsFormatBuilder(base_format_builder.format)
+
+    server = CommandName("server")
+    cmd_opt = CommandOption("add", "a", ["new"])
+    arg = Argument("host")
+    opts = [Option("option{}".format(i)) for i in range(100)]
+
+    builder.add_elements(server, cmd_opt, arg, *opts)
+
+    fmt = builder.format
+
+    assert [server] == fmt.get_command_names()
+    assert cmd_opt is fmt.get_command_option("new")
+    assert arg is fmt.get_argument("host")
+    assert opts[42] is fmt.get_option("option42")
+    assert fmt.has_option("verbose")
+
+
+@pytest.mark.parametrize(
+    "elements, message",
+    [
+        ([Option("verbose")], 'An option named "--verbose" exists already.'),
+        ([Option("foo", "v")], 'An option named "-v" exists already.'),
+        (
+            [Option("foo"), Option("bar", "b"), Option("foo", "b")],
+            'An option named "--foo" exists already.',
+        ),
+        (
+            [Option("foo", "b"), Option("bar", "b")],
+            'An option named "-b" exists already.',
+        ),
+        (
+            [CommandOption("add", None, ["verbose"])],
+            'An option named "--verbose" exists already.',
+        ),
+        (
+            [Option("add"), CommandOption("add")],
+            'An option named "--add" exists already.',
+        ),
+    ],
+)
+def test_add_elements_fails_if_option_exists(base_format_builder, elements, message):
+    base_format_builder.add_option(Option("verbose", "v"))
+    builder = ArgsFormatBuilder(base_format_builder.format)
+
+    with pytest.raises(CannotAddOptionException) as e:
+        builder.add_elements(*elements)
+
+    assert message == str(e.value)
+
+
+def test_add_elements_fails_if_argument_cannot_be_added(base_format_builder):
+    base_format_builder.add_argument(Argument("path", Argument.OPTIONAL))
+    builder = ArgsFormatBuilder(base_format_builder.format)
+
+    with pytest.raises(CannotAddArgumentException) as e:
+        builder.add_elements(Argument("path"))
+
+    assert 'An argument named "path" exists already.' == str(e.value)
+
+    with pytest.raises(CannotAddArgumentException) as e:
+        builder.add_elements(Argument("host", Argument.REQUIRED))
+
+    assert "Cannot add a required argument after an optional one." == str(e.value)
+
+    with pytest.raises(CannotAddArgumentException) as e:
+        builder.add_elements(Argument("paths", Argument.MULTI_VALUED), Argument("host"))
+
+    assert "Cannot add an argument after a multi-valued argument." == str(e.value)
@@ -0,0 +1,125 @@
+import pytest
+
+from clikit.api.args import Args
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+
+
+@pytest.fixture()
+def fmt():
+    base = ArgsFormat([Option("verbose", "v")])
+
+    return ArgsFormat(
+        [
+            Argument("count", Argument.INTEGER, default=1),
+            Argument("paths", Argument.MULTI_VALUED | Argument.FLOAT),
+            Option("dry-run"),
+            Option("level", "l", Option.REQUIRED_VALUE | Option.INTEGER, default=3),
+            Option("tag", "t", Option.REQUIRED_VALUE | Option.MULTI_VALUED),
+        ],
+        base,
+    )
+
+
+def test_values_are_converted_when_set(fmt, mocker):
+    args = Args(fmt)
+    parse = mocker.spy(Option, "parse")
+
+    args.set_argument("count", "5")
+    args.set_option("level", "7")
+
+    assert 1 == parse.call_count
+    assert 7 == args.option("level")
+    assert 7 == args.option("l")
+    assert 1 == parse.call_count
+
+    assert 5 == args.argument("count")
+    assert 5 == args.argument(0)
+
+
+def test_conversion_errors_are_raised_when_set(fmt):
+    args = Args(fmt)
+
+    with pytest.raises(ValueError):
+        args.set_option("level", "foo")
+
+    with pytest.raises(ValueError):
+        args.set_argument("count", "foo")
+
+    with pytest.raises(ValueError):
+        args.set_argument("paths", ["1", "foo"])
+
+    assert not args.is_option_set("level")
+    assert not args.is_argument_set("count")
+
+
+def test_streamed_values_are_converted_when_consumed(fmt):
+    args = Args(fmt)
+    args.set_argument("paths", iter(["1", "foo"]))
+
+    paths = args.argument("paths")
+
+    assert 1.0 == next(paths)
+    with pytest.raises(ValueError):
+        next(paths)
+
+
+def test_options(fmt):
+    args = Args(fmt)
+    args.set_option("tag", ["a", "b"])
+    args.set_option("verbose")
+
+    assert {"tag": ["a", "b"], "verbose": True} == args.options(False)
+    assert {
+        "dry-run": False,
+        "level": 3,
+        "tag": ["a", "b"],
+        "verbose": True,
+    } == args.options()
+
+
+def test_arguments(fmt):
+    args = Args(fmt)
+    args.set_argument("paths", ["1", "2.5"])
+
+    assert {"paths": [1.0, 2.5]} == args.arguments(False)
+    assert {"count": 1, "paths": [1.0, 2.5]} == args.arguments()
+
+
+def test_values(fmt):
+    args = Args(fmt)
+    args.set_argument("count", "5")
+    args.set_option("dry-run")
+
+    values = args.values
+
+    assert 5 == values.count
+    assert [] == values.paths
+    assert values.dry_run
+    assert 3 == values.level
+    assert not values.verbose
+
+    with pytest.raises(AttributeError):
+        values.foo
+
+    with pytest.raises(AttributeError):
+        values.count = 3
+
+    args.set_argument("count", "6")
+    args.set_option("dry-run", False)
+
+    assert 6 == values.count
+    assert not values.dry_run
+
+
+def test_copy(fmt):
+    args = Args(fmt)
+    args.set_option("tag", ["a"])
+    args.option("tag")
+
+    copy = args.copy()
+    copy.option("tag").append("b")
+
+    assert ["a"] == args.option("tag")
+    assert ["a", "b"] == copy.option("tag")
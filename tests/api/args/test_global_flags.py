@@ -0,0 +1,54 @@
+import pytest
+
+from clikit.api.args import GlobalFlags
+from clikit.args import StringArgs
+
+
+def test_scan_empty():
+    flags = GlobalFlags.scan([])
+
+    assert not flags.help
+    assert not flags.version
+    assert not flags.quiet
+    assert not flags.no_interaction
+    assert flags.decorated is None
+    assert 0 == flags.verbosity
+    assert flags.only_flags
+
+
+def test_scan():
+    flags = GlobalFlags.scan(["-h", "-q", "--no-interaction", "--ansi", "-vv"])
+
+    assert flags.help
+    assert not flags.version
+    assert flags.quiet
+    assert flags.no_interaction
+    assert flags.decorated is True
+    assert 2 == flags.verbosity
+    assert flags.only_flags
+
+
+@pytest.mark.parametrize(
+    "tokens, verbosity", [(["-v"], 1), (["-vv", "-v"], 2), (["-v", "-vvv", "-vv"], 3)]
+)
+def test_scan_keeps_highest_verbosity(tokens, verbosity):
+    assert verbosity == GlobalFlags.scan(tokens).verbosity
+
+
+def test_no_ansi_takes_precedence():
+    assert GlobalFlags.scan(["--ansi", "--no-ansi"]).decorated is False
+
+
+def test_scan_other_tokens():
+    flags = GlobalFlags.scan(["server", "--version", "--port", "80"])
+
+    assert flags.version
+    assert not flags.only_flags
+
+
+def test_raw_args_caches_flags():
+    args = StringArgs("server -V -- --help")
+
+    assert args.global_flags is args.global_flags
+    assert args.global_flags.version
+    assert not args.global_flags.help
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+
+from clikit.api.command import Command
+from clikit.api.command.exceptions import CannotRunCoroutineException
+from clikit.api.config import ApplicationConfig
+from clikit.api.config import CommandConfig
+from clikit.api.io import IO
+from clikit.api.io import Input
+from clikit.api.io import Output
+from clikit.args import StringArgs
+from clikit.console_application import ConsoleApplication
+from clikit.resolver import DefaultResolver
+
+
+class Handler(object):
+    def __init__(self):
+        self.loops = []
+
+    async def handle(self, args, io, command):
+        await asyncio.sleep(0)
+
+        self.loops.append(asyncio.get_event_loop())
+        io.write("handled")
+
+        return 3
+
+
+class Config(ApplicationConfig):
+    @property
+    def default_command_resolver(self):
+        return DefaultResolver()
+
+
+def test_handle_coroutine(io):
+    handler = Handler()
+    command = Command(CommandConfig("command").set_handler(handler))
+
+    assert 3 == command.handle(command.parse(StringArgs("")), io)
+    assert "handled" == io.fetch_output()
+
+
+def test_handle_coroutines_on_the_application_event_loop(io):
+    handler = Handler()
+    config = Config()
+    config.set_catch_exceptions(False)
+    config.set_terminate_after_run(False)
+    config.set_io_factory(
+        lambda app, args, input_stream, output_stream, error_stream: IO(
+            Input(input_stream), Output(output_stream), Output(error_stream)
+        )
+    )
+    config.create_command("command").set_handler(handler)
+    app = ConsoleApplication(config)
+
+    status_codes = app.run_batch(
+        ["command", "command"],
+        io.input.stream,
+        io.output.stream,
+        io.error_output.stream,
+    )
+
+    assert [3, 3] == status_codes
+    assert [app.event_loop, app.event_loop] == handler.loops
+    assert not app.event_loop.is_closed()
+
+
+def test_set_event_loop(io):
+    handler = Handler()
+    config = Config()
+    config.create_command("command").set_handler(handler)
+    app = ConsoleApplication(config)
+    loop = asyncio.new_event_loop()
+    app.set_event_loop(loop)
+
+    command = app.get_command("command")
+    command.handle(command.parse(StringArgs("")), io)
+
+    assert [loop] == handler.loops
+
+    loop.close()
+
+
+def test_handle_coroutine_from_a_running_event_loop_fails(io):
+    handler = Handler()
+    config = Config()
+    config.create_command("command").set_handler(handler)
+    app = ConsoleApplication(config)
+    command = app.get_command("command")
+
+    async def nested():
+        command.handle(command.parse(StringArgs("")), io)
+
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(CannotRunCoroutineException) as e:
+            loop.run_until_complete(nested())
+    finally:
+        loop.close()
+
+    assert 'The handler of the command "command" is a coroutine' in str(e.value)
+    assert [] == handler.loops
+
+
+def test_handle_coroutines_in_other_threads_on_their_own_loop(io):
+    handler = Handler()
+    config = Config()
+    config.create_command("command").set_handler(handler)
+    app = ConsoleApplication(config)
+    command = app.get_command("command")
+    loop = app.event_loop
+    status_codes = []
+
+    def handle():
+        assert app.event_loop is None
+
+        status_codes.append(command.handle(command.parse(StringArgs("")), io))
+
+    threads = [threading.Thread(target=handle) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert [3, 3, 3, 3] == status_codes
+    assert 4 == len(handler.loops)
+    assert loop not in handler.loops
+    assert all(handler_loop.is_closed() for handler_loop in handler.loops)
+
+    loop.close()
@@ -0,0 +1,60 @@
+import pytest
+
+from clikit.api.command import Command
+from clikit.api.command import CommandCollection
+from clikit.api.command.exceptions import NoSuchCommandException
+from clikit.api.config import CommandConfig
+
+
+def create_command(name, *aliases):
+    config = CommandConfig(name)
+    for alias in aliases:
+        config.add_alias(alias)
+
+    return Command(config)
+
+
+@pytest.fixture()
+def commands():
+    return CommandCollection(
+        [
+            create_command("deploy", "push"),
+            create_command("depend"),
+            create_command("list", "ls", "deps"),
+        ]
+    )
+
+
+def test_get(commands):
+    assert "deploy" == commands.get("deploy").name
+    assert "deploy" == commands.get("push").name
+    assert "list" == commands.get("deps").name
+
+    with pytest.raises(NoSuchCommandException):
+        commands.get("dep")
+
+
+def test_names_take_precedence_over_aliases(commands):
+    commands.add(create_command("ls"))
+
+    assert "ls" == commands.get("ls").name
+    assert "list" == commands.get("deps").name
+
+
+def test_get_names(commands):
+    assert ["depend", "deploy", "list"] == commands.get_names()
+    assert ["depend", "deploy", "deps", "list", "ls", "push"] == commands.get_names(
+        True
+    )
+
+    commands.add(create_command("add"))
+
+    assert ["add", "depend", "deploy", "list"] == commands.get_names()
+
+
+def test_find_by_prefix(commands):
+    assert ["depend", "deploy", "list"] == commands.find_by_prefix("dep")
+    assert ["depend"] == commands.find_by_prefix("depe")
+    assert ["deploy"] == commands.find_by_prefix("p")
+    assert ["list"] == commands.find_by_prefix("l")
+    assert [] == commands.find_by_prefix("x")
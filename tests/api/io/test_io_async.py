@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from clikit.io import BufferedIO
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_write_async():
+    io = BufferedIO()
+
+    async def write():
+        await asyncio.gather(*[io.write_line_async(str(i)) for i in range(10)])
+        await io.write_async("<b>done</b>")
+        await io.flush_async()
+
+    run(write())
+
+    assert "\n".join(str(i) for i in range(10)) + "\ndone" == io.fetch_output()
+
+
+def test_error_async():
+    io = BufferedIO()
+
+    async def write():
+        await io.error_line_async("foo")
+        await io.error_async("bar")
+
+    run(write())
+
+    assert "foo\nbar" == io.fetch_error()
+
+
+def test_read_line_async():
+    io = BufferedIO()
+    io.set_input("foo\nbar\n")
+
+    async def read():
+        return [await io.read_line_async(), await io.read_line_async()]
+
+    assert [b"foo\n", b"bar\n"] == run(read())
+
+
+def test_writes_do_not_block_the_event_loop():
+    io = BufferedIO()
+    blocked = threading.Event()
+    released = threading.Event()
+    write = io.write
+
+    def slow_write(string, flags=None):
+        blocked.set()
+        released.wait(5)
+        write(string, flags)
+
+    io.write = slow_write
+
+    async def main():
+        writing = io.write_async("slow")
+
+        while not blocked.is_set():
+            await asyncio.sleep(0.001)
+
+        # The loop keeps running while the write is blocked
+        released.set()
+        await writing
+
+    run(main())
+
+    assert "slow" == io.fetch_output()
+
+
+def test_close_shuts_the_thread_down():
+    io = BufferedIO()
+
+    async def write():
+        await io.write_async("foo")
+
+    run(write())
+    io.close()
+
+    assert io._executor is None
@@ -0,0 +1,61 @@
+import pytest
+
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.format import Argument
+from clikit.api.args.format import CommandName
+from clikit.api.args.format import Option
+from clikit.args import StringArgs
+from clikit.args.args_signature import ArgsSignature
+
+
+@pytest.fixture()
+def fmt():
+    base = ArgsFormat([CommandName("server", ["srv"]), Option("verbose", "v")])
+
+    return ArgsFormat(
+        [
+            CommandName("add"),
+            Argument("host", Argument.REQUIRED),
+            Argument("port", Argument.OPTIONAL),
+            Option("timeout", "t", Option.REQUIRED_VALUE),
+            Option("force", "f"),
+        ],
+        base,
+    )
+
+
+@pytest.mark.parametrize(
+    "string, rejected",
+    [
+        ("server add localhost", False),
+        ("srv add localhost 80", False),
+        ("localhost 80", False),
+        ("server add", True),
+        ("", True),
+        ("server add localhost 80 foo", True),
+        ("localhost 80 foo", True),
+        ("server add -t 10", True),
+        ("server add -t10 localhost", False),
+        ("server add -ft 10", True),
+        ("server add --timeout=10 localhost", False),
+        ("server add -v -f localhost", False),
+        ("server add -- -f", False),
+        ("server add -t -f", True),
+        # Unknown options are left to the parser
+        ("server add --unknown", False),
+        ("server add -x", False),
+    ],
+)
+def test_rejects(fmt, string, rejected):
+    assert rejected == ArgsSignature.get(fmt).rejects(StringArgs(string))
+
+
+def test_signatures_are_cached(fmt):
+    assert ArgsSignature.get(fmt) is ArgsSignature.get(fmt)
+
+
+def test_multi_valued_arguments_accept_any_number_of_values():
+    fmt = ArgsFormat([Argument("paths", Argument.MULTI_VALUED | Argument.REQUIRED)])
+
+    assert ArgsSignature.get(fmt).rejects(StringArgs(""))
+    assert not ArgsSignature.get(fmt).rejects(StringArgs("a b c d e f"))
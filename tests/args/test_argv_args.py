@@ -1,3 +1,4 @@
+import io
 import sys
 
 import pytest
@@ -75,3 +76,57 @@ def test_to_string():
     assert "console server add --port 80 localhost" == args.to_string()
     assert "console server add --port 80 localhost" == args.to_string(True)
     assert "server add --port 80 localhost" == args.to_string(False)
+
+
+def test_response_files_are_ignored_by_default(tmpdir):
+    path = tmpdir.join("paths.txt")
+    path.write("foo\nbar\n")
+
+    args = ArgvArgs(["console", "add", "@" + str(path)])
+
+    assert ["add", "@" + str(path)] == args.tokens
+    assert args.streamed_values is None
+
+
+def test_response_files(tmpdir):
+    path = tmpdir.join("paths.txt")
+    path.write_binary(b"foo\r\nbar\n\nbaz")
+
+    args = ArgvArgs(["console", "add", "@" + str(path), "qux"], response_files=True)
+
+    assert ["add", "qux"] == args.tokens
+    assert ["foo", "bar", "baz"] == list(args.streamed_values)
+
+
+def test_args_from_stdin(mocker):
+    stdin = io.BytesIO(b"foo\0bar baz\0\0qux\n\0")
+    mocker.patch("sys.stdin", mocker.Mock(buffer=stdin))
+
+    args = ArgvArgs(["console", "add", "--args-from", "-"], response_files=True)
+
+    assert ["add"] == args.tokens
+    # Nothing is read before the values are consumed
+    assert 0 == stdin.tell()
+    assert ["foo", "bar baz", "qux\n"] == list(args.streamed_values)
+
+
+def test_args_from_file_and_response_files_are_chained(tmpdir):
+    nul = tmpdir.join("paths.bin")
+    nul.write_binary(b"foo\0bar")
+    lines = tmpdir.join("paths.txt")
+    lines.write("baz\n")
+
+    args = ArgvArgs(
+        ["console", "add", "--args-from=" + str(nul), "@" + str(lines)],
+        response_files=True,
+    )
+
+    assert ["add"] == args.tokens
+    assert ["foo", "bar", "baz"] == list(args.streamed_values)
+
+
+def test_response_files_after_double_dash_are_kept(tmpdir):
+    args = ArgvArgs(["console", "add", "--", "@foo", "@"], response_files=True)
+
+    assert ["add", "--", "@foo", "@"] == args.tokens
+    assert args.streamed_values is None
@@ -6,6 +6,7 @@ from clikit.api.args.format import ArgsFormatBuilder
 from clikit.api.args.format import Argument
 from clikit.api.args.format import CommandName
 from clikit.api.args.format import Option
+from clikit.args import ArgvArgs
 from clikit.args import DefaultArgsParser
 from clikit.args import StringArgs
 
@@ -407,3 +408,115 @@ def test_parse_option_up_to_invalid_option_if_lenient(parser):
 
     assert {"argument": "bar"} == args.arguments(False)
     assert {} == args.options(False)
+
+
+def test_parse_many_values_and_reuse_format(parser):
+    builder = ArgsFormatBuilder()
+    builder.add_command_name(CommandName("server"))
+    builder.add_argument(Argument("paths", Argument.MULTI_VALUED))
+    builder.add_option(Option("level", "l", Option.REQUIRED_VALUE))
+    builder.add_option(Option("force", "f"))
+    fmt = builder.format
+
+    paths = ["path{}".format(i) for i in range(10000)]
+    raw_args = StringArgs("")
+    raw_args.tokens[:] = ["server", "-l", "3"] + paths + ["--force"]
+
+    args = parser.parse(raw_args, fmt)
+
+    assert paths == args.argument("paths")
+    assert {"level": "3", "force": True} == args.options(False)
+    assert ["server", "-l", "3"] == raw_args.tokens[:3]
+
+    # The tokens are not consumed and the format is reused
+    args = DefaultArgsParser().parse(raw_args, fmt)
+
+    assert paths == args.argument("paths")
+
+
+def test_parse_streamed_values(parser, tmpdir):
+    path = tmpdir.join("paths.txt")
+    path.write("\n".join("path{}".format(i) for i in range(3, 1000)))
+
+    builder = ArgsFormatBuilder()
+    builder.add_command_name(CommandName("server"))
+    builder.add_argument(Argument("name", Argument.REQUIRED))
+    builder.add_argument(Argument("paths", Argument.MULTI_VALUED | Argument.REQUIRED))
+    fmt = builder.format
+
+    raw_args = ArgvArgs(
+        ["console", "server", "foo", "path1", "@" + str(path), "path2"],
+        response_files=True,
+    )
+
+    args = parser.parse(raw_args, fmt)
+
+    paths = args.argument("paths")
+    assert "foo" == args.argument("name")
+    assert not isinstance(paths, list)
+    assert ["path{}".format(i) for i in range(1, 1000)] == list(paths)
+
+
+def test_parse_streamed_values_fails_if_last_argument_not_multi_valued(parser, tmpdir):
+    path = tmpdir.join("paths.txt")
+    path.write("foo\n")
+
+    builder = ArgsFormatBuilder()
+    builder.add_argument(Argument("path"))
+    fmt = builder.format
+
+    raw_args = ArgvArgs(["console", "@" + str(path)], response_files=True)
+
+    with pytest.raises(CannotParseArgsException) as e:
+        parser.parse(raw_args, fmt)
+
+    assert "Values can only be streamed to a multi-valued argument." == str(e.value)
+
+    assert {} == parser.parse(raw_args, fmt, lenient=True).arguments(False)
+
+
+def test_parse_suggests_similar_options(parser):
+    builder = ArgsFormatBuilder()
+    builder.add_option(Option("force", "f"))
+    builder.add_option(Option("format", None, Option.REQUIRED_VALUE))
+    builder.add_option(Option("verbose", "v"))
+    fmt = builder.format
+
+    with pytest.raises(NoSuchOptionException) as e:
+        parser.parse(StringArgs("--forse"), fmt)
+
+    assert (
+        'The "--forse" option does not exist.\n'
+        "\n"
+        "Did you mean this?\n"
+        "    --force"
+    ) == str(e.value)
+
+    with pytest.raises(NoSuchOptionException) as e:
+        parser.parse(StringArgs("--for"), fmt)
+
+    assert (
+        'The "--for" option does not exist.\n'
+        "\n"
+        "Did you mean one of these?\n"
+        "    --force\n"
+        "    --format"
+    ) == str(e.value)
+
+    with pytest.raises(NoSuchOptionException) as e:
+        parser.parse(StringArgs("-x"), fmt)
+
+    assert 'The "-x" option does not exist.' == str(e.value)
+
+
+def test_parse_fails_for_invalid_typed_values(parser):
+    builder = ArgsFormatBuilder()
+    builder.add_argument(Argument("count", Argument.INTEGER))
+    builder.add_option(Option("level", flags=Option.REQUIRED_VALUE | Option.INTEGER))
+    fmt = builder.format
+
+    with pytest.raises(ValueError):
+        parser.parse(StringArgs("abc"), fmt)
+
+    with pytest.raises(ValueError):
+        parser.parse(StringArgs("1 --level abc"), fmt)
@@ -36,6 +36,11 @@ from clikit.args import StringArgs
         ("--long-option='foo bar'\"another\"", ["--long-option=foo baranother"]),
         ("foo -a -ffoo --long bar", ["foo", "-a", "-ffoo", "--long", "bar"]),
         ("\\' \\\"", ["'", '"']),
+        ("foo\\ bar \\n", ["foo\\ bar", "\\n"]),
+        ("'a \"b\" c' d", ['a "b" c', "d"]),
+        ("\"a 'b", ["a 'b'"]),
+        ('"" foo', ["", "foo"]),
+        ("foo\\", ["foo\\"]),
     ],
 )
 def test_create(string, tokens):
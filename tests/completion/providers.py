@@ -0,0 +1,26 @@
+import time
+
+
+calls = []
+
+
+def branches(words):
+    calls.append(words)
+
+    return ["master", "main", "develop"]
+
+
+def slow(words):
+    time.sleep(1)
+
+    return ["late"]
+
+
+def failing(words):
+    raise RuntimeError("Failed")
+
+
+def hosts(words):
+    calls.append(words)
+
+    return ["localhost", "example.com"]
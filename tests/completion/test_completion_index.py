@@ -0,0 +1,166 @@
+import pytest
+
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import ApplicationConfig
+from clikit.completion import CompletionIndex
+from clikit.completion import ProviderRunner
+
+from . import providers
+
+
+@pytest.fixture()
+def config():
+    config = ApplicationConfig("app")
+    config.add_option("verbose", "v", description="Verbose output")
+    config.add_option("profile", None, Option.REQUIRED_VALUE)
+    config.set_completion_provider("profile", "tests.completion.providers:branches")
+
+    with config.command("checkout") as c:
+        c.set_description("Checkout a branch")
+        c.add_alias("co")
+        c.add_option("force", "f")
+        c.add_option("remote", "r", Option.REQUIRED_VALUE)
+        c.add_argument("branch", Argument.REQUIRED)
+        c.add_argument("paths", Argument.MULTI_VALUED)
+        c.set_completion_provider("branch", providers.branches)
+
+    with config.command("commit") as c:
+        c.set_description("Record changes")
+
+        with c.sub_command("amend") as sc:
+            sc.add_option("all", "a")
+
+    with config.command("secret") as c:
+        c.hide()
+
+    return config
+
+
+@pytest.fixture()
+def index(config, tmpdir):
+    path = str(tmpdir.join("index.json"))
+    CompletionIndex.from_config(config).dump(path)
+
+    return CompletionIndex.load(path)
+
+
+@pytest.fixture()
+def runner(tmpdir):
+    del providers.calls[:]
+
+    return ProviderRunner(str(tmpdir.join("values")))
+
+
+def test_complete_command_names(index):
+    assert [
+        ("checkout", "Checkout a branch"),
+        ("commit", "Record changes"),
+    ] == index.complete([""])
+    assert [("commit", "Record changes")] == index.complete(["com"])
+    assert [("amend", "")] == index.complete(["commit", ""])
+
+
+def test_complete_options(index):
+    assert [("--verbose", "Verbose output"), ("--profile", "")] == index.complete(
+        ["--"]
+    )
+    assert [
+        ("--verbose", "Verbose output"),
+        ("-v", "Verbose output"),
+        ("--profile", ""),
+        ("--force", ""),
+        ("-f", ""),
+        ("--remote", ""),
+        ("-r", ""),
+    ] == index.complete(["co", "-"])
+    assert [("--all", "")] == index.complete(["commit", "amend", "--a"])
+
+
+def test_complete_argument_values(index, runner):
+    assert [("master", ""), ("main", "")] == index.complete(["checkout", "ma"], runner)
+    assert [["checkout"]] == providers.calls
+
+    # A value is already passed for the branch argument
+    assert [] == index.complete(["checkout", "main", "ma"], runner)
+
+
+def test_complete_option_values(index, runner):
+    assert [("develop", "")] == index.complete(["--profile", "d"], runner)
+
+    # Options taking a value consume the next word
+    assert [("checkout", "Checkout a branch")] == index.complete(
+        ["--profile", "main", "check"], runner
+    )
+    assert [] == index.complete(["co", "-r", "origin", "-f", "--", "ma"])
+
+
+def test_complete_without_runner_ignores_providers(index):
+    assert [] == index.complete(["checkout", "ma"])
+
+
+def test_provider_results_are_cached(runner):
+    path = "tests.completion.providers:branches"
+
+    assert ["master", "main", "develop"] == runner.run(path, ["checkout"])
+    assert ["master", "main", "develop"] == runner.run(path, ["checkout"])
+    assert 1 == len(providers.calls)
+
+    runner.run(path, ["checkout"], ttl=0)
+    assert 2 == len(providers.calls)
+
+
+def test_slow_or_failing_providers_are_abandoned(runner):
+    assert [] == runner.run("tests.completion.providers:slow", [], timeout=0.01)
+    assert [] == runner.run("tests.completion.providers:failing", [])
+
+
+def test_providers_which_cannot_be_imported():
+    config = ApplicationConfig("app")
+    config.add_option("profile", None, Option.REQUIRED_VALUE)
+    config.set_completion_provider("profile", lambda words: ["dev"])
+
+    with pytest.raises(ValueError):
+        CompletionIndex.from_config(config)
+
+    index = CompletionIndex.from_config(config, strict=False)
+
+    assert ["--profile"] == [name for name, _ in index.complete(["--pro"])]
+    assert [] == index.complete(["--profile", "d"], ProviderRunner())
+
+
+def test_complete_arguments_of_default_commands(runner):
+    config = ApplicationConfig("app")
+
+    with config.command("run") as c:
+        c.anonymous()
+        c.add_argument("host")
+        c.set_completion_provider("host", providers.hosts)
+
+    with config.command("server") as c:
+        with c.sub_command("list") as sc:
+            sc.default()
+            sc.add_argument("filter")
+            sc.set_completion_provider("filter", providers.branches)
+
+    index = CompletionIndex.from_config(config)
+
+    assert [("server", "")] == index.complete(["s"], runner)
+    assert [("localhost", "")] == index.complete(["l"], runner)
+    assert [("master", ""), ("main", "")] == index.complete(["server", "m"], runner)
+    assert [("list", "")] == index.complete(["server", "li"], runner)
+
+
+def test_complete_arguments_after_the_arguments_of_the_parents(runner):
+    config = ApplicationConfig("app")
+    config.add_argument("host")
+    config.set_completion_provider("host", providers.hosts)
+
+    with config.command("deploy") as c:
+        c.add_argument("branch")
+        c.set_completion_provider("branch", providers.branches)
+
+    index = CompletionIndex.from_config(config)
+
+    assert [("example.com", "")] == index.complete(["deploy", "e"], runner)
+    assert [("main", "")] == index.complete(["deploy", "example.com", "mai"], runner)
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import ApplicationConfig
+from clikit.api.io import IO
+from clikit.api.io import Input
+from clikit.api.io import Output
+from clikit.args import StringArgs
+from clikit.config import CommandTreeCache
+from clikit.console_application import ConsoleApplication
+from clikit.handler.callback_handler import CallbackHandler
+from clikit.io.input_stream import StringInputStream
+from clikit.io.output_stream import BufferedOutputStream
+from clikit.resolver import DefaultResolver
+
+
+class AddHandler(object):
+    def handle(self, args, io, command):
+        io.write("{} {}".format(args.argument("path"), args.option("force")))
+
+        return 0
+
+
+class CachedApplicationConfig(ApplicationConfig):
+
+    configured = 0
+
+    def __init__(self, cache_dir, version="1.0"):
+        self._cache_dir = cache_dir
+
+        super(CachedApplicationConfig, self).__init__("app", version)
+
+    def configure(self):
+        self.set_catch_exceptions(False)
+        self.set_terminate_after_run(False)
+        self.set_io_factory(
+            lambda app, args, input_stream, output_stream, error_stream: IO(
+                Input(input_stream), Output(output_stream), Output(error_stream)
+            )
+        )
+
+    def configure_commands(self):
+        CachedApplicationConfig.configured += 1
+
+        with self.command("server") as c:
+            c.add_alias("srv")
+            c.set_description("Manages servers")
+
+            with c.sub_command("add") as sc:
+                sc.default()
+                sc.add_argument("path", Argument.MULTI_VALUED, "The paths")
+                sc.add_option("force", "f", Option.NO_VALUE, "Force")
+                sc.add_option(
+                    "level", "l", Option.REQUIRED_VALUE | Option.INTEGER, default=3
+                )
+                sc.add_option(
+                    "size", None, Option.REQUIRED_VALUE, default=(80, [24, (1,)])
+                )
+                sc.set_handler(AddHandler)
+                sc.set_completion_provider("path", "os:listdir", timeout=1)
+
+        self.create_command("hidden").hide().disable()
+
+    @property
+    def command_tree_cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def default_command_resolver(self):
+        return DefaultResolver()
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CachedApplicationConfig.configured = 0
+
+
+def run(config, string):
+    output = BufferedOutputStream()
+    app = ConsoleApplication(config)
+
+    status = app.run(StringArgs(string), StringInputStream(""), output, output)
+
+    return status, output.fetch()
+
+
+def test_cache_is_written_then_used(tmpdir):
+    cache_dir = str(tmpdir.join("cache"))
+
+    config = CachedApplicationConfig(cache_dir)
+    assert 1 == CachedApplicationConfig.configured
+    assert tmpdir.join("cache", "commands.json").check()
+
+    config = CachedApplicationConfig(cache_dir)
+    assert 1 == CachedApplicationConfig.configured
+
+    server = config.get_command_config("server")
+    assert ["srv"] == server.aliases
+    assert "Manages servers" == server.description
+
+    add = server.get_sub_command_config("add")
+    assert add.is_default()
+    assert not add.is_anonymous()
+    assert Argument.MULTI_VALUED & add.arguments["path"].flags
+    assert "The paths" == add.arguments["path"].description
+    assert 3 == add.options["level"].default
+    assert "l" == add.options["level"].short_name
+    assert (80, [24, (1,)]) == add.options["size"].default
+    assert {"path": ("os:listdir", 1, None)} == add.completion_providers
+
+    hidden = config.get_command_config("hidden")
+    assert hidden.is_hidden()
+    assert not hidden.is_enabled()
+
+    assert (0, "['a', 'b'] True") == run(config, "srv add a b -f")
+
+
+def test_cache_is_invalidated_when_the_key_changes(tmpdir):
+    cache_dir = str(tmpdir)
+
+    CachedApplicationConfig(cache_dir, "1.0")
+    CachedApplicationConfig(cache_dir, "2.0")
+    assert 2 == CachedApplicationConfig.configured
+
+    CachedApplicationConfig(cache_dir, "2.0")
+    assert 2 == CachedApplicationConfig.configured
+
+
+def test_invalid_cache_falls_back_to_configuration(tmpdir):
+    tmpdir.join("commands.json").write("{invalid")
+
+    config = CachedApplicationConfig(str(tmpdir))
+
+    assert 1 == CachedApplicationConfig.configured
+    assert (0, "['a'] False") == run(config, "server add a")
+
+    content = json.loads(tmpdir.join("commands.json").read())
+    assert CommandTreeCache.VERSION == content["version"]
+
+
+def test_uncacheable_handlers_are_not_cached(tmpdir):
+    class UncacheableConfig(CachedApplicationConfig):
+        def configure_commands(self):
+            super(UncacheableConfig, self).configure_commands()
+
+            self.create_command("callback").set_handler(
+                CallbackHandler(lambda args, io: 0)
+            )
+
+    config = UncacheableConfig(str(tmpdir))
+
+    assert not tmpdir.join("commands.json").check()
+    assert config.has_command_configs()
+
+    UncacheableConfig(str(tmpdir))
+    assert 2 == CachedApplicationConfig.configured
@@ -0,0 +1,161 @@
+import os
+import sys
+import textwrap
+
+import pytest
+
+from clikit.api.config import ApplicationConfig
+from clikit.api.config import PluginCommandConfig
+from clikit.api.io import IO
+from clikit.api.io import Input
+from clikit.api.io import Output
+from clikit.args import StringArgs
+from clikit.config import PluginIndex
+from clikit.console_application import ConsoleApplication
+from clikit.io.input_stream import StringInputStream
+from clikit.io.output_stream import BufferedOutputStream
+from clikit.resolver import DefaultResolver
+from clikit.ui.help import ApplicationHelp
+
+
+PLUGIN = """
+from clikit.api.config import CommandConfig
+
+
+class DeployHandler(object):
+    def handle(self, args, io, command):
+        io.write("Deploying to {}".format(args.argument("target")))
+
+        return 0
+
+
+def commands():
+    deploy = CommandConfig("deploy")
+    deploy.set_description("Deploys the application")
+    deploy.add_alias("ship")
+    deploy.add_argument("target")
+    deploy.set_handler(DeployHandler)
+
+    return [deploy, CommandConfig("rollback").hide()]
+"""
+
+
+class PluginApplicationConfig(ApplicationConfig):
+    def __init__(self, cache_dir):
+        self._cache_dir = cache_dir
+
+        super(PluginApplicationConfig, self).__init__("app")
+
+    def configure(self):
+        self.set_catch_exceptions(False)
+        self.set_terminate_after_run(False)
+        self.set_io_factory(
+            lambda app, args, input_stream, output_stream, error_stream: IO(
+                Input(input_stream), Output(output_stream), Output(error_stream)
+            )
+        )
+
+    @property
+    def command_tree_cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def plugin_entry_point_group(self):
+        return "clikit_test.commands"
+
+    @property
+    def default_command_resolver(self):
+        return DefaultResolver()
+
+
+@pytest.fixture()
+def site_packages(tmpdir, monkeypatch):
+    site_packages = tmpdir.mkdir("site-packages")
+    site_packages.join("clikit_test_plugin.py").write(PLUGIN)
+
+    dist_info = site_packages.mkdir("clikit_test_plugin-1.0.dist-info")
+    dist_info.join("METADATA").write(
+        "Metadata-Version: 2.1\nName: clikit-test-plugin\nVersion: 1.0\n"
+    )
+    dist_info.join("entry_points.txt").write(
+        textwrap.dedent(
+            """\
+            [clikit_test.commands]
+            deploy = clikit_test_plugin:commands
+            """
+        )
+    )
+
+    monkeypatch.syspath_prepend(str(site_packages))
+
+    yield site_packages
+
+    sys.modules.pop("clikit_test_plugin", None)
+
+
+def test_plugin_commands_are_loaded_on_use(site_packages, tmpdir, io):
+    cache_dir = str(tmpdir.join("cache"))
+
+    # Building the index imports the plugin
+    PluginApplicationConfig(cache_dir)
+    assert tmpdir.join("cache", "plugins-clikit_test.commands.json").check()
+    del sys.modules["clikit_test_plugin"]
+
+    config = PluginApplicationConfig(cache_dir)
+    deploy = config.get_command_config("deploy")
+    assert isinstance(deploy, PluginCommandConfig)
+    assert ["ship"] == deploy.aliases
+    assert "Deploys the application" == deploy.description
+    assert config.get_command_config("rollback").is_hidden()
+
+    app = ConsoleApplication(config)
+    assert app.has_command("ship")
+
+    ApplicationHelp(app).render(io)
+    assert "Deploys the application" in io.fetch_output()
+    assert "rollback" not in io.fetch_output()
+    assert "clikit_test_plugin" not in sys.modules
+
+    output = BufferedOutputStream()
+    status = app.run(
+        StringArgs("ship production"), StringInputStream(""), output, output
+    )
+
+    assert 0 == status
+    assert "Deploying to production" == output.fetch()
+    assert "clikit_test_plugin" in sys.modules
+
+
+def test_index_is_rebuilt_when_distributions_change(site_packages, tmpdir):
+    index = PluginIndex("clikit_test.commands", str(tmpdir.join("cache")))
+    key = index.key
+
+    assert key == index.key
+
+    site_packages.mkdir("other-1.0.dist-info")
+    os.utime(str(site_packages), (0, 0))
+
+    assert key != index.key
+
+
+def test_index_without_cache_dir(site_packages):
+    index = PluginIndex("clikit_test.commands")
+
+    configs = index.get_command_configs()
+
+    assert ["deploy", "rollback"] == [config.name for config in configs]
+    assert "deploy" == configs[0].load().name
+    assert configs[0].is_loaded()
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="XDG_CACHE_HOME is used on Linux"
+)
+def test_index_is_cached_per_user_by_default(site_packages, tmpdir, environ):
+    environ["XDG_CACHE_HOME"] = str(tmpdir.join("xdg"))
+
+    config = PluginApplicationConfig(None)
+
+    assert str(tmpdir.join("xdg", "app")) == config.plugin_cache_dir
+    assert tmpdir.join("xdg", "app", "plugins-clikit_test.commands.json").check()
+    assert ["deploy", "rollback"] == [c.name for c in config.command_configs]
@@ -4,6 +4,22 @@ import pytest
 
 from clikit.formatter import AnsiFormatter
 from clikit.io import BufferedIO
+from clikit.utils._compat import PY2
+from clikit.utils._compat import PY35
+
+
+# Coroutines cannot be written before Python 3.5
+collect_ignore = []
+if not PY35:
+    collect_ignore += [
+        "api/command/test_command_async.py",
+        "api/io/test_io_async.py",
+        "parallel/test_parallel_runner_async.py",
+    ]
+
+# The parallel runner relies on concurrent.futures
+if PY2:
+    collect_ignore += ["parallel"]
 
 
 @pytest.fixture()
@@ -0,0 +1,118 @@
+from pastel import Pastel
+
+from clikit.api.formatter import Style
+from clikit.api.formatter import StyleSet
+from clikit.formatter import AnsiFormatter
+from clikit.formatter import DefaultStyleSet
+from clikit.formatter import PlainFormatter
+from clikit.formatter.style_table import CompiledStyle
+from clikit.formatter.style_table import StyleTable
+
+
+def test_table_is_shared_by_formatters_of_the_same_style_set():
+    style_set = DefaultStyleSet()
+
+    ansi = AnsiFormatter(style_set)
+    plain = PlainFormatter(style_set)
+
+    shared = StyleTable.for_style_set(style_set)
+
+    assert ansi._formatter._styles._parent is shared
+    assert plain._formatter._styles._parent is shared
+    assert (
+        AnsiFormatter()._formatter._styles._parent
+        is PlainFormatter()._formatter._styles._parent
+    )
+
+
+def test_table_is_recompiled_when_the_style_set_changes():
+    style_set = DefaultStyleSet()
+    table = StyleTable.for_style_set(style_set)
+
+    style_set.add(Style("foo").fg("red"))
+
+    assert StyleTable.for_style_set(style_set) is not table
+    assert "foo" in StyleTable.for_style_set(style_set)
+    assert "foo" not in table
+
+
+def test_add_style_extends_the_table_of_a_single_formatter():
+    style_set = DefaultStyleSet()
+    formatter = AnsiFormatter(style_set)
+    other = AnsiFormatter(style_set)
+    shared = StyleTable.for_style_set(style_set)
+
+    formatter.add_style(Style("hl").fg("black").bg("white"))
+
+    assert "\033[30;107mfoo\033[0m" == formatter.format("<hl>foo</hl>")
+    assert "<hl>foo</hl>" == other.format("<hl>foo</hl>")
+    assert formatter._formatter._styles._parent is shared
+    assert "hl" not in shared
+
+
+def test_pastel_styles_can_be_added_and_removed():
+    style_set = DefaultStyleSet()
+    formatter = AnsiFormatter(style_set)
+    other = AnsiFormatter(style_set)
+
+    formatter._formatter.add_style("bar", "blue")
+    formatter._formatter.remove_style("info")
+
+    assert "\033[34mfoo\033[0m" == formatter.format("<bar>foo</bar>")
+    assert "<info>foo</info>" == formatter.format("<info>foo</info>")
+    assert not formatter._formatter.has_style("info")
+    assert "bar" not in StyleTable.for_style_set(style_set)
+    assert "\033[32mfoo\033[0m" == other.format("<info>foo</info>")
+
+    formatter._formatter.remove_style("bar")
+
+    assert "<bar>foo</bar>" == formatter.format("<bar>foo</bar>")
+    tags = [tag for tag, _ in formatter._formatter._styles.items()]
+    assert "bar" not in tags
+    assert "info" not in tags
+
+
+def test_compiled_styles_match_pastel_output():
+    pastel = Pastel(True)
+    pastel.add_style("error", "red", None, ["bold"])
+    pastel.add_style("b", None, None, ["bold"])
+    formatter = AnsiFormatter(DefaultStyleSet())
+
+    message = "<error>foo</error> <fg=blue;options=underline>bar</> <b>baz</b>"
+
+    assert pastel.colorize(message) == formatter.format(message)
+
+
+def test_compiled_style_sequences():
+    style = CompiledStyle("green", "black", ["bold", "underline"])
+
+    assert "\033[32;40;1;4m" == style.open_sequence
+    assert "\033[0m" == style.close_sequence
+    assert "foo" == CompiledStyle().apply("foo")
+
+
+def test_pastel_default_styles_are_kept():
+    formatter = AnsiFormatter(StyleSet())
+
+    assert "\033[32mfoo\033[0m" == formatter.format("<info>foo</info>")
+    assert "foo" == PlainFormatter(StyleSet()).format("<info>foo</info>")
+
+
+class PastelWithoutStyleDictionary(object):
+    def __init__(self):
+        self.styles = {}
+
+    def add_style(self, name, fg=None, bg=None, options=None):
+        self.styles[name] = (fg, bg, options)
+
+
+def test_styles_are_added_one_by_one_without_a_pastel_style_dictionary():
+    table = StyleTable.for_style_set(DefaultStyleSet())
+    table = table.extend(Style("hl").fg("black").bold())
+    pastel = PastelWithoutStyleDictionary()
+
+    table.install(pastel)
+
+    assert ("black", None, ["bold"]) == pastel.styles["hl"]
+    assert "info" in pastel.styles
+    assert "c1" in pastel.styles
@@ -83,3 +83,38 @@ def test_help_option_ignored(app, args):
     with help_spy(help_command) as spy:
         app.run(StringArgs(args))
         assert not spy.called, "help command called"
+
+
+def test_help_option_without_command_skips_parsing(app, mocker):
+    parse = mocker.spy(app.get_command("help").config.args_parser, "parse")
+    help_command = app.get_command("help")
+
+    with help_spy(help_command) as spy:
+        app.run(StringArgs("--help -q"))
+
+    assert spy.called, "help command not called"
+    assert 0 == parse.call_count
+
+
+@pytest.mark.parametrize("args", ["--version", "-V", "command run --help -V"])
+def test_version_option(app, args, capsys):
+    help_command = app.get_command("help")
+    with help_spy(help_command) as spy:
+        assert 0 == app.run(StringArgs(args))
+        assert not spy.called, "help command called"
+
+    assert "The Application version 1.2.3" in capsys.readouterr().out
+
+
+def test_version_option_with_an_unknown_command(app, capsys):
+    assert 0 != app.run(StringArgs("does-not-exist --version"))
+
+    output = capsys.readouterr().out
+    assert 'The command "does-not-exist" is not defined.' in output
+    assert "The Application version 1.2.3" not in output
+
+
+def test_version_option_with_a_command(app, capsys):
+    assert 0 == app.run(StringArgs("command run foo --version"))
+
+    assert "The Application version 1.2.3" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+import pytest
+
+from clikit.api.args import Args
+from clikit.api.args.format import Argument
+from clikit.args.string_args import StringArgs
+from clikit.completion.__main__ import main
+from clikit.config.default_application_config import DefaultApplicationConfig
+from clikit.console_application import ConsoleApplication
+from clikit.handler.completions_handler import CompletionsHandler
+
+
+@pytest.fixture()
+def index_path(tmpdir):
+    return str(tmpdir.join("app.json"))
+
+
+@pytest.fixture()
+def app(index_path):
+    config = DefaultApplicationConfig("app")
+
+    with config.command("completions") as c:
+        c.add_argument("shell", Argument.REQUIRED)
+        c.set_handler(CompletionsHandler(index_path))
+
+    with config.command("install") as c:
+        c.set_description("Install\nthe dependencies")
+        c.add_option("dry-run")
+
+    return ConsoleApplication(config)
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+def test_handle(app, io, index_path, shell):
+    command = app.get_command("completions")
+    args = Args(command.args_format, StringArgs(""))
+    args.set_argument("shell", shell)
+
+    assert 0 == command.config.handler.handle(args, io, command)
+
+    script = io.fetch_output()
+    assert "-m clikit.completion {} {}".format(index_path, shell) in script
+    assert "app" in script
+
+
+def test_handle_fails_for_unknown_shells(app, io):
+    command = app.get_command("completions")
+    args = Args(command.args_format, StringArgs(""))
+    args.set_argument("shell", "powershell")
+
+    with pytest.raises(ValueError):
+        command.config.handler.handle(args, io, command)
+
+
+def test_completion_entry_point(app, io, index_path, capsys):
+    command = app.get_command("completions")
+    args = Args(command.args_format, StringArgs(""))
+    args.set_argument("shell", "zsh")
+    command.config.handler.handle(args, io, command)
+
+    assert 0 == main([index_path, "zsh", "ins"])
+    assert "install:Install\n" == capsys.readouterr().out
+
+    assert 0 == main([index_path, "bash", "install", "--d"])
+    assert "--dry-run\n" == capsys.readouterr().out
@@ -0,0 +1,189 @@
+import threading
+import time
+
+import pytest
+
+from clikit.api.args.format import Argument
+from clikit.api.io.flags import VERBOSE
+from clikit.args import StringArgs
+from clikit.config.default_application_config import DefaultApplicationConfig
+from clikit.console_application import ConsoleApplication
+from clikit.handler.callback_handler import CallbackHandler
+from clikit.parallel import ParallelRunner
+from clikit.ui.components import Table
+from clikit.ui.style import TableStyle
+
+
+def greet(name, io):
+    # The first names finish last
+    time.sleep(0.01 * (3 - int(name[-1])))
+
+    io.write_line("<info>Hello</info> {}".format(name))
+    io.error_line("Bye {}".format(name))
+
+    return int(name == "fail1")
+
+
+def test_map_in_submission_order(io):
+    runner = ParallelRunner(3)
+
+    assert 0 == runner.map(greet, ["name1", "name2", "name3"], io)
+    assert "Hello name1\nHello name2\nHello name3\n" == io.fetch_output()
+    assert "Bye name1\nBye name2\nBye name3\n" == io.fetch_error()
+
+
+def test_map_in_completion_order(io):
+    runner = ParallelRunner(3, ParallelRunner.COMPLETION_ORDER)
+
+    assert 0 == runner.map(greet, ["name1", "name2", "name3"], io)
+    assert (
+        "[name3] Hello name3\n[name2] Hello name2\n[name1] Hello name1\n"
+        == io.fetch_output()
+    )
+    assert "[name3] Bye name3\n[name2] Bye name2\n[name1] Bye name1\n" == (
+        io.fetch_error()
+    )
+
+
+def test_map_formats_the_output_with_the_io(ansi_io):
+    ParallelRunner().map(greet, ["name1"], ansi_io)
+
+    assert "\033[32mHello\033[0m name1\n" == ansi_io.fetch_output()
+
+
+def test_map_returns_the_highest_status_code(io):
+    def task(value, io):
+        return value
+
+    assert 255 == ParallelRunner().map(task, [0, 3, 1000, None, -1], io)
+
+
+def test_map_renders_exceptions(io):
+    def task(value, io):
+        if value == 2:
+            raise RuntimeError("Failed")
+
+        io.write_line(str(value))
+
+    assert 1 == ParallelRunner().map(task, [1, 2, 3], io)
+
+    output = io.fetch_output()
+    assert output.startswith("1\n")
+    assert "RuntimeError" in output
+    assert "Failed" in output
+    assert output.endswith("\n3\n")
+
+
+def test_map_limits_the_concurrency(io):
+    lock = threading.Lock()
+    running = []
+    maximum = []
+
+    def task(value, io):
+        with lock:
+            running.append(value)
+            maximum.append(len(running))
+
+        time.sleep(0.005)
+
+        with lock:
+            running.remove(value)
+
+    ParallelRunner(2).map(task, range(10), io)
+
+    assert 2 == max(maximum)
+
+
+def test_map_fails_fast(io):
+    started = []
+
+    def task(value, io):
+        started.append(value)
+        io.write_line(str(value))
+
+        return int(value == 1)
+
+    assert 1 == ParallelRunner(1, fail_fast=True).map(task, range(10), io)
+    assert started == [0, 1]
+    assert "0\n1\n" == io.fetch_output()
+
+
+def test_map_with_processes(io):
+    runner = ParallelRunner(2, processes=True)
+
+    assert 1 == runner.map(greet, ["name1", "fail1", "name3"], io)
+    assert "Hello name1\nHello fail1\nHello name3\n" == io.fetch_output()
+
+
+def test_map_keeps_the_verbosity(io):
+    def task(value, io):
+        io.write_line("normal")
+        io.write_line("verbose", VERBOSE)
+
+    io.set_verbosity(VERBOSE)
+    ParallelRunner().map(task, [1], io)
+
+    assert "normal\nverbose\n" == io.fetch_output()
+
+    io.clear_output()
+    io.set_quiet(True)
+    ParallelRunner().map(task, [1], io)
+
+    assert "" == io.fetch_output()
+
+
+def test_run_commands(io):
+    config = DefaultApplicationConfig("app")
+
+    def deploy(args, io):
+        io.write_line("Deployed {}".format(args.argument("host")))
+
+        return 2 if args.argument("host") == "host2" else 0
+
+    with config.command("deploy") as c:
+        c.add_argument("host", Argument.REQUIRED)
+        c.set_handler(CallbackHandler(deploy))
+
+    app = ConsoleApplication(config)
+    resolved_commands = [
+        app.resolve_command(StringArgs("deploy host{}".format(i))) for i in range(3)
+    ]
+    runner = ParallelRunner(order=ParallelRunner.COMPLETION_ORDER)
+
+    assert 2 == runner.run_commands(resolved_commands, io)
+    assert sorted(
+        [
+            "[deploy host0] Deployed host0",
+            "[deploy host1] Deployed host1",
+            "[deploy host2] Deployed host2",
+        ]
+    ) == sorted(io.fetch_output().splitlines())
+
+
+def test_run_commands_fails_with_processes(io):
+    with pytest.raises(ValueError):
+        ParallelRunner(processes=True).run_commands([], io)
+
+
+def test_map_aligns_the_tables_of_the_tasks(ansi_io):
+    def task(value, io):
+        table = Table(TableStyle.borderless())
+        table.add_row(["<info>{}</info>".format(value), "b"])
+        table.add_row(["aaaaa", "b"])
+        table.render(io)
+
+    ParallelRunner().map(task, ["a"], ansi_io)
+
+    assert ("\033[32ma\033[0m     b\naaaaa b\n") == ansi_io.fetch_output()
+
+
+def test_map_aligns_the_tables_of_the_tasks_without_ansi(io):
+    def task(value, io):
+        table = Table(TableStyle.borderless())
+        table.add_row(["<info>{}</info>".format(value), "b"])
+        table.add_row(["aaaaa", "b"])
+        table.render(io)
+
+    ParallelRunner().map(task, ["a"], io)
+
+    assert "a     b\naaaaa b\n" == io.fetch_output()
@@ -0,0 +1,44 @@
+import asyncio
+
+from clikit.args import StringArgs
+from clikit.config.default_application_config import DefaultApplicationConfig
+from clikit.console_application import ConsoleApplication
+from clikit.parallel import ParallelRunner
+
+
+class Handler(object):
+    def __init__(self):
+        self.loops = []
+
+    async def handle(self, args, io, command):
+        await asyncio.sleep(0.01)
+
+        self.loops.append(asyncio.get_event_loop())
+        io.write_line("Deployed {}".format(args.argument("host")))
+
+        return 0
+
+
+def test_run_commands_with_coroutine_handlers(io):
+    handler = Handler()
+    config = DefaultApplicationConfig("app")
+
+    with config.command("deploy") as c:
+        c.add_argument("host")
+        c.set_handler(handler)
+
+    app = ConsoleApplication(config)
+    loop = app.event_loop
+    resolved_commands = [
+        app.resolve_command(StringArgs("deploy host{}".format(i))) for i in range(4)
+    ]
+
+    assert 0 == ParallelRunner(4).run_commands(resolved_commands, io)
+    assert (
+        "Deployed host0\nDeployed host1\nDeployed host2\nDeployed host3\n"
+        == io.fetch_output()
+    )
+    assert loop not in handler.loops
+    assert not loop.is_running()
+
+    loop.close()
@@ -0,0 +1,147 @@
+import pytest
+
+from clikit import ConsoleApplication
+from clikit.api.args.format import Argument
+from clikit.api.args.format import Option
+from clikit.api.config import ApplicationConfig
+from clikit.api.resolver.exceptions import CannotResolveCommandException
+from clikit.args import StringArgs
+from clikit.resolver import CachedResolver
+from clikit.resolver.help_resolver import HelpResolver
+
+
+@pytest.fixture()
+def config():
+    config = ApplicationConfig()
+    config.set_catch_exceptions(False)
+    config.set_terminate_after_run(False)
+
+    server = config.create_command("server")
+    add = server.create_sub_command("add")
+    add.add_argument("host", Argument.REQUIRED)
+    add.add_option("port", "p", Option.REQUIRED_VALUE | Option.INTEGER)
+    add.add_option("tag", "t", Option.REQUIRED_VALUE | Option.MULTI_VALUED)
+
+    return config
+
+
+def test_resolve_from_cache(config):
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+
+    args = StringArgs("server add localhost -p 80 -t foo")
+    resolved = resolver.resolve(args, app)
+
+    assert "add" == resolved.command.name
+    assert "localhost" == resolved.args.argument("host")
+    assert 80 == resolved.args.option("port")
+    assert 0 == resolver.hits
+    assert 1 == resolver.misses
+
+    args = StringArgs("server add localhost -p 80 -t foo")
+    cached = resolver.resolve(args, app)
+
+    assert resolved.command is cached.command
+    assert args is cached.args.raw_args
+    assert {"host": "localhost"} == cached.args.arguments(False)
+    assert {"port": 80, "tag": ["foo"]} == cached.args.options(False)
+    assert 1 == resolver.hits
+    assert 1 == resolver.misses
+
+
+def test_cached_args_are_copied(config):
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+
+    args = resolver.resolve(StringArgs("server add localhost -t foo"), app).args
+    args.set_argument("host", "example.com")
+    args.option("tag").append("bar")
+
+    args = resolver.resolve(StringArgs("server add localhost -t foo"), app).args
+
+    assert "localhost" == args.argument("host")
+    assert ["foo"] == args.option("tag")
+
+
+def test_cache_is_bounded(config):
+    resolver = CachedResolver(max_size=2)
+    app = ConsoleApplication(config)
+
+    resolver.resolve(StringArgs("server add foo"), app)
+    resolver.resolve(StringArgs("server add bar"), app)
+    resolver.resolve(StringArgs("server add foo"), app)
+    resolver.resolve(StringArgs("server add baz"), app)
+
+    assert 2 == len(resolver)
+    assert 1 == resolver.hits
+
+    # "bar" was the least recently used
+    resolver.resolve(StringArgs("server add bar"), app)
+
+    assert 1 == resolver.hits
+    assert 4 == resolver.misses
+
+
+def test_adding_commands_invalidates_the_cache(config):
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+
+    resolver.resolve(StringArgs("server add foo"), app)
+
+    command_config = ApplicationConfig().create_command("list")
+    app.add_command(command_config)
+    resolver.resolve(StringArgs("server add foo"), app)
+
+    assert 0 == resolver.hits
+    assert 2 == resolver.misses
+
+
+def test_other_collections_do_not_invalidate_the_cache(config):
+    config.enable_lazy_command_loading()
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+    other = ConsoleApplication(ApplicationConfig())
+
+    resolver.resolve(StringArgs("server add foo"), app)
+    other.add_command(ApplicationConfig().create_command("list"))
+    resolver.resolve(StringArgs("server add foo"), app)
+
+    assert 1 == resolver.hits
+
+
+def test_results_are_cached_per_application(config):
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+    other = ConsoleApplication(config)
+
+    resolved = resolver.resolve(StringArgs("server add foo"), app)
+    other_resolved = resolver.resolve(StringArgs("server add foo"), other)
+
+    assert resolved.command is not other_resolved.command
+    assert other is other_resolved.command.application
+
+
+def test_failures_are_not_cached(config):
+    resolver = CachedResolver()
+    app = ConsoleApplication(config)
+
+    for _ in range(2):
+        with pytest.raises(CannotResolveCommandException):
+            resolver.resolve(StringArgs("foo"), app)
+
+    assert 0 == len(resolver)
+    assert 2 == resolver.misses
+
+
+def test_hits_leave_the_args_untouched(config):
+    resolver = CachedResolver(HelpResolver())
+    app = ConsoleApplication(config)
+    resolver.resolve(StringArgs("help server add foo"), app)
+
+    args = StringArgs("help server add foo")
+    resolved = resolver.resolve(args, app)
+
+    assert "add" == resolved.command.name
+    assert args is resolved.args.raw_args
+    assert ["help", "server", "add", "foo"] == args.tokens
+    assert 1 == resolver.hits
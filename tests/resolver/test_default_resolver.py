@@ -0,0 +1,87 @@
+import pytest
+
+from clikit import ConsoleApplication
+from clikit.api.args.format import Argument
+from clikit.api.config import ApplicationConfig
+from clikit.api.resolver.exceptions import CannotResolveCommandException
+from clikit.args import DefaultArgsParser
+from clikit.args import StringArgs
+from clikit.resolver import DefaultResolver
+
+
+@pytest.fixture()
+def config():
+    config = ApplicationConfig()
+    config.set_catch_exceptions(False)
+    config.set_terminate_after_run(False)
+
+    server = config.create_command("server")
+    server.create_sub_command("add").add_argument("host")
+    server.create_sub_command("remove").add_alias("delete")
+    config.create_command("deploy").add_argument("target")
+    config.create_command("depend")
+
+    return config
+
+
+def test_abbreviations_are_disabled_by_default(config):
+    app = ConsoleApplication(config)
+
+    with pytest.raises(CannotResolveCommandException):
+        DefaultResolver().resolve(StringArgs("ser add"), app)
+
+
+def test_resolve_abbreviations(config):
+    config.enable_command_abbreviations()
+    app = ConsoleApplication(config)
+
+    args = StringArgs("ser a localhost")
+    resolved = DefaultResolver().resolve(args, app)
+
+    assert "add" == resolved.command.name
+    assert "localhost" == resolved.args.argument("host")
+    assert ["server", "add", "localhost"] == resolved.args.raw_args.tokens
+    assert "server add localhost" == resolved.args.raw_args.to_string()
+    assert ["ser", "a", "localhost"] == args.tokens
+
+    resolved = DefaultResolver().resolve(StringArgs("deplo prod"), app)
+
+    assert "deploy" == resolved.command.name
+    assert "prod" == resolved.args.argument("target")
+
+    resolved = DefaultResolver().resolve(StringArgs("server del"), app)
+
+    assert "remove" == resolved.command.name
+
+
+def test_ambiguous_abbreviations(config):
+    config.enable_command_abbreviations()
+    app = ConsoleApplication(config)
+
+    with pytest.raises(CannotResolveCommandException) as e:
+        DefaultResolver().resolve(StringArgs("dep prod"), app)
+
+    assert (
+        'The command "dep" is ambiguous.\n'
+        "\n"
+        "Did you mean one of these?\n"
+        "    depend\n"
+        "    deploy"
+    ) == str(e.value)
+
+
+def test_default_commands_are_selected_without_trial_parsing(config, mocker):
+    server = config.create_command("serve")
+    one = server.create_sub_command("one").default()
+    one.add_argument("a", Argument.REQUIRED)
+    two = server.create_sub_command("two").default()
+    two.add_argument("a", Argument.REQUIRED)
+    two.add_argument("b", Argument.REQUIRED)
+    app = ConsoleApplication(config)
+
+    parse = mocker.spy(DefaultArgsParser, "parse")
+    resolved = DefaultResolver().resolve(StringArgs("serve foo bar"), app)
+
+    assert "two" == resolved.command.name
+    assert "bar" == resolved.args.argument("b")
+    assert 1 == parse.call_count
@@ -0,0 +1,152 @@
+import gc
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+import clikit
+
+from clikit.server import ApplicationClient
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX") or sys.version_info < (3, 3),
+    reason="The application server requires Python 3.3+ on a Unix platform",
+)
+
+SERVER_SCRIPT = """
+import gc
+import os
+import sys
+
+from clikit import ConsoleApplication
+from clikit import DefaultApplicationConfig
+from clikit.api.args.format import Option
+from clikit.server import ApplicationServer
+
+
+class Handler(object):
+    def handle(self, args, io, command):
+        io.write_line(
+            "{} {} {}".format(args.argument("name"), os.getcwd(), os.environ["FOO"])
+        )
+        io.error_line("to stderr")
+
+        return int(args.option("status") or 0)
+
+
+config = DefaultApplicationConfig("app", "1.0")
+config.enable_batch_mode()
+with config.command("greet") as c:
+    c.add_argument("name")
+    c.add_option("status", "s", Option.REQUIRED_VALUE)
+    c.set_handler(Handler)
+
+ApplicationServer(ConsoleApplication(config), sys.argv[1]).serve_forever(
+    max_requests=int(sys.argv[2])
+)
+"""
+
+
+@pytest.fixture()
+def server(tmpdir):
+    socket_path = str(tmpdir.join("app.sock"))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(clikit.__file__))
+
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER_SCRIPT, socket_path, "2"], env=env
+    )
+
+    for _ in range(100):
+        if os.path.exists(socket_path):
+            break
+
+        time.sleep(0.05)
+
+    yield socket_path
+
+    process.wait(10)
+
+
+def test_run_commands_on_the_server(server, tmpdir, environ):
+    environ["FOO"] = "bar"
+    output = tmpdir.join("output")
+    error = tmpdir.join("error")
+    cwd = os.getcwd()
+    os.chdir(str(tmpdir))
+
+    try:
+        client = ApplicationClient(server)
+
+        with output.open("w") as out, error.open("w") as err:
+            assert 0 == client.run(["app", "greet", "John"], stdout=out, stderr=err)
+
+        with output.open("w") as out, error.open("w") as err:
+            assert 3 == client.run(
+                ["app", "greet", "Jane", "--status", "3"], stdout=out, stderr=err
+            )
+    finally:
+        os.chdir(cwd)
+
+    assert "Jane {} bar\n".format(str(tmpdir)) == output.read()
+    assert "to stderr\n" == error.read()
+
+
+def test_run_batch_files_on_the_server(server, tmpdir, environ):
+    environ["FOO"] = "bar"
+    batch = tmpdir.join("batch.txt")
+    batch.write("greet John\ngreet Jane --status 3\n")
+    output = tmpdir.join("output")
+    error = tmpdir.join("error")
+    cwd = os.getcwd()
+    os.chdir(str(tmpdir))
+
+    try:
+        client = ApplicationClient(server)
+
+        with output.open("w") as out, error.open("w") as err:
+            assert 3 == client.run(
+                ["app", "--batch", str(batch)], stdout=out, stderr=err
+            )
+
+        with output.open("a") as out, error.open("a") as err:
+            assert 0 == client.run(["app", "greet", "Jim"], stdout=out, stderr=err)
+    finally:
+        os.chdir(cwd)
+
+    assert (
+        "John {0} bar\nJane {0} bar\nJim {0} bar\n".format(str(tmpdir)) == output.read()
+    )
+
+
+def test_socket_path_accepts_connections_once_it_exists(tmpdir):
+    from clikit import ConsoleApplication
+    from clikit import DefaultApplicationConfig
+    from clikit.server import ApplicationServer
+
+    socket_path = str(tmpdir.join("app.sock"))
+    tmpdir.join("app.sock").write("stale")
+    config = DefaultApplicationConfig("app")
+    config.set_terminate_after_run(False)
+    server = ApplicationServer(ConsoleApplication(config), socket_path)
+
+    server.bind()
+    try:
+        assert [tmpdir.join("app.sock")] == tmpdir.listdir()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+        finally:
+            sock.close()
+    finally:
+        server.close()
+
+        if hasattr(gc, "unfreeze"):
+            gc.unfreeze()
+
+    assert [] == tmpdir.listdir()
@@ -0,0 +1,89 @@
+import pytest
+
+from clikit.api.args.format import Argument
+from clikit.args import StringArgs
+from clikit.config.default_application_config import DefaultApplicationConfig
+from clikit.console_application import ConsoleApplication
+from clikit.handler.callback_handler import CallbackHandler
+from clikit.handler.shell_handler import ShellHandler
+from clikit.shell import Shell
+
+
+@pytest.fixture()
+def app():
+    config = DefaultApplicationConfig("app")
+    config.set_terminate_after_run(False)
+
+    def greet(args, io):
+        io.write_line("Hello " + args.argument("name"))
+
+        return int(args.argument("name") == "nobody")
+
+    with config.command("greet") as c:
+        c.set_description("Greet someone")
+        c.add_argument("name", Argument.REQUIRED)
+        c.add_option("yell", "y")
+        c.set_handler(CallbackHandler(greet))
+
+    with config.command("shell") as c:
+        c.set_handler(ShellHandler("> "))
+
+    return ConsoleApplication(config)
+
+
+def test_run(app, io):
+    io.set_input("greet foo\n\ngreet nobody\ngreet bar\nexit\ngreet baz\n")
+
+    assert 0 == Shell(app, "> ").run(io)
+    assert "> Hello foo\n> > Hello nobody\n> Hello bar\n> " == io.fetch_output()
+
+
+def test_run_until_the_end_of_the_input(app, io):
+    io.set_input("greet foo\ngreet bar")
+
+    assert 0 == Shell(app, "> ").run(io)
+    assert "> Hello foo\n> Hello bar\n> " == io.fetch_output()
+
+
+def test_run_renders_errors_and_continues(app, io):
+    io.set_input("greet\ngreet foo\n")
+
+    Shell(app, "> ").run(io)
+
+    assert (
+        '> Not enough arguments (missing: "name").\n> Hello foo\n> '
+        == io.fetch_output()
+    )
+
+
+def test_default_prompt(app, io):
+    io.set_input("quit\n")
+
+    Shell(app).run(io)
+
+    assert "app> " == io.fetch_output()
+
+
+def test_complete(app):
+    shell = Shell(app)
+
+    assert ["greet"] == shell.complete("gr")
+    assert ["--yell"] == shell.complete("greet --y")
+    assert ["greet", "help", "shell"] == shell.complete("")
+
+
+def test_complete_without_the_providers_which_cannot_be_imported(app):
+    app.config.get_command_config("greet").set_completion_provider(
+        "name", lambda words: ["foo"]
+    )
+    shell = Shell(app)
+
+    assert ["--yell"] == shell.complete("greet --y")
+    assert [] == shell.complete("greet f")
+
+
+def test_shell_handler(app, io):
+    io.set_input("greet foo\n")
+
+    assert 0 == app.run(StringArgs("shell"), io.input.stream, io.output.stream)
+    assert "> Hello foo\n> " == io.fetch_output()
@@ -3,18 +3,24 @@ from typing import Generator
 import pytest
 
 from clikit import ConsoleApplication
+from clikit.api.args.format import Argument
+from clikit.api.command import Command
+from clikit.api.command import LazyCommand
 from clikit.api.command.exceptions import CannotAddCommandException
 from clikit.api.command.exceptions import NoSuchCommandException
 from clikit.api.config import ApplicationConfig as BaseApplicationConfig
 from clikit.api.config import CommandConfig
+from clikit.api.event import PRE_RESOLVE
 from clikit.api.io import IO
 from clikit.api.io import Input
 from clikit.api.io import Output
+from clikit.api.resolver.exceptions import CannotResolveCommandException
 from clikit.args import StringArgs
 from clikit.handler.callback_handler import CallbackHandler
 from clikit.io.input_stream import StringInputStream
 from clikit.io.output_stream import BufferedOutputStream
 from clikit.resolver import DefaultResolver
+from clikit.utils._compat import PY36
 
 
 class ApplicationConfig(BaseApplicationConfig):
@@ -280,3 +286,231 @@ def test_run_with_keyboard_interrupt(config):  # type: (ApplicationConfig) -> No
 
     assert "" == output.fetch()
     assert "" == error_output.fetch()
+
+
+def test_lazy_command_loading_defers_building_commands(config):
+    config.enable_lazy_command_loading()
+    config.create_command("command1").create_sub_command("sub")
+    config.create_command("command2").add_alias("alias2")
+
+    app = ConsoleApplication(config)
+
+    assert "command1" in app.commands
+    assert "alias2" in app.commands
+    assert ["command1", "command2"] == app.commands.get_names()
+    assert all(isinstance(c, LazyCommand) for c in app.commands._commands.values())
+
+    command = app.get_command("alias2")
+
+    assert isinstance(command, Command)
+    assert "command2" == command.name
+    assert command is app.named_commands.get("command2")
+    assert isinstance(app.commands._commands["command1"], LazyCommand)
+
+
+def test_lazy_command_loading_builds_sub_commands_on_resolve(config):
+    def callback(args, io):
+        io.write(args.argument("arg"))
+
+        return 0
+
+    config.enable_lazy_command_loading()
+    server = config.create_command("server")
+    server.create_sub_command("add").add_argument("arg").set_handler(
+        CallbackHandler(callback)
+    )
+    server.create_sub_command("remove")
+
+    app = ConsoleApplication(config)
+    output = BufferedOutputStream()
+
+    assert 0 == app.run(
+        StringArgs("server add foo"), StringInputStream(""), output, output
+    )
+    assert "foo" == output.fetch()
+
+    server = app.get_command("server")
+    assert server.sub_commands._commands["add"].is_loaded()
+    assert not server.sub_commands._commands["remove"].is_loaded()
+
+
+def test_response_files(config, mocker, tmpdir):
+    def callback(args, io):
+        io.write(",".join(args.argument("paths")))
+
+        return 0
+
+    path = tmpdir.join("paths.txt")
+    path.write("bar\nbaz\n")
+    mocker.patch("sys.argv", ["console", "add", "foo", "@" + str(path)])
+
+    config.enable_response_files()
+    config.create_command("add").add_argument(
+        "paths", Argument.MULTI_VALUED
+    ).set_handler(CallbackHandler(callback))
+
+    app = ConsoleApplication(config)
+    output = BufferedOutputStream()
+
+    assert 0 == app.run(None, StringInputStream(""), output, output)
+    assert "foo,bar,baz" == output.fetch()
+
+
+def create_batch_application(config):  # type: (ApplicationConfig) -> ConsoleApplication
+    def callback(args, io):
+        io.write(args.argument("word") + "|")
+
+        return int(args.argument("word") == "fail")
+
+    config.create_command("echo").add_argument("word", Argument.REQUIRED).set_handler(
+        CallbackHandler(callback)
+    )
+
+    return ConsoleApplication(config)
+
+
+def test_run_batch(config):
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    status_codes = app.run_batch(
+        ["echo foo", "", "# comment", "echo fail", "  echo 'bar baz'  "],
+        StringInputStream(""),
+        output,
+        output,
+    )
+
+    assert [0, 1, 0] == status_codes
+    assert "foo|fail|bar baz|" == output.fetch()
+
+
+def test_run_batch_stops_on_failure(config):
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    status_codes = app.run_batch(
+        ["echo foo", "echo fail", "echo bar"],
+        StringInputStream(""),
+        output,
+        output,
+        stop_on_failure=True,
+    )
+
+    assert [0, 1] == status_codes
+    assert "foo|fail|" == output.fetch()
+
+
+def test_run_batch_does_not_terminate_between_lines(config):
+    config.set_catch_exceptions(True)
+    config.set_terminate_after_run(True)
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    status_codes = app.run_batch(
+        ["echo", "echo foo"], StringInputStream(""), output, output
+    )
+
+    assert [1, 0] == status_codes
+    assert output.fetch().endswith("foo|")
+
+
+def test_run_batch_stops_on_keyboard_interrupt(config):
+    def interrupt(event, event_name, dispatcher):
+        if event.raw_args.tokens == ["interrupt"]:
+            raise KeyboardInterrupt()
+
+    config.add_event_listener(PRE_RESOLVE, interrupt)
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    status_codes = app.run_batch(
+        ["echo foo", "interrupt", "echo bar"], StringInputStream(""), output, output
+    )
+
+    assert [0, 1] == status_codes
+    assert "foo|" == output.fetch()
+
+
+@pytest.mark.parametrize(
+    "tokens,status_code,expected",
+    [
+        (["--batch"], 1, "foo|fail|bar|"),
+        (["--batch", "--stop-on-failure"], 1, "foo|fail|"),
+    ],
+)
+def test_run_batch_file(config, mocker, tmpdir, tokens, status_code, expected):
+    path = tmpdir.join("batch.txt")
+    path.write("echo foo\necho fail\necho bar\n")
+    mocker.patch("sys.argv", ["console"] + tokens + [str(path)])
+
+    config.enable_batch_mode()
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    assert status_code == app.run(None, StringInputStream(""), output, output)
+    assert expected == output.fetch()
+
+
+def test_run_batch_from_stdin(config, mocker):
+    mocker.patch("sys.stdin", ["echo foo\n", "echo bar\n"])
+    mocker.patch("sys.argv", ["console", "--batch", "-"])
+
+    config.enable_batch_mode()
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    assert 0 == app.run(None, StringInputStream(""), output, output)
+    assert "foo|bar|" == output.fetch()
+
+
+def test_batch_mode_is_disabled_by_default(config, mocker):
+    mocker.patch("sys.argv", ["console", "--batch", "-"])
+
+    app = create_batch_application(config)
+    output = BufferedOutputStream()
+
+    with pytest.raises(CannotResolveCommandException):
+        app.run(None, StringInputStream(""), output, output)
+
+
+@pytest.mark.skipif(not PY36, reason="Solutions require Python 3.6+")
+def test_solution_providers_are_loaded_when_rendering_exceptions(config):
+    from crashtest.contracts.base_solution import BaseSolution
+    from crashtest.contracts.has_solutions_for_exception import HasSolutionsForException
+
+    class SolutionProvider(HasSolutionsForException):
+        def can_solve(self, exception):
+            return isinstance(exception, RuntimeError)
+
+        def get_solutions(self, exception):
+            return [BaseSolution("Solution Title.", "Solution Description")]
+
+    factory_calls = []
+
+    def factory():
+        factory_calls.append(True)
+
+        return SolutionProvider
+
+    def callback(args, io):
+        if args.argument("fail"):
+            raise RuntimeError("Failure")
+
+        return 0
+
+    config.set_catch_exceptions(True)
+    config.add_solution_provider(factory)
+    config.create_command("run").add_argument("fail").set_handler(
+        CallbackHandler(callback)
+    )
+
+    app = ConsoleApplication(config)
+    output = BufferedOutputStream()
+
+    assert 0 == app.run(StringArgs("run"), StringInputStream(""), output, output)
+    assert config._solution_provider_repository is None
+    assert [] == factory_calls
+
+    assert 1 == app.run(StringArgs("run 1"), StringInputStream(""), output, output)
+    assert [True] == factory_calls
+    assert "Solution Title</>: Solution Description" in output.fetch()
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import clikit
+
+from clikit.utils._compat import PY37
+
+
+# Maximum number of clikit modules imported to boot an application
+MODULE_BUDGET = 110
+
+# Modules that are only needed to render errors, help or UI components
+DEFERRED_MODULES = [
+    "ast",
+    "tokenize",
+    "pylev",
+    "json",
+    "crashtest",
+    "clikit.ui.components.exception_trace",
+    "clikit.ui.components.progress_bar",
+    "clikit.ui.components.table",
+    "clikit.ui.help.application_help",
+    "clikit.config.command_tree_cache",
+]
+
+BOOT_SCRIPT = """
+from clikit import ConsoleApplication
+from clikit import DefaultApplicationConfig
+
+config = DefaultApplicationConfig("app", "1.0")
+config.set_terminate_after_run(False)
+config.create_command("foo").set_handler(lambda: Handler())
+
+
+class Handler(object):
+    def handle(self, args, io, command):
+        return 0
+
+
+from clikit.args import StringArgs
+from clikit.io.output_stream import NullOutputStream
+
+ConsoleApplication(config).run(
+    StringArgs("foo"), output_stream=NullOutputStream(), error_stream=NullOutputStream()
+)
+"""
+
+
+def imported_modules(script):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(clikit.__file__)), env.get("PYTHONPATH", "")]
+    )
+
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    _, err = process.communicate()
+    assert 0 == process.returncode, err.decode()
+
+    modules = []
+    for line in err.decode().splitlines():
+        if not line.startswith("import time:") or line.endswith("| package"):
+            continue
+
+        modules.append(line.rsplit("|", 1)[-1].strip())
+
+    return modules
+
+
+@pytest.mark.skipif(not PY37, reason="Lazy imports require Python 3.7+")
+def test_boot_import_budget():
+    modules = imported_modules(BOOT_SCRIPT)
+    clikit_modules = [m for m in modules if m.split(".")[0] == "clikit"]
+
+    assert len(clikit_modules) <= MODULE_BUDGET
+    assert [] == [m for m in DEFERRED_MODULES if m in modules]
+
+
+def test_lazy_attributes_are_importable():
+    from clikit import ConsoleApplication
+    from clikit.ui.components import ExceptionTrace
+    from clikit.ui.components import Table
+
+    assert "ConsoleApplication" in dir(clikit)
+    assert ConsoleApplication is clikit.ConsoleApplication
+    assert ExceptionTrace.__name__ == "ExceptionTrace"
+    assert Table.__name__ == "Table"
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        clikit.Foo
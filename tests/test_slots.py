@@ -0,0 +1,71 @@
+import weakref
+
+import pytest
+
+from clikit.api.args import Args
+from clikit.api.args.format import ArgsFormat
+from clikit.api.args.format import ArgsFormatBuilder
+from clikit.api.args.format import Argument
+from clikit.api.args.format import CommandName
+from clikit.api.args.format import CommandOption
+from clikit.api.args.format import Option
+from clikit.api.command import Command
+from clikit.api.command import CommandCollection
+from clikit.api.config import CommandConfig
+from clikit.api.event import ConfigEvent
+from clikit.api.event import Event
+from clikit.api.event import PreHandleEvent
+from clikit.api.event import PreResolveEvent
+from clikit.api.formatter import Style
+from clikit.api.resolver import ResolvedCommand
+from clikit.args import StringArgs
+from clikit.resolver.resolve_result import ResolveResult
+
+
+def create_objects():
+    fmt = ArgsFormat([Option("option"), Argument("argument")])
+    args = Args(fmt)
+    command = Command(CommandConfig("command"))
+
+    return [
+        fmt,
+        fmt.compiled,
+        ArgsFormatBuilder(),
+        Argument("argument"),
+        Option("option"),
+        CommandOption("command-option"),
+        CommandName("command"),
+        Style("tag"),
+        args,
+        command,
+        CommandCollection(),
+        ResolvedCommand(command, args),
+        ResolveResult(command, StringArgs("")),
+        Event(),
+        ConfigEvent(None),
+        PreHandleEvent(args, None, command),
+        PreResolveEvent(StringArgs(""), None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "obj", create_objects(), ids=lambda obj: obj.__class__.__name__
+)
+def test_numerous_objects_have_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
+
+
+def test_formats_can_be_weakly_referenced():
+    fmt = ArgsFormat()
+
+    assert weakref.ref(fmt)() is fmt
+
+
+def test_subclasses_can_add_attributes():
+    class CustomOption(Option):
+        pass
+
+    option = CustomOption("option")
+    option.custom = True
+
+    assert option.custom
@@ -0,0 +1,24 @@
+import pytest
+
+from clikit.utils._file import write_atomically
+
+
+def test_write_atomically(tmpdir):
+    path = tmpdir.join("cache", "index.json")
+
+    write_atomically(str(path), "foo")
+    write_atomically(str(path), "bar")
+
+    assert "bar" == path.read()
+    assert ["index.json"] == [p.basename for p in path.dirpath().listdir()]
+
+
+def test_write_atomically_keeps_the_previous_file_on_failure(tmpdir):
+    path = tmpdir.join("index.json")
+    path.write("foo")
+
+    with pytest.raises(TypeError):
+        write_atomically(str(path), None)
+
+    assert "foo" == path.read()
+    assert ["index.json"] == [p.basename for p in tmpdir.listdir()]
@@ -0,0 +1,18 @@
+from clikit.utils.suggestions import SuggestionIndex
+
+
+def test_suggest():
+    index = SuggestionIndex(["foobar", "bar", "barfoo", "fooo", "baz", "fo"])
+
+    assert ["fooo", "fo", "foobar", "barfoo"] == index.suggest("foo")
+    assert ["bar", "baz"] == index.suggest("bax")
+    assert [] == index.suggest("qux")
+
+
+def test_suggest_names_sharing_prefixes():
+    index = SuggestionIndex(
+        ["command{}".format(i) for i in range(1000)] + ["comment", "commands"]
+    )
+
+    assert ["command1", "command0", "command10"] == index.suggest("commnd1")[:3]
+    assert ["comment"] == index.suggest("commentt")